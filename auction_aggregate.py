@@ -0,0 +1,265 @@
+# 매물 목록을 한 번만 훑으면서 여러 가지 통계를 동시에 계산하는 도구예요
+# 지역별, 가격대별, 매물 종류별 통계와 전체 최저/최고/평균 가격을 따로따로 계산하면
+# 같은 목록을 여러 번 읽어야 하지만, 여기서는 매물 한 건을 읽을 때 모든 통계에 한꺼번에 더해요
+# 가격도 목록으로 모아두지 않고 개수/합계/최솟값/최댓값과 작은 백분위수 스케치만 계속 고쳐 적어요
+# 마치 장바구니를 한 번 훑으면서 품목별 개수와 총액을 동시에 적어 내려가는 것과 같아요!
+#
+# 사용법:
+#   results = aggregate_items(items, {'region': RegionSection(), 'price': PriceRangeSection()})
+#   results['region']  # 지역별 통계
+
+from price_sketch import SKETCH_CAPACITY, QuantileSketch
+
+# 대시보드 가격대 구간이에요 (이름, 이상, 미만)
+PRICE_RANGES = (
+    ('1억 미만', 0, 100000000),
+    ('1억~2억', 100000000, 200000000),
+    ('2억~3억', 200000000, 300000000),
+    ('3억~4억', 300000000, 400000000),
+    ('4억~5억', 400000000, 500000000),
+    ('5억~6억', 500000000, 600000000),
+    ('6억 이상', 600000000, float('inf'))
+)
+
+class PriceAccumulator:
+    """
+    가격을 목록으로 모으지 않고 개수, 합계, 최솟값, 최댓값은 정확히 기억하고
+    백분위수(p10/p50/p90)는 작은 스케치(price_sketch)로 기억하는 도우미
+    가격은 스케치 한 층 크기만큼 잠깐 모아뒀다가 한꺼번에 정리해요 (한 건마다 계산하는 것보다 훨씬 빨라요)
+    """
+    
+    __slots__ = ('_count', '_total', '_min_price', '_max_price', '_sketch', '_pending')
+    
+    def __init__(self):
+        self._count = 0
+        self._total = 0
+        # 첫 가격이 들어오면 바로 바뀌도록 무한대로 시작해요 (가격이 없으면 summary에서 0으로 바꿔요)
+        self._min_price = float('inf')
+        self._max_price = float('-inf')
+        self._sketch = QuantileSketch()
+        self._pending = []
+    
+    def add(self, price):
+        pending = self._pending
+        pending.append(price)
+        if len(pending) >= SKETCH_CAPACITY:
+            self._flush()
+    
+    def _flush(self):
+        # 모아둔 가격을 순서 그대로 스케치에 넣어요 (한 건씩 넣은 것과 결과가 똑같아요)
+        pending = self._pending
+        if not pending:
+            return
+        self._count += len(pending)
+        self._total += sum(pending)
+        self._min_price = min(self._min_price, min(pending))
+        self._max_price = max(self._max_price, max(pending))
+        self._sketch.update_many(pending)
+        pending.clear()
+    
+    @property
+    def count(self):
+        return self._count + len(self._pending)
+    
+    @property
+    def total(self):
+        self._flush()
+        return self._total
+    
+    @property
+    def min_price(self):
+        self._flush()
+        return self._min_price
+    
+    @property
+    def max_price(self):
+        self._flush()
+        return self._max_price
+    
+    @property
+    def sketch(self):
+        self._flush()
+        return self._sketch
+    
+    def merge(self, other):
+        """다른 도우미의 가격을 모두 더해요 (하루치를 모아 한 주치를 만들 때 써요)"""
+        self._flush()
+        if other.count:
+            self._count += other.count
+            self._total += other.total
+            self._min_price = min(self._min_price, other.min_price)
+            self._max_price = max(self._max_price, other.max_price)
+            self._sketch.merge(other.sketch)
+        return self
+    
+    def summary(self):
+        """{'avg_price', 'min_price', 'max_price', 'p10', 'p50', 'p90'} 사전을 돌려줘요 (가격이 없으면 모두 0)"""
+        self._flush()
+        if not self._count:
+            return {'avg_price': 0, 'min_price': 0, 'max_price': 0, **self._sketch.percentiles()}
+        return {
+            'avg_price': self._total // self._count,
+            'min_price': self._min_price,
+            'max_price': self._max_price,
+            **self._sketch.percentiles()
+        }
+
+class RegionSection:
+    """지역별(그리고 상세 지역별) 매물 수, 매물 종류, 가격 통계"""
+    
+    def __init__(self):
+        self.regions = {}
+    
+    def add(self, item):
+        region = item.get('region', '알 수 없음')
+        subregion = item.get('subregion', '상세지역없음')
+        minprice = item.get('minprice', 0)
+        
+        entry = self.regions.get(region)
+        if entry is None:
+            entry = self.regions[region] = {
+                'count': 0, 'property_types': {}, 'prices': PriceAccumulator(), 'subregions': {}
+            }
+        entry['count'] += 1
+        property_types = entry['property_types']
+        maemulinfo = item.get('maemulinfo', '알 수 없음')
+        property_types[maemulinfo] = property_types.get(maemulinfo, 0) + 1
+        if minprice > 0:
+            entry['prices'].add(minprice)
+        
+        if subregion and subregion != '상세지역없음':
+            sub_entry = entry['subregions'].get(subregion)
+            if sub_entry is None:
+                sub_entry = entry['subregions'][subregion] = {'count': 0, 'prices': PriceAccumulator()}
+            sub_entry['count'] += 1
+            if minprice > 0:
+                sub_entry['prices'].add(minprice)
+    
+    def result(self):
+        return {
+            region: {
+                'count': entry['count'],
+                'property_types': entry['property_types'],
+                **entry['prices'].summary(),
+                'subregions': {
+                    subregion: {'count': sub_entry['count'], **sub_entry['prices'].summary()}
+                    for subregion, sub_entry in entry['subregions'].items()
+                }
+            }
+            for region, entry in self.regions.items()
+        }
+
+class PriceRangeSection:
+    """가격대별 매물 수와 매물 목록"""
+    
+    def __init__(self, price_ranges=PRICE_RANGES):
+        self.ranges = {
+            name: {'min': low, 'max': high, 'count': 0, 'items': []}
+            for name, low, high in price_ranges
+        }
+        self.bounds = [(low, high, self.ranges[name]) for name, low, high in price_ranges]
+    
+    def add(self, item):
+        minprice = item.get('minprice', 0)
+        for low, high, range_info in self.bounds:
+            if low <= minprice < high:
+                range_info['count'] += 1
+                range_info['items'].append({
+                    'region': f"{item.get('region', '알 수 없음')} {item.get('subregion', '')}".strip(),
+                    'property_type': item.get('maemulinfo', '알 수 없음'),
+                    'price': minprice,
+                    'address': item.get('frontaddress', ''),
+                    'uid': item.get('uid', '')
+                })
+                break
+    
+    def result(self):
+        return self.ranges
+
+class PropertyTypeSection:
+    """매물 종류별 매물 수, 가격 통계, 지역 분포"""
+    
+    def __init__(self):
+        self.types = {}
+    
+    def add(self, item):
+        maemulinfo = item.get('maemulinfo', '알 수 없음')
+        minprice = item.get('minprice', 0)
+        
+        entry = self.types.get(maemulinfo)
+        if entry is None:
+            entry = self.types[maemulinfo] = {'count': 0, 'prices': PriceAccumulator(), 'regions': {}}
+        entry['count'] += 1
+        regions = entry['regions']
+        region = item.get('region', '알 수 없음')
+        regions[region] = regions.get(region, 0) + 1
+        if minprice > 0:
+            entry['prices'].add(minprice)
+    
+    def result(self):
+        return {
+            maemulinfo: {'count': entry['count'], **entry['prices'].summary(), 'regions': entry['regions']}
+            for maemulinfo, entry in self.types.items()
+        }
+
+class PriceSummarySection:
+    """전체 매물 수와 최저가(0보다 큰 것만)의 평균/최소/최대"""
+    
+    def __init__(self):
+        self.total_count = 0
+        self.prices = PriceAccumulator()
+    
+    def add(self, item):
+        self.total_count += 1
+        minprice = item.get('minprice', 0)
+        if minprice > 0:
+            self.prices.add(minprice)
+    
+    def result(self):
+        return {'total_count': self.total_count, **self.prices.summary()}
+
+class CountSection:
+    """key(매물)이 돌려주는 값마다 매물 수를 세요 (처음 나온 순서대로)"""
+    
+    def __init__(self, key):
+        self.key = key
+        self.counts = {}
+    
+    def add(self, item):
+        key = self.key(item)
+        self.counts[key] = self.counts.get(key, 0) + 1
+    
+    def result(self):
+        return self.counts
+
+class ItemListSection:
+    """transform(매물) 결과를 목록으로 모아요 (None을 돌려주면 빼요)"""
+    
+    def __init__(self, transform):
+        self.transform = transform
+        self.items = []
+    
+    def add(self, item):
+        value = self.transform(item)
+        if value is not None:
+            self.items.append(value)
+    
+    def result(self):
+        return self.items
+
+def aggregate_items(items, sections):
+    """
+    매물 목록을 한 번만 훑으면서 모든 통계 구역(section)에 더하는 함수
+    구역이 늘어나도 목록은 한 번만 읽어요
+    
+    매개변수 설명:
+    - items: 매물 목록 (한 번만 읽으니 제너레이터도 괜찮아요)
+    - sections: {이름: 구역} - 구역은 add(매물)와 result()가 있으면 돼요
+    
+    반환값: {이름: 구역의 result()}
+    """
+    adders = [section.add for section in sections.values()]
+    for item in items:
+        for add in adders:
+            add(item)
+    return {name: section.result() for name, section in sections.items()}
@@ -3,11 +3,75 @@
 # 마치 인터넷에서 상품 정보를 복사해서 메모장에 저장하는 것과 같아요!
 
 import requests  # 인터넷에서 정보를 가져오기 위한 도구상자
-import json      # JSON 형태의 데이터를 다루기 위한 도구상자
 import os        # 파일과 폴더를 다루기 위한 도구상자
+import threading # 여러 작업이 같은 도구를 안전하게 나눠 쓰기 위한 도구상자
+from concurrent.futures import ThreadPoolExecutor  # 여러 요청을 동시에 보내기 위한 도구상자
 from datetime import datetime  # 날짜와 시간을 다루기 위한 도구상자
+from requests.adapters import HTTPAdapter  # 연결을 재사용하기 위한 도구
+import response_cache  # 방금 받은 응답을 잠깐 보관해두는 캐시
+from auction_query import plan_auction_query, describe_plan  # 검색 조건을 API 조건으로 바꿔주는 도구
+from auction_filter import compile_auction_filter, filter_items  # 조건을 미리 컴파일해두는 필터 도구
+from auction_aggregate import CountSection, PriceSummarySection, aggregate_items  # 한 번에 여러 통계를 세는 도구
+from resilient_http import resilient_get  # 속도 조절과 재시도를 해주는 요청 도구
+from json_stream import load_json_document, iter_decoded_chunks, load_snapshot  # JSON을 조금씩 읽는 도구
+from snapshot_store import write_snapshot  # 같은 매물을 한 번만 저장하는 스냅샷 저장소
+from snapshot_files import is_snapshot_file, snapshot_stem  # 압축된 스냅샷 파일 이름 다루기
+from columnar_history import record_snapshot  # 트렌드 분석용 열 저장소
+from snapshot_catalog import record_saved_snapshot  # 스냅샷 목록표(SQLite)
 
-def get_auction_data_by_region(region_code, region_name, page=1, limit=100):
+# 동시에 보낼 수 있는 최대 요청 수예요 (환경 변수 AUCTION_MAX_IN_FLIGHT로 바꿀 수 있어요)
+# 초당 요청 수는 resilient_http의 AUCTION_RATE_PER_SECOND(기본 5개)가 따로 막아서, 그 값을 함께 올리지 않으면 동시 요청을 늘려도 별로 빨라지지 않아요
+DEFAULT_MAX_IN_FLIGHT = int(os.getenv('AUCTION_MAX_IN_FLIGHT', '4'))
+
+# 경매 API 주소예요 (환경 변수 AUCTION_API_URL로 바꾸면 로컬 모의 서버로도 요청할 수 있어요)
+AUCTION_API_URL = os.getenv('AUCTION_API_URL', 'https://map.auctionmsg.com/server/api/')
+
+# 사용자가 원하는 검색 조건이에요
+TARGET_REGIONS = ['서울시', '경기도']  # 원하는 지역
+TARGET_PROPERTY_TYPES = ['아파트', '오피스텔', '단독주택', '다가구주택']  # 원하는 매물 종류
+MAX_PRICE = 600000000  # 6억원
+
+# 변경분 수집(delta) 때 "최근 수정순"으로 정렬해 주는 정렬 방식이에요
+# 이 정렬일 때만 "바뀐 게 없는 페이지"가 나오면 뒤쪽 페이지를 건너뛸 수 있어요
+# (환경 변수 AUCTION_DELTA_ORDER로 API의 정렬 값을 지정해요, 비어 있으면 전체를 다 가져와요)
+DELTA_ORDER = os.getenv('AUCTION_DELTA_ORDER', '')
+
+# 모든 요청이 함께 쓰는 HTTP 세션이에요
+# 한 번 연결한 전화선을 끊지 않고 계속 쓰는 것처럼 연결을 재사용해요
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session(pool_size=DEFAULT_MAX_IN_FLIGHT):
+    """
+    여러 요청이 함께 쓰는 HTTP 세션을 돌려주는 함수
+    
+    매개변수 설명:
+    - pool_size: 동시에 유지할 연결 개수 (처음 세션을 만들 때만 사용돼요)
+    
+    반환값: keep-alive 연결과 gzip 압축을 사용하는 requests.Session
+    """
+    global _http_session
+    
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            
+            # 동시에 보내는 요청 수만큼 연결을 열어두고 재사용해요
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            # 압축된 응답을 받아서 전송량을 줄여요
+            session.headers.update({
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive'
+            })
+            _http_session = session
+        
+        return _http_session
+
+def get_auction_data_by_region(region_code, region_name, page=1, limit=100, session=None, order='score',
+                               use_cache=True, query_params=None, exclude_fields=None):
     """
     특정 지역의 부동산 경매 정보를 가져오는 함수
     
@@ -16,12 +80,17 @@ def get_auction_data_by_region(region_code, region_name, page=1, limit=100):
     - region_name: 지역 이름 (화면에 표시용)
     - page: 몇 번째 페이지를 가져올지 정하는 숫자 (기본값: 1페이지)
     - limit: 한 번에 몇 개의 정보를 가져올지 정하는 숫자 (기본값: 100개)
+    - session: 요청에 사용할 HTTP 세션 (없으면 공유 세션을 사용해요)
+    - order: 정렬 방식 (기본값: 점수순 'score')
+    - use_cache: True면 디스크 캐시를 먼저 확인해요 (TTL 안이면 인터넷 요청을 하지 않아요)
+    - query_params: 기본 요청 조건 대신 쓸 API 조건 (예: {'minprice': '0,6', 'maemuls': '1'})
+    - exclude_fields: 매물마다 버릴 항목 이름들 (응답을 읽으면서 바로 버려요)
     
     반환값: 해당 지역의 경매 정보가 담긴 데이터를 돌려줍니다
     """
     
     # API 주소를 만들어요 (마치 편지를 보낼 주소를 적는 것처럼)
-    base_url = "https://map.auctionmsg.com/server/api/"
+    base_url = AUCTION_API_URL
     
     # 요청할 때 함께 보낼 정보들을 정리해요
     # 사용자가 원하는 조건에 맞게 설정했어요
@@ -34,17 +103,47 @@ def get_auction_data_by_region(region_code, region_name, page=1, limit=100):
         'minprice': '0,6',               # 최소 가격 범위 (0억~6억) - 사용자 요청
         'auctioncount': '0,10',          # 경매 횟수 (0회~10회)
         'maemuls': '',                   # 매물 종류 (빈 문자열 = 모든 종류)
-        'order': 'score',                # 정렬 방식 (점수순)
+        'order': order,                  # 정렬 방식 (기본값: 점수순)
         'status': '매각기일',             # 경매 상태 (매각기일인 것만)
         's3_region1_code': region_code,  # 지역1 코드 (사용자가 원하는 지역)
         's3_region2_code': '',           # 지역2 코드 (빈 문자열 = 모든 지역)
         'onlynew': 'false'               # 신규만 보기 (false = 모든 것)
     }
     
+    # 쿼리 계획에서 정한 조건이 있으면 기본값 대신 사용해요
+    if query_params:
+        params.update(query_params)
+    
+    # 조금 전에 같은 조건으로 받은 응답이 있으면 그대로 써요
+    # (버리는 항목이 다르면 다른 응답으로 보관해요)
+    cache_params = dict(params)
+    if exclude_fields:
+        cache_params['_exclude_fields'] = ','.join(sorted(exclude_fields))
+    use_cache = use_cache and response_cache.cache_enabled()
+    cached = response_cache.load_cached_response(base_url, cache_params) if use_cache else None
+    if response_cache.is_cache_fresh(cached):
+        print(f"💾 {region_name} 지역 정보를 캐시에서 가져왔습니다!")
+        return cached['body']
+    
     try:
         # 인터넷에 정보를 요청해요 (마치 전화로 정보를 물어보는 것처럼)
         print(f"🔍 {region_name} 지역의 경매 정보를 가져오고 있습니다...")
-        response = requests.get(base_url, params=params, timeout=30)
+        http = session or get_http_session()
+        response = resilient_get(
+            http,
+            base_url,
+            params=params,
+            headers=response_cache.conditional_headers(cached),
+            timeout=30,
+            stream=True
+        )
+        
+        # 서버가 "바뀐 것 없음(304)"이라고 하면 보관해둔 응답을 다시 써요
+        if response.status_code == 304 and cached:
+            response.close()
+            print(f"💾 {region_name} 지역 정보가 바뀌지 않아 캐시를 사용합니다!")
+            response_cache.refresh_cached_response(base_url, cache_params, cached)
+            return cached['body']
         
         # 요청이 성공했는지 확인해요
         # 상태 코드 200은 "성공"이라는 뜻이에요
@@ -53,14 +152,28 @@ def get_auction_data_by_region(region_code, region_name, page=1, limit=100):
             
             # JSON 형태로 데이터를 변환해요
             # 이것은 받은 정보를 우리가 쉽게 읽을 수 있는 형태로 바꾸는 거예요
-            data = response.json()
+            # 응답 전체를 한 번에 올리지 않고 조금씩 읽으면서 매물을 하나씩 만들어요
+            try:
+                data = load_json_document(
+                    iter_decoded_chunks(response.iter_content(chunk_size=64 * 1024)),
+                    exclude_fields=exclude_fields
+                )
+            except ValueError as e:
+                print(f"❌ {region_name} 지역 응답을 해석하지 못했습니다: {e}")
+                return None
+            finally:
+                response.close()
+            
+            if use_cache:
+                response_cache.store_cached_response(base_url, cache_params, data, response.headers)
             return data
         else:
+            response.close()
             print(f"❌ {region_name} 지역 데이터 가져오기 실패: 상태 코드 {response.status_code}")
             return None
             
     except requests.exceptions.Timeout:
-        # 너무 오래 기다려서 시간이 초과된 경우
+        # 여러 번 다시 시도했는데도 시간이 초과된 경우
         print(f"⏰ {region_name} 지역 데이터 요청이 시간 초과되었습니다. 다시 시도해보세요.")
         return None
     except requests.exceptions.RequestException as e:
@@ -77,6 +190,7 @@ def filter_auction_data(data, target_regions, target_property_types, max_price):
     - target_regions: 원하는 지역 목록 (예: ['서울시', '경기도'])
     - target_property_types: 원하는 매물 종류 목록
     - max_price: 최대 가격 (원 단위)
+    (None인 조건은 서버가 이미 걸러줬다는 뜻이라 확인하지 않아요)
     
     반환값: 조건에 맞는 데이터만 골라낸 결과
     """
@@ -84,46 +198,257 @@ def filter_auction_data(data, target_regions, target_property_types, max_price):
     if not data or 'data' not in data:
         return {'data': []}
     
-    filtered_items = []
     original_items = data['data']
     
     print(f"🔧 데이터 필터링 시작 (원본: {len(original_items)}개)")
     
-    for item in original_items:
-        # 1. 지역 필터링
-        region = item.get('region', '')
-        if region not in target_regions:
-            continue
-        
-        # 2. 가격 필터링 (6억 미만)
-        minprice = item.get('minprice', 0)
-        if minprice >= max_price:
-            continue
-        
-        # 3. 매물 종류 필터링
-        maemulinfo = item.get('maemulinfo', '')
-        
-        # 매물 종류가 우리가 원하는 것 중 하나인지 확인
-        is_target_type = False
-        for prop_type in target_property_types:
-            if prop_type in maemulinfo:
-                is_target_type = True
-                break
-        
-        if not is_target_type:
-            continue
-        
-        # 모든 조건을 만족하면 결과에 추가
-        filtered_items.append(item)
+    # 조건을 한 번만 검사 함수로 만들어두고 모든 매물에 사용해요
+    # (지역: 집합 검사, 가격: 숫자 비교, 매물 종류: 하나로 합친 정규식)
+    predicate = compile_auction_filter({
+        'target_regions': target_regions,
+        'target_property_types': target_property_types,
+        'max_price': max_price
+    })
+    filtered_items = filter_items(original_items, predicate)
     
     print(f"✅ 필터링 완료: {len(filtered_items)}개가 조건에 맞습니다")
     
     return {'data': filtered_items}
 
-def get_combined_auction_data():
+# 응답에서 전체 개수나 마지막 페이지를 알려주는 항목 이름들이에요
+# API가 이런 정보를 주면 몇 페이지까지 있는지 바로 알 수 있어요
+TOTAL_COUNT_KEYS = ('total', 'totalcount', 'total_count', 'totalCount', 'cnt')
+LAST_PAGE_KEYS = ('lastpage', 'last_page', 'lastPage', 'totalpage', 'total_page', 'totalPage')
+
+# 한 지역에서 가져올 수 있는 최대 페이지 수예요 (무한히 요청하지 않도록 안전장치)
+MAX_PAGES_PER_REGION = int(os.getenv('AUCTION_MAX_PAGES', '100'))
+
+# 실패한 페이지를 몇 차례까지 다시 요청할지 정해요 (요청 하나하나의 재시도와는 별도예요)
+MAX_PAGE_ATTEMPTS = 2
+
+def read_last_page(page_data, limit):
+    """
+    첫 페이지 응답에서 마지막 페이지 번호를 읽어내는 함수
+    
+    매개변수 설명:
+    - page_data: API가 돌려준 첫 페이지 응답
+    - limit: 한 페이지에 담긴 최대 개수
+    
+    반환값: 마지막 페이지 번호 (알 수 없으면 None)
+    """
+    
+    if not isinstance(page_data, dict):
+        return None
+    
+    # 응답이 'page' 같은 하위 묶음에 정보를 담아 주는 경우도 함께 살펴봐요
+    candidates = [page_data]
+    for key in ('paging', 'pagination', 'page_info', 'meta'):
+        if isinstance(page_data.get(key), dict):
+            candidates.append(page_data[key])
+    
+    for candidate in candidates:
+        for key in LAST_PAGE_KEYS:
+            try:
+                last_page = int(candidate.get(key))
+                if last_page > 0:
+                    return last_page
+            except (TypeError, ValueError):
+                continue
+        
+        for key in TOTAL_COUNT_KEYS:
+            try:
+                total = int(candidate.get(key))
+                if total >= 0:
+                    # 전체 개수를 페이지 크기로 나눠서 올림해요
+                    return max(1, -(-total // limit))
+            except (TypeError, ValueError):
+                continue
+    
+    return None
+
+def fetch_region_pages(regions, limit=100, concurrent=True, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                       max_pages=MAX_PAGES_PER_REGION, order='score', stop_after_page=None,
+                       query_params=None, exclude_fields=None):
+    """
+    여러 지역의 모든 페이지를 끝까지 가져와서 하나의 목록으로 합치는 함수
+    
+    1. 모든 지역의 1페이지를 먼저 동시에 가져와요
+    2. 응답에 전체 개수(마지막 페이지) 정보가 있으면 남은 페이지를 한꺼번에 요청해요
+    3. 정보가 없으면 2, 4, 8...개씩 페이지 묶음을 늘려가며 미리 가져와요
+    4. 한 페이지라도 limit보다 적게 오면 그 지역은 거기서 끝이에요
+    
+    매개변수 설명:
+    - regions: (지역코드, 지역이름) 목록
+    - limit: 한 페이지에 가져올 개수
+    - concurrent: True면 요청을 동시에 보내요 (False면 한 페이지씩 차례대로)
+    - max_in_flight: 동시에 보낼 수 있는 최대 요청 수
+    - max_pages: 한 지역에서 가져올 최대 페이지 수
+    - order: 정렬 방식
+    - stop_after_page: (지역코드, 페이지 목록)을 받아 True를 돌려주면 그 지역을 거기서 멈추는 함수
+    - query_params: 모든 요청에 함께 보낼 API 조건
+    - exclude_fields: 매물마다 버릴 항목 이름들 (응답을 읽으면서 바로 버려요)
+    
+    반환값: 지역 순서, 페이지 순서대로 합치고 uid 중복을 없앤 경매 정보 목록
+    """
+    
+    session = get_http_session()
+    workers = max(1, max_in_flight) if concurrent else 1
+    
+    def fetch_page(region_code, region_name, page):
+        print(f"🔍 {region_name} 지역 {page}페이지 데이터 수집 중...")
+        return get_auction_data_by_region(
+            region_code, f'{region_name} {page}페이지', page=page, limit=limit,
+            session=session, order=order, query_params=query_params,
+            exclude_fields=exclude_fields
+        )
+    
+    # 지역별 진행 상황을 기록해요
+    states = {
+        region_code: {
+            'name': region_name,
+            'next_page': 1,
+            'last_page': None,
+            'end_page': None,
+            'batch_size': 1,
+            'failed_rounds': 0,
+            'pages': {},
+            'attempts': {},
+            'retry_pages': set(),
+            'lost_pages': []
+        }
+        for region_code, region_name in regions
+    }
+    
+    def new_pages_for(state):
+        # 아직 요청하지 않은 새 페이지 범위를 정해요
+        if state['end_page'] is not None:
+            return []
+        first = state['next_page']
+        if state['last_page'] is not None:
+            last = state['last_page']
+        else:
+            last = first + state['batch_size'] - 1
+        last = min(last, max_pages)
+        if first > last:
+            if first > max_pages:
+                print(f"⚠️ {state['name']} 지역이 최대 페이지 수({max_pages})에 도달했습니다")
+            state['end_page'] = first - 1
+            return []
+        return list(range(first, last + 1))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while True:
+            # 이번 차례에 요청할 (지역, 페이지) 목록을 만들어요
+            # 실패했던 페이지는 버리지 않고 다음 차례에 다시 요청해요
+            round_pages = {}
+            round_new_pages = {}
+            for region_code, state in states.items():
+                new_pages = new_pages_for(state)
+                pages = sorted(state['retry_pages'] | set(new_pages))
+                state['retry_pages'] = set()
+                if pages:
+                    round_pages[region_code] = pages
+                    round_new_pages[region_code] = new_pages
+            
+            if not round_pages:
+                break
+            
+            futures = {
+                (region_code, page): executor.submit(fetch_page, region_code, states[region_code]['name'], page)
+                for region_code, pages in round_pages.items()
+                for page in pages
+            }
+            
+            for region_code, pages in round_pages.items():
+                state = states[region_code]
+                new_pages = round_new_pages[region_code]
+                new_page_success = False
+                
+                for page in pages:
+                    page_data = futures[(region_code, page)].result()
+                    
+                    # 마지막 페이지 뒤쪽 결과는 필요 없어요
+                    if state['end_page'] is not None and page > state['end_page']:
+                        continue
+                    
+                    if page_data is None or 'data' not in page_data:
+                        # 실패한 페이지 때문에 지역 전체를 멈추지 않고, 정해진 횟수까지 다시 요청해요
+                        state['attempts'][page] = state['attempts'].get(page, 0) + 1
+                        if state['attempts'][page] < MAX_PAGE_ATTEMPTS:
+                            print(f"⚠️ {state['name']} {page}페이지 오류 발생 - 다음 차례에 다시 요청합니다")
+                            state['retry_pages'].add(page)
+                        else:
+                            print(f"❌ {state['name']} {page}페이지를 끝내 가져오지 못했습니다")
+                            state['lost_pages'].append(page)
+                        continue
+                    
+                    if page in new_pages:
+                        new_page_success = True
+                    
+                    page_items = page_data['data'] or []
+                    state['pages'][page] = page_items
+                    if page_items:
+                        print(f"✅ {state['name']} {page}페이지 데이터 {len(page_items)}건 추가")
+                    
+                    if page == 1 and state['last_page'] is None:
+                        state['last_page'] = read_last_page(page_data, limit)
+                    
+                    # 호출한 쪽이 "여기서 그만"이라고 하면 남은 페이지는 건너뛰어요
+                    if stop_after_page and page_items and stop_after_page(region_code, page_items):
+                        print(f"⏭️ {state['name']} {page}페이지 이후는 변경사항이 없어 건너뜁니다")
+                        state['end_page'] = page
+                        continue
+                    
+                    # 페이지가 꽉 차지 않았으면 마지막 페이지예요
+                    if len(page_items) < limit or page == state['last_page']:
+                        state['end_page'] = page
+                
+                # 마지막 페이지 뒤쪽의 재시도는 취소해요
+                if state['end_page'] is not None:
+                    state['retry_pages'] = {page for page in state['retry_pages'] if page <= state['end_page']}
+                    state['lost_pages'] = [page for page in state['lost_pages'] if page <= state['end_page']]
+                
+                if new_pages and state['end_page'] is None:
+                    state['next_page'] = new_pages[-1] + 1
+                    if new_page_success:
+                        state['failed_rounds'] = 0
+                        if concurrent and len(state['pages']) >= len(new_pages):
+                            state['batch_size'] = min(state['batch_size'] * 2, max(1, max_in_flight) * 2)
+                    else:
+                        # 새 페이지가 연달아 하나도 안 오면 서버 문제로 보고 더 나아가지 않아요
+                        state['failed_rounds'] += 1
+                        if state['failed_rounds'] >= MAX_PAGE_ATTEMPTS:
+                            print(f"⚠️ {state['name']} 지역은 서버 오류가 계속되어 {new_pages[-1]}페이지에서 멈춥니다")
+                            state['end_page'] = new_pages[-1]
+    
+    for region_code, state in states.items():
+        if state['lost_pages']:
+            print(f"⚠️ {state['name']} 지역에서 가져오지 못한 페이지: {sorted(state['lost_pages'])}")
+    
+    # 여러 페이지에 같은 매물이 겹쳐 나오면 한 번만 남겨요
+    all_data = []
+    seen_uids = set()
+    for region_code, _ in regions:
+        pages = states[region_code]['pages']
+        for item in (item for page in sorted(pages) for item in pages[page]):
+            uid = item.get('uid')
+            if uid is not None:
+                if uid in seen_uids:
+                    continue
+                seen_uids.add(uid)
+            all_data.append(item)
+    
+    return all_data
+
+def get_combined_auction_data(concurrent=True, max_in_flight=DEFAULT_MAX_IN_FLIGHT, exclude_fields=None):
     """
     서울과 경기도의 경매 정보를 모두 가져와서 합치는 함수
     사용자가 원하는 조건에 맞는 데이터만 반환합니다
+    
+    매개변수 설명:
+    - concurrent: True면 지역/페이지 요청을 동시에 보내요 (기본값)
+    - max_in_flight: 동시에 보낼 수 있는 최대 요청 수
+    - exclude_fields: 매물마다 버릴 항목 이름들 (응답을 읽으면서 바로 버려요)
     """
     
     print("🏠 사용자 맞춤 경매 정보 수집을 시작합니다!")
@@ -131,52 +456,228 @@ def get_combined_auction_data():
     print("   - 지역: 서울, 경기도")
     print("   - 가격대: 0~6억 미만")
     print("   - 매물 종류: 아파트, 오피스텔, 단독주택, 다가구주택")
-    print("-" * 50)
     
-    # 사용자가 원하는 조건 설정
-    target_regions = ['서울시', '경기도']  # 원하는 지역
-    target_property_types = ['아파트', '오피스텔', '단독주택', '다가구주택']  # 원하는 매물 종류
-    max_price = 600000000  # 6억원
-    
-    all_data = []  # 모든 지역의 데이터를 담을 리스트
+    # 검색 조건 중 서버가 걸러줄 수 있는 것은 API 조건으로 보내요
+    plan = plan_auction_query(TARGET_REGIONS, TARGET_PROPERTY_TYPES, MAX_PRICE)
+    print("🧭 쿼리 계획:")
+    for line in describe_plan(plan):
+        print(line)
+    print("-" * 50)
     
-    # 1. 서울 데이터 가져오기 (지역코드: 11) - 여러 페이지
-    for page in range(1, 3):  # 1페이지부터 2페이지까지
-        print(f"🔍 서울 지역 {page}페이지 데이터 수집 중...")
-        seoul_data = get_auction_data_by_region('11', f'서울 {page}페이지', page=page, limit=100)
-        if seoul_data and 'data' in seoul_data and seoul_data['data']:
-            all_data.extend(seoul_data['data'])
-            print(f"✅ 서울 {page}페이지 데이터 {len(seoul_data['data'])}건 추가")
-        else:
-            print(f"⚠️ 서울 {page}페이지 데이터가 없거나 오류 발생")
-            break  # 데이터가 없으면 더 이상 페이지를 가져오지 않음
-    
-    # 2. 경기도 데이터 가져오기 (지역코드: 41) - 여러 페이지
-    for page in range(1, 3):  # 1페이지부터 2페이지까지
-        print(f"🔍 경기도 지역 {page}페이지 데이터 수집 중...")
-        gyeonggi_data = get_auction_data_by_region('41', f'경기도 {page}페이지', page=page, limit=100)
-        if gyeonggi_data and 'data' in gyeonggi_data and gyeonggi_data['data']:
-            all_data.extend(gyeonggi_data['data'])
-            print(f"✅ 경기도 {page}페이지 데이터 {len(gyeonggi_data['data'])}건 추가")
-        else:
-            print(f"⚠️ 경기도 {page}페이지 데이터가 없거나 오류 발생")
-            break  # 데이터가 없으면 더 이상 페이지를 가져오지 않음
+    # 1. 모든 지역의 페이지를 끝까지 가져오기 (서울: 11, 경기도: 41)
+    all_data = fetch_region_pages(
+        plan['regions'],
+        limit=100,
+        concurrent=concurrent,
+        max_in_flight=max_in_flight,
+        query_params=plan['params'],
+        exclude_fields=exclude_fields
+    )
     
-    # 3. 합친 데이터를 올바른 형태로 만들기
+    # 2. 합친 데이터를 올바른 형태로 만들기
     combined_data = {'data': all_data}
     
     print(f"\n📊 총 {len(all_data)}개의 데이터를 수집했습니다")
     
-    # 4. 사용자 조건에 맞게 필터링하기
+    # 3. 서버가 걸러주지 못한 나머지 조건으로 필터링하기
+    residual = plan['residual']
     filtered_data = filter_auction_data(
         combined_data, 
-        target_regions, 
-        target_property_types, 
-        max_price
+        residual['target_regions'], 
+        residual['target_property_types'], 
+        residual['max_price']
     )
     
     return filtered_data
 
+def record_version(item):
+    """
+    매물 한 건의 "버전"을 알려주는 함수
+    수정 시각(cupdate), 상태 변경 시각(statusupdate), 정정일(correction_date) 중
+    하나라도 바뀌면 다른 버전으로 봐요
+    """
+    return (
+        item.get('cupdate') or '',
+        item.get('statusupdate') or '',
+        item.get('correction_date') or ''
+    )
+
+def find_previous_snapshot(data_folder='data'):
+    """
+    가장 최근에 저장된 스냅샷 파일을 찾는 함수
+    파일 이름에 들어 있는 날짜/시간을 기준으로 가장 늦은 것을 골라요
+    
+    반환값: 파일 경로 (없으면 None)
+    """
+    
+    if not os.path.exists(data_folder):
+        return None
+    
+    prefixes = ('daily_auction_data_', 'fresh_auction_data_', 'custom_auction_data_')
+    candidates = []
+    for filename in os.listdir(data_folder):
+        if not is_snapshot_file(filename):
+            continue
+        for prefix in prefixes:
+            if filename.startswith(prefix):
+                # "2025-09-25" 과 "2025-09-25_15-13-21" 모두 문자열 순서가 곧 시간 순서예요
+                stamp = snapshot_stem(filename)[len(prefix):]
+                candidates.append((stamp, filename))
+                break
+    
+    if not candidates:
+        return None
+    
+    return os.path.join(data_folder, max(candidates)[1])
+
+def load_previous_snapshot_index(filepath=None):
+    """
+    이전 스냅샷을 읽어서 uid → 매물 정보 사전을 만드는 함수
+    
+    매개변수 설명:
+    - filepath: 읽을 스냅샷 파일 (없으면 가장 최근 파일을 찾아요)
+    
+    반환값: (파일 경로, {uid: 매물 정보}) - 파일이 없으면 (None, {})
+    """
+    
+    filepath = filepath or find_previous_snapshot()
+    if not filepath:
+        return None, {}
+    
+    try:
+        snapshot = load_snapshot(filepath)
+    except Exception as e:
+        print(f"⚠️ 이전 스냅샷을 읽지 못했습니다 ({filepath}): {e}")
+        return None, {}
+    
+    index = {item['uid']: item for item in snapshot.get('data', []) if item.get('uid') is not None}
+    return filepath, index
+
+def compute_change_set(previous_index, current_items, complete=True):
+    """
+    이전 스냅샷과 이번 수집 결과를 비교해서 바뀐 부분을 정리하는 함수
+    
+    매개변수 설명:
+    - previous_index: 이전 스냅샷의 {uid: 매물 정보}
+    - current_items: 이번에 수집한 매물 목록
+    - complete: 이번 수집이 전체 목록을 다 봤는지 여부
+                (중간에 멈췄다면 사라진 매물은 알 수 없어요)
+    
+    반환값: {'added': [...], 'modified': [...], 'removed': [...]} 형태의 uid 목록
+    """
+    
+    added = []
+    modified = []
+    current_uids = set()
+    
+    for item in current_items:
+        uid = item.get('uid')
+        if uid is None:
+            continue
+        current_uids.add(uid)
+        
+        previous = previous_index.get(uid)
+        if previous is None:
+            added.append(uid)
+        elif record_version(previous) != record_version(item):
+            modified.append(uid)
+    
+    removed = []
+    if complete:
+        removed = [uid for uid in previous_index if uid not in current_uids]
+    
+    return {'added': added, 'modified': modified, 'removed': removed}
+
+def get_delta_auction_data(previous_snapshot=None, order=None, concurrent=True,
+                           max_in_flight=DEFAULT_MAX_IN_FLIGHT, exclude_fields=None):
+    """
+    이전 스냅샷과 비교해서 바뀐 부분(변경분)과 합쳐진 전체 목록을 함께 돌려주는 함수
+    
+    정렬 방식(order)이 "최근 수정순"이면, 한 페이지가 모두 바뀌지 않은 매물일 때
+    그 뒤 페이지는 더 오래된 것들이므로 요청하지 않아요.
+    이때 보지 못한 매물은 이전 스냅샷의 내용을 그대로 이어받아요.
+    
+    매개변수 설명:
+    - previous_snapshot: 비교할 이전 스냅샷 파일 (없으면 가장 최근 파일)
+    - order: 수정순 정렬 값 (없으면 DELTA_ORDER 설정을 사용해요)
+    - concurrent: True면 요청을 동시에 보내요
+    - max_in_flight: 동시에 보낼 수 있는 최대 요청 수
+    - exclude_fields: 매물마다 버릴 항목 이름들 (응답을 읽으면서 바로 버려요)
+    
+    반환값: {'data': 전체 목록, 'changes': 변경분 정보}
+    """
+    
+    order = order if order is not None else DELTA_ORDER
+    base_path, previous_index = load_previous_snapshot_index(previous_snapshot)
+    
+    print("🔄 변경분(delta) 수집을 시작합니다!")
+    print(f"📂 기준 스냅샷: {base_path or '없음 (전체 수집)'} ({len(previous_index)}건)")
+    
+    stopped_regions = []
+    is_target = compile_auction_filter({
+        'target_regions': TARGET_REGIONS,
+        'target_property_types': TARGET_PROPERTY_TYPES,
+        'max_price': MAX_PRICE
+    })
+    
+    def stop_when_unchanged(region_code, page_items):
+        # 조건에 맞는 매물만 비교해요 (이전 스냅샷에는 조건에 맞는 매물만 있어요)
+        relevant = [item for item in page_items if is_target(item)]
+        if not relevant:
+            return False
+        
+        # 페이지의 모든 매물이 이전과 같은 버전이면 여기서 멈춰요
+        for item in relevant:
+            previous = previous_index.get(item.get('uid'))
+            if previous is None or record_version(previous) != record_version(item):
+                return False
+        stopped_regions.append(region_code)
+        return True
+    
+    plan = plan_auction_query(TARGET_REGIONS, TARGET_PROPERTY_TYPES, MAX_PRICE)
+    use_early_stop = bool(order) and bool(previous_index)
+    all_data = fetch_region_pages(
+        plan['regions'],
+        limit=100,
+        concurrent=concurrent,
+        max_in_flight=max_in_flight,
+        order=order or 'score',
+        stop_after_page=stop_when_unchanged if use_early_stop else None,
+        query_params=plan['params'],
+        exclude_fields=exclude_fields
+    )
+    
+    print(f"\n📊 총 {len(all_data)}개의 데이터를 수집했습니다")
+    
+    residual = plan['residual']
+    filtered_items = filter_auction_data(
+        {'data': all_data},
+        residual['target_regions'],
+        residual['target_property_types'],
+        residual['max_price']
+    )['data']
+    
+    complete = not stopped_regions
+    changes = compute_change_set(previous_index, filtered_items, complete=complete)
+    
+    merged_items = list(filtered_items)
+    if not complete:
+        # 건너뛴 페이지의 매물들은 이전 스냅샷에서 그대로 가져와요
+        seen_uids = {item.get('uid') for item in filtered_items}
+        merged_items.extend(
+            item for uid, item in previous_index.items() if uid not in seen_uids
+        )
+    
+    changes.update({
+        'base_snapshot': os.path.basename(base_path) if base_path else None,
+        'complete': complete
+    })
+    
+    print(f"🆕 추가 {len(changes['added'])}건, ✏️ 변경 {len(changes['modified'])}건, "
+          f"🗑️ 삭제 {len(changes['removed'])}건")
+    
+    return {'data': merged_items, 'changes': changes}
+
 def save_to_json(data, filename=None):
     """
     받은 데이터를 JSON 파일로 저장하는 함수
@@ -202,21 +703,34 @@ def save_to_json(data, filename=None):
         filepath = os.path.join('data', filename)
         
         # 검색 조건 정보도 함께 저장해요
+        # (데이터에 검색 조건이 들어 있으면 그것을 사용해요 - 예: 전국 수집)
+        search_conditions = dict(data.get('search_conditions') or {
+            'regions': ['서울시', '경기도'],
+            'price_range': '0~6억 미만',
+            'property_types': ['아파트', '오피스텔', '단독주택', '다가구주택']
+        })
+        search_conditions['collected_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         save_data = {
-            'search_conditions': {
-                'regions': ['서울시', '경기도'],
-                'price_range': '0~6억 미만',
-                'property_types': ['아파트', '오피스텔', '단독주택', '다가구주택'],
-                'collected_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            },
+            'search_conditions': search_conditions,
             'data': data.get('data', [])
         }
         
-        # 파일을 열고 데이터를 저장해요
-        # ensure_ascii=False는 한글이 깨지지 않게 하는 설정이에요
-        # indent=2는 보기 좋게 들여쓰기를 해주는 설정이에요
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(save_data, file, ensure_ascii=False, indent=2)
+        # 변경분(delta) 정보가 있으면 함께 저장해요
+        if data.get('changes') is not None:
+            save_data['changes'] = data['changes']
+        
+        # 파일을 저장해요
+        # 매물 내용은 data/objects/에 한 번만 저장하고, 스냅샷 파일에는 참조만 적어요
+        # (AUCTION_SNAPSHOT_FORMAT=full이면 예전처럼 매물 전체를 적어요)
+        # AUCTION_STORAGE_MODE=gzip이면 공백을 빼고 압축해서 .json.gz로 저장해요
+        filepath = write_snapshot(filepath, save_data)
+        
+        # 날짜별 스냅샷이면 트렌드 분석용 열 저장소에도 적어둬요
+        record_snapshot(filepath, save_data['data'])
+        
+        # 스냅샷 목록표에도 적어둬요 (최신 스냅샷을 폴더를 뒤지지 않고 찾을 수 있어요)
+        record_saved_snapshot(filepath, save_data)
         
         print(f"💾 파일이 성공적으로 저장되었습니다: {filepath}")
         return True
@@ -225,6 +739,14 @@ def save_to_json(data, filename=None):
         print(f"❌ 파일 저장 중 오류가 발생했습니다: {e}")
         return False
 
+# 수집 결과 요약에서 쓰는 가격대 이름이에요 (5억 이상은 모두 '5억~6억'으로 세요)
+SUMMARY_PRICE_RANGES = ('1억 미만', '1억~2억', '2억~3억', '3억~4억', '4억~5억', '5억~6억')
+
+def summary_price_range(minprice):
+    """최저가가 속하는 요약용 가격대 이름을 알려줘요 (1억 단위)"""
+    index = min(int(minprice // 100000000), len(SUMMARY_PRICE_RANGES) - 1) if minprice >= 0 else 0
+    return SUMMARY_PRICE_RANGES[index]
+
 def analyze_auction_data(data):
     """
     가져온 경매 데이터를 분석해서 요약 정보를 보여주는 함수
@@ -249,62 +771,36 @@ def analyze_auction_data(data):
     print(f"🏠 조건에 맞는 경매 물건 개수: {len(auction_list)}개")
     
     if len(auction_list) > 0:
+        # 목록을 한 번만 훑으면서 가격 통계와 지역/종류/가격대별 분포를 함께 세요
+        summary = aggregate_items(auction_list, {
+            'prices': PriceSummarySection(),
+            'regions': CountSection(lambda item: f"{item.get('region', '알 수 없음')} {item.get('subregion', '')}".strip()),
+            'maemul_types': CountSection(lambda item: item.get('maemulinfo', '알 수 없음')),
+            'price_ranges': CountSection(lambda item: summary_price_range(item.get('minprice', 0)))
+        })
+        
         # 가격 정보 분석
-        min_prices = [item.get('minprice', 0) for item in auction_list if item.get('minprice')]
-        if min_prices:
-            print(f"💰 최저 경매가: {min(min_prices):,}원")
-            print(f"💰 최고 경매가: {max(min_prices):,}원")
-            print(f"💰 평균 경매가: {sum(min_prices)//len(min_prices):,}원")
+        prices = summary['prices']
+        if prices['max_price'] > 0:
+            print(f"💰 최저 경매가: {prices['min_price']:,}원")
+            print(f"💰 최고 경매가: {prices['max_price']:,}원")
+            print(f"💰 평균 경매가: {prices['avg_price']:,}원")
+            print(f"💰 중간 경매가: {prices['p50']:,}원 (하위 10% {prices['p10']:,}원 ~ 상위 10% {prices['p90']:,}원)")
         
         # 지역별 분포 (상세)
-        regions = {}
-        for item in auction_list:
-            region = item.get('region', '알 수 없음')
-            subregion = item.get('subregion', '')
-            full_region = f"{region} {subregion}".strip()
-            regions[full_region] = regions.get(full_region, 0) + 1
-        
         print(f"\n🗺️  상세 지역별 분포:")
-        for region, count in sorted(regions.items()):
+        for region, count in sorted(summary['regions'].items()):
             print(f"   - {region}: {count}개")
         
         # 매물 종류별 분포
-        maemul_types = {}
-        for item in auction_list:
-            maemul_info = item.get('maemulinfo', '알 수 없음')
-            maemul_types[maemul_info] = maemul_types.get(maemul_info, 0) + 1
-        
         print(f"\n🏘️  매물 종류별 분포:")
-        for maemul_type, count in sorted(maemul_types.items()):
+        for maemul_type, count in sorted(summary['maemul_types'].items()):
             print(f"   - {maemul_type}: {count}개")
         
         # 가격대별 분포 (1억 단위로)
-        price_ranges = {
-            '1억 미만': 0,
-            '1억~2억': 0,
-            '2억~3억': 0,
-            '3억~4억': 0,
-            '4억~5억': 0,
-            '5억~6억': 0
-        }
-        
-        for item in auction_list:
-            minprice = item.get('minprice', 0)
-            if minprice < 100000000:
-                price_ranges['1억 미만'] += 1
-            elif minprice < 200000000:
-                price_ranges['1억~2억'] += 1
-            elif minprice < 300000000:
-                price_ranges['2억~3억'] += 1
-            elif minprice < 400000000:
-                price_ranges['3억~4억'] += 1
-            elif minprice < 500000000:
-                price_ranges['4억~5억'] += 1
-            else:
-                price_ranges['5억~6억'] += 1
-        
         print(f"\n💸 가격대별 분포:")
-        for price_range, count in price_ranges.items():
+        for price_range in SUMMARY_PRICE_RANGES:
+            count = summary['price_ranges'].get(price_range, 0)
             if count > 0:
                 print(f"   - {price_range}: {count}개")
     else:
@@ -0,0 +1,128 @@
+# 검색 조건을 한 번만 "컴파일"해서 빠르게 걸러주는 필터 도구예요
+# 조건 목록을 매번 하나씩 비교하는 대신, 미리 집합(set)과 정규식으로 바꿔두고
+# 매물마다 한 번의 검사로 통과/탈락을 정해요
+# 마치 시험 채점할 때 정답표를 미리 만들어두고 빠르게 채점하는 것과 같아요!
+
+import re
+
+# 이 개수보다 많으면 pandas를 이용한 묶음 처리로 걸러요 (pandas가 설치되어 있을 때만)
+VECTORIZE_THRESHOLD = 5000
+
+def compile_auction_filter(conditions):
+    """
+    검색 조건을 하나의 검사 함수로 만들어주는 함수
+    
+    매개변수 설명:
+    - conditions: 검색 조건 사전
+        - 'target_regions': 원하는 지역 목록 (정확히 같아야 해요)
+        - 'target_property_types': 원하는 매물 종류 목록 (maemulinfo에 포함되면 통과)
+        - 'min_price': 최소 가격 (이상)
+        - 'max_price': 최대 가격 (미만)
+      값이 None이거나 없는 조건은 확인하지 않아요
+    
+    반환값: 매물 한 건을 받아 True/False를 돌려주는 함수 (spec 속성에 컴파일 결과가 들어 있어요)
+    """
+    
+    regions = conditions.get('target_regions')
+    region_set = frozenset(regions) if regions is not None else None
+    
+    # 여러 매물 종류 키워드를 하나의 정규식으로 합쳐요 (긴 것부터 시도해요)
+    property_types = conditions.get('target_property_types')
+    type_pattern = None
+    if property_types is not None:
+        keywords = sorted(set(property_types), key=len, reverse=True)
+        type_pattern = re.compile('|'.join(re.escape(keyword) for keyword in keywords)) if keywords else None
+    
+    min_price = conditions.get('min_price')
+    max_price = conditions.get('max_price')
+    
+    # 필요한 검사만 골라서 목록으로 만들어둬요
+    checks = []
+    if region_set is not None:
+        checks.append(lambda item: item.get('region', '') in region_set)
+    if min_price is not None:
+        checks.append(lambda item: item.get('minprice', 0) >= min_price)
+    if max_price is not None:
+        checks.append(lambda item: item.get('minprice', 0) < max_price)
+    if property_types is not None:
+        if type_pattern is None:
+            # 원하는 종류가 하나도 없으면 아무것도 통과하지 못해요
+            checks.append(lambda item: False)
+        else:
+            search = type_pattern.search
+            checks.append(lambda item: search(item.get('maemulinfo', '') or '') is not None)
+    
+    if not checks:
+        def predicate(item):
+            return True
+    elif len(checks) == 1:
+        predicate = checks[0]
+    else:
+        def predicate(item):
+            for check in checks:
+                if not check(item):
+                    return False
+            return True
+    
+    # 묶음 처리(pandas)에서도 같은 조건을 쓸 수 있도록 컴파일 결과를 붙여둬요
+    predicate.spec = {
+        'region_set': region_set,
+        'type_pattern': type_pattern,
+        'has_types': property_types is not None,
+        'min_price': min_price,
+        'max_price': max_price
+    }
+    return predicate
+
+def _filter_vectorized(items, spec):
+    """
+    pandas로 조건을 한꺼번에 계산해서 통과한 매물만 골라내는 함수
+    pandas가 없으면 None을 돌려줘요
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    
+    mask = pd.Series(True, index=range(len(items)))
+    
+    if spec['region_set'] is not None:
+        regions = pd.Series([item.get('region', '') for item in items])
+        mask &= regions.isin(spec['region_set'])
+    
+    if spec['min_price'] is not None or spec['max_price'] is not None:
+        prices = pd.Series([item.get('minprice', 0) for item in items])
+        if spec['min_price'] is not None:
+            mask &= prices >= spec['min_price']
+        if spec['max_price'] is not None:
+            mask &= prices < spec['max_price']
+    
+    if spec['has_types']:
+        if spec['type_pattern'] is None:
+            return []
+        infos = pd.Series([item.get('maemulinfo', '') or '' for item in items])
+        mask &= infos.str.contains(spec['type_pattern'], regex=True)
+    
+    return [item for item, keep in zip(items, mask.tolist()) if keep]
+
+def filter_items(items, predicate, vectorize=None):
+    """
+    컴파일된 검사 함수로 매물 목록을 걸러주는 함수
+    
+    매개변수 설명:
+    - items: 매물 목록
+    - predicate: compile_auction_filter로 만든 검사 함수
+    - vectorize: True/False로 묶음 처리 여부를 정해요 (None이면 개수를 보고 자동으로 정해요)
+    
+    반환값: 조건을 통과한 매물 목록 (원래 순서 그대로)
+    """
+    
+    if vectorize is None:
+        vectorize = len(items) >= VECTORIZE_THRESHOLD
+    
+    if vectorize and getattr(predicate, 'spec', None) is not None:
+        result = _filter_vectorized(items, predicate.spec)
+        if result is not None:
+            return result
+    
+    return [item for item in items if predicate(item)]
@@ -0,0 +1,124 @@
+# 검색 조건을 경매 API 요청 조건으로 바꿔주는 "쿼리 계획표" 도구예요
+# 서버에게 미리 걸러달라고 부탁할 수 있는 조건은 최대한 API에 실어 보내고,
+# 서버가 정확히 걸러줄 수 없는 조건만 받아온 뒤에 우리가 직접 걸러요
+# 마치 가게에 "6억 이하 아파트만 보여주세요"라고 미리 말하는 것과 같아요!
+
+import os
+
+# 시/도 이름 → API 지역 코드(s3_region1_code)예요
+SIDO_REGION_CODES = {
+    '서울시': '11',
+    '부산시': '26',
+    '대구시': '27',
+    '인천시': '28',
+    '광주시': '29',
+    '대전시': '30',
+    '울산시': '31',
+    '세종시': '36',
+    '경기도': '41',
+    '충청북도': '43',
+    '충청남도': '44',
+    '전라남도': '46',
+    '경상북도': '47',
+    '경상남도': '48',
+    '제주도': '50',
+    '강원도': '51',
+    '전라북도': '52',
+}
+
+# API의 가격 범위(minprice) 조건은 억 단위예요
+PRICE_UNIT = 100000000
+
+def load_maemul_codes():
+    """
+    매물 종류 이름 → API 매물 코드(maemuls) 표를 읽는 함수
+    
+    API의 매물 코드는 공개된 표가 없어서, 환경 변수 AUCTION_MAEMUL_CODES로 알려줘야 해요
+    (예: "아파트=1,오피스텔=2")
+    응답의 'maemul' 항목은 사건 안의 물건 수라서 코드 표를 만드는 데 쓸 수 없어요
+    그래서 이 설정이 없으면 maemuls 조건은 보내지 않고, 매물 종류는 모두 받아온 뒤에 우리가 직접 걸러요
+    
+    반환값: {매물 종류 이름: 코드}
+    """
+    codes = {}
+    for pair in os.getenv('AUCTION_MAEMUL_CODES', '').split(','):
+        if '=' not in pair:
+            continue
+        name, code = pair.split('=', 1)
+        if name.strip() and code.strip():
+            codes[name.strip()] = code.strip()
+    return codes
+
+def plan_auction_query(target_regions, target_property_types, max_price, min_price=0):
+    """
+    검색 조건을 API 요청 조건과 직접 걸러야 할 나머지 조건으로 나누는 함수
+    
+    매개변수 설명:
+    - target_regions: 원하는 지역 목록 (예: ['서울시', '경기도'])
+    - target_property_types: 원하는 매물 종류 목록
+    - max_price: 최대 가격 (원 단위, 이 값 미만만 원해요)
+    - min_price: 최소 가격 (원 단위)
+    
+    반환값: {
+        'regions': 요청할 (지역코드, 지역이름) 목록,
+        'params': 모든 요청에 함께 보낼 API 조건,
+        'residual': 받아온 뒤 직접 걸러야 할 조건 (None이면 거를 필요 없음)
+    }
+    """
+    
+    residual = {
+        'target_regions': None,
+        'target_property_types': None,
+        'max_price': None
+    }
+    
+    # 1. 지역 → s3_region1_code
+    # 코드를 아는 지역은 지역별로 따로 요청하고, 모르는 지역이 하나라도 있으면
+    # 전국을 요청한 뒤 지역 이름으로 직접 걸러요
+    unknown_regions = [region for region in target_regions if region not in SIDO_REGION_CODES]
+    if unknown_regions:
+        regions = [('', '전국')]
+        residual['target_regions'] = list(target_regions)
+    else:
+        regions = [
+            (SIDO_REGION_CODES[region], region[:-1] if region.endswith('시') else region)
+            for region in target_regions
+        ]
+    
+    # 2. 가격 → minprice (억 단위, 올림)
+    # API의 범위는 끝값을 포함하지만 우리는 "미만"을 원하므로 경계값 확인은 직접 해요
+    upper = -(-max_price // PRICE_UNIT)
+    lower = min_price // PRICE_UNIT
+    params = {'minprice': f'{lower},{upper}'}
+    residual['max_price'] = max_price
+    
+    # 3. 매물 종류 → maemuls
+    # 코드 표에 있는 종류만 보낼 수 있어요. 코드는 종류 단위로 걸러주지만
+    # 우리 조건은 "이름이 포함된 것"이라서 받아온 뒤에도 이름을 한 번 더 확인해요
+    maemul_codes = load_maemul_codes()
+    if target_property_types and all(prop_type in maemul_codes for prop_type in target_property_types):
+        params['maemuls'] = ','.join(
+            sorted({maemul_codes[prop_type] for prop_type in target_property_types})
+        )
+    residual['target_property_types'] = list(target_property_types)
+    
+    return {
+        'regions': regions,
+        'params': params,
+        'residual': residual
+    }
+
+def describe_plan(plan):
+    """
+    쿼리 계획을 사람이 읽기 쉬운 문장들로 바꿔주는 함수
+    """
+    lines = [f"   - 요청 지역: {', '.join(name for _, name in plan['regions'])}"]
+    for key, value in plan['params'].items():
+        lines.append(f"   - API 조건 {key}={value}")
+    
+    if plan['residual']['target_property_types'] and 'maemuls' not in plan['params']:
+        lines.append("   - 매물 종류는 서버에서 거르지 않아요 (AUCTION_MAEMUL_CODES에 코드 표가 없어요)")
+    
+    residual_names = [key for key, value in plan['residual'].items() if value is not None]
+    lines.append(f"   - 직접 거를 조건: {', '.join(residual_names) or '없음'}")
+    return lines
@@ -0,0 +1,165 @@
+# 과거 경매 데이터를 "열(column)" 단위로 저장해서 빠르게 분석하는 도구예요
+# JSON 스냅샷은 매물 한 건에 모든 항목이 들어 있어서, 가격 하나만 필요해도 전부 읽어야 해요
+# 그래서 날짜별로 uid, 가격, 지역 같은 항목을 각각의 배열(NumPy)로 나눠 .npz 파일에 저장해두고
+# 트렌드 분석할 때는 필요한 열만 꺼내 읽어요
+# 마치 엑셀 표에서 필요한 열만 골라서 복사해 오는 것과 같아요!
+#
+# 사용법:
+#   python columnar_history.py          # data 폴더의 daily 스냅샷으로 열 저장소를 만들거나 최신으로 맞추기
+
+import os
+import re
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from json_stream import iter_snapshot_items
+from snapshot_files import is_snapshot_file, list_archived_snapshots, snapshot_mtime, snapshot_name, snapshot_stem
+
+# 열 저장소 폴더예요 (스냅샷 폴더 안에 만들어요)
+COLUMNAR_DIRNAME = 'columnar'
+
+# 날짜별 스냅샷 파일 이름 규칙이에요 (끝부분 .json / .json.gz / .json.zst 는 빼고 비교해요)
+DAILY_PATTERN = re.compile(r'^daily_auction_data_(\d{4}-\d{2}-\d{2})$')
+
+# 저장할 열과 자료형이에요
+# - int: 정수 (없으면 0)
+# - float: 실수 (없으면 NaN)
+# - str: 글자 (없으면 빈 글자)
+COLUMN_TYPES = {
+    'uid': 'int',
+    'minprice': 'int',
+    'estimatedprice': 'int',
+    'region': 'str',
+    'subregion': 'str',
+    'maemulinfo': 'str',
+    'auctiondate': 'str',
+    'lat': 'float',
+    'lng': 'float'
+}
+
+def columnar_path(date_str, data_folder='data'):
+    """날짜의 열 저장소 파일 위치를 알려줘요"""
+    return os.path.join(data_folder, COLUMNAR_DIRNAME, f"daily_{date_str}.npz")
+
+def _column_array(values, kind):
+    if kind == 'int':
+        return np.array([value if isinstance(value, int) else 0 for value in values], dtype=np.int64)
+    if kind == 'float':
+        return np.array(
+            [float(value) if isinstance(value, (int, float)) else np.nan for value in values],
+            dtype=np.float64
+        )
+    return np.array([value if isinstance(value, str) else '' for value in values], dtype=str)
+
+def write_day(date_str, items, data_folder='data'):
+    """
+    하루치 매물을 열 단위로 나눠 .npz 파일에 저장하는 함수
+    
+    매개변수 설명:
+    - date_str: 날짜 ('2025-09-25' 형태)
+    - items: 그날의 매물 목록
+    - data_folder: 스냅샷 폴더
+    
+    반환값: 저장한 파일 경로
+    """
+    path = columnar_path(date_str, data_folder)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    
+    columns = {
+        name: _column_array([item.get(name) for item in items], kind)
+        for name, kind in COLUMN_TYPES.items()
+    }
+    
+    # 임시 파일에 먼저 쓰고 바꿔치기해서 반쯤 쓰인 파일이 생기지 않게 해요
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        np.savez_compressed(file, **columns)
+    os.replace(temp_path, path)
+    return path
+
+def record_snapshot(filepath, items):
+    """
+    스냅샷을 저장할 때 함께 불러서, 날짜별(daily) 스냅샷이면 열 저장소에도 적어두는 함수
+    
+    반환값: 열 저장소에 적었으면 파일 경로, 날짜별 스냅샷이 아니면 None
+    """
+    filename = os.path.basename(filepath)
+    match = DAILY_PATTERN.match(snapshot_stem(filename)) if is_snapshot_file(filename) else None
+    if match is None:
+        return None
+    return write_day(match.group(1), items, os.path.dirname(filepath))
+
+def read_day(date_str, columns=None, data_folder='data'):
+    """
+    하루치 열 저장소에서 필요한 열만 읽어오는 함수
+    .npz 안의 열은 따로 저장되어 있어서 요청한 열만 풀어요
+    
+    매개변수 설명:
+    - date_str: 날짜
+    - columns: 읽을 열 이름들 (None이면 모두)
+    
+    반환값: {열 이름: NumPy 배열}
+    """
+    with np.load(columnar_path(date_str, data_folder), allow_pickle=False) as archive:
+        names = archive.files if columns is None else columns
+        return {name: archive[name] for name in names}
+
+def daily_snapshots(days=None, data_folder='data'):
+    """
+    날짜별 스냅샷 파일을 찾아서 (날짜, 파일 경로) 목록을 날짜순으로 돌려주는 함수
+    월별 보관함에 들어간 스냅샷도 찾아요 (같은 날짜가 둘 다 있으면 data 폴더의 것을 써요)
+    days를 주면 오늘부터 그 기간 안의 날짜만 남겨요
+    """
+    cutoff = datetime.now() - timedelta(days=days) if days is not None else None
+    if not os.path.isdir(data_folder):
+        return []
+    
+    live_paths = [os.path.join(data_folder, filename) for filename in os.listdir(data_folder)]
+    by_date = {}
+    for path in list_archived_snapshots(data_folder) + live_paths:
+        filename = snapshot_name(path)
+        match = DAILY_PATTERN.match(snapshot_stem(filename)) if is_snapshot_file(filename) else None
+        if match is None:
+            continue
+        date_str = match.group(1)
+        if cutoff is not None and datetime.strptime(date_str, '%Y-%m-%d') < cutoff:
+            continue
+        by_date[date_str] = path
+    
+    return sorted(by_date.items())
+
+def ensure_day(date_str, snapshot_path, data_folder='data'):
+    """
+    열 저장소 파일이 없거나 스냅샷보다 오래됐으면 스냅샷을 읽어서 다시 만드는 함수
+    
+    반환값: 새로 만들었으면 True
+    """
+    path = columnar_path(date_str, data_folder)
+    if os.path.exists(path) and os.path.getmtime(path) >= snapshot_mtime(snapshot_path):
+        return False
+    
+    items = list(iter_snapshot_items(snapshot_path, fields=tuple(COLUMN_TYPES)))
+    write_day(date_str, items, data_folder)
+    return True
+
+def first_seen_counts(values):
+    """
+    값마다 개수를 세되, 처음 나온 순서대로 돌려주는 함수
+    (파이썬 사전에 하나씩 세어 넣은 것과 같은 순서가 돼요)
+    
+    반환값: [(값, 개수), ...]
+    """
+    if len(values) == 0:
+        return []
+    uniques, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.argsort(first_index, kind='stable')
+    return [(uniques[i].item(), int(counts[i])) for i in order]
+
+if __name__ == "__main__":
+    built = 0
+    snapshots = daily_snapshots()
+    for day, snapshot_file in snapshots:
+        if ensure_day(day, snapshot_file):
+            built += 1
+    print(f"📊 날짜별 스냅샷 {len(snapshots)}개 중 {built}개의 열 저장소를 새로 만들었습니다")
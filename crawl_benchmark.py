@@ -0,0 +1,156 @@
+# 경매 정보 수집(크롤링) 속도를 재는 프로그램이에요
+# 로컬 모의 서버(mock_auction_server.py)를 띄우고 get_combined_auction_data를 여러 번 실행해서
+# 초당 요청 수, 응답 시간(p50/p99), 전체 수집 시간을 알려줘요
+# 마치 새 운동화를 신고 같은 트랙을 여러 번 달려서 기록을 비교하는 것과 같아요!
+#
+# 사용법:
+#   python crawl_benchmark.py                                  # 동시 요청 1, 4, 8개로 비교
+#   python crawl_benchmark.py --in-flight 4,16 --scale 20 --latency-ms 100
+#   python crawl_benchmark.py --error-rate 0.05 --rate-limit 30 --runs 3
+
+import argparse
+import contextlib
+import io
+import threading
+import time
+
+import auction_crawler
+import resilient_http
+import response_cache
+from mock_auction_server import load_corpus, start_mock_server, add_server_arguments, server_options
+
+def percentile(samples, ratio):
+    """
+    정렬된 값들에서 원하는 위치(ratio, 0~1)의 값을 돌려주는 함수
+    """
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, int(round(ratio * (len(samples) - 1))))
+    return samples[index]
+
+def reset_crawler_state(api_url, max_in_flight, client_rate):
+    """
+    매번 같은 조건에서 잴 수 있도록 크롤러의 세션, 속도 조절기, 캐시를 새로 준비하는 함수
+    
+    반환값: 요청 시간을 기록할 목록 (세션의 get이 여기에 초 단위로 기록해요)
+    """
+    
+    # 캐시를 쓰면 두 번째 실행부터는 서버에 요청하지 않으니 꺼둬요
+    response_cache.CACHE_TTL_SECONDS = 0
+    auction_crawler.AUCTION_API_URL = api_url
+    
+    # 서버별 속도 조절기/회로 차단기를 새로 만들어요
+    resilient_http.RATE_PER_SECOND = client_rate
+    resilient_http.RATE_BURST = max(1, int(client_rate))
+    with resilient_http._host_states_lock:
+        resilient_http._host_states.clear()
+    
+    # 동시 요청 수에 맞는 연결 풀로 세션을 새로 만들어요
+    with auction_crawler._http_session_lock:
+        if auction_crawler._http_session is not None:
+            auction_crawler._http_session.close()
+        auction_crawler._http_session = None
+    session = auction_crawler.get_http_session(max_in_flight)
+    
+    latencies = []
+    latencies_lock = threading.Lock()
+    original_get = session.get
+    
+    def timed_get(url, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original_get(url, **kwargs)
+        finally:
+            with latencies_lock:
+                latencies.append(time.perf_counter() - started)
+    
+    session.get = timed_get
+    return latencies
+
+def run_once(api_url, max_in_flight, client_rate, verbose=False):
+    """
+    get_combined_auction_data를 한 번 실행하고 결과를 측정하는 함수
+    
+    반환값: 측정 결과 사전 (requests, seconds, rps, p50_ms, p99_ms, items)
+    """
+    
+    latencies = reset_crawler_state(api_url, max_in_flight, client_rate)
+    
+    output = io.StringIO()
+    redirect = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(output)
+    
+    started = time.perf_counter()
+    with redirect:
+        result = auction_crawler.get_combined_auction_data(concurrent=max_in_flight > 1, max_in_flight=max_in_flight)
+    elapsed = time.perf_counter() - started
+    
+    ordered = sorted(latencies)
+    return {
+        'requests': len(ordered),
+        'seconds': elapsed,
+        'rps': len(ordered) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(ordered, 0.50) * 1000,
+        'p99_ms': percentile(ordered, 0.99) * 1000,
+        'items': len((result or {}).get('data') or [])
+    }
+
+def run_benchmark(in_flight_levels, runs=1, client_rate=1000.0, data_folder='data', scale=1,
+                  verbose=False, **options):
+    """
+    모의 서버를 띄우고 동시 요청 수별로 수집 속도를 재는 함수
+    
+    매개변수 설명:
+    - in_flight_levels: 비교할 동시 요청 수 목록 (예: [1, 4, 8])
+    - runs: 동시 요청 수마다 몇 번씩 잴지
+    - client_rate: 크롤러의 초당 요청 제한 (기본 5개는 속도 측정에 너무 작아서 크게 잡아요)
+    - data_folder / scale: 모의 서버가 돌려줄 데이터
+    - verbose: True면 크롤러의 진행 메시지도 보여줘요
+    - options: 모의 서버 설정 (latency_ms, jitter_ms, error_rate, rate_limit, with_total)
+    
+    반환값: 측정 결과 목록
+    """
+    
+    print("📚 모의 서버용 데이터를 불러오는 중...")
+    corpus = load_corpus(data_folder, scale)
+    server = start_mock_server(corpus, **options)
+    print(f"🧪 모의 서버 실행: {server.api_url} (매물 {len(corpus)}건)")
+    
+    results = []
+    try:
+        for max_in_flight in in_flight_levels:
+            for run in range(runs):
+                measured = run_once(server.api_url, max_in_flight, client_rate, verbose)
+                measured['in_flight'] = max_in_flight
+                measured['run'] = run + 1
+                results.append(measured)
+                print(
+                    f"⏱️ 동시 {max_in_flight:>3}개 #{run + 1}: "
+                    f"{measured['requests']}건 요청, {measured['seconds']:.2f}초, "
+                    f"{measured['rps']:.1f} req/s, p50 {measured['p50_ms']:.1f}ms, "
+                    f"p99 {measured['p99_ms']:.1f}ms, 결과 {measured['items']}건"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='모의 경매 API 서버로 크롤러 속도를 잽니다')
+    parser.add_argument('--in-flight', default='1,4,8', help='비교할 동시 요청 수 (쉼표로 구분)')
+    parser.add_argument('--runs', type=int, default=1, help='동시 요청 수마다 반복할 횟수')
+    parser.add_argument('--client-rate', type=float, default=1000.0, help='크롤러의 초당 요청 제한')
+    parser.add_argument('--verbose', action='store_true', help='크롤러 진행 메시지도 보여주기')
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    levels = [int(level) for level in args.in_flight.split(',') if level.strip()]
+    run_benchmark(
+        levels,
+        runs=args.runs,
+        client_rate=args.client_rate,
+        data_folder=args.data_folder,
+        scale=args.scale,
+        verbose=args.verbose,
+        **server_options(args)
+    )
@@ -133,6 +133,16 @@ function registerEventListeners() {
 function handleInitialDataLoaded(data) {
     console.log('📊 초기 데이터 로드 완료:', data);
     
+    // 목차에서 받은 데이터는 요약과 auction_data.js의 원래 매물 목록으로 먼저 그려요
+    // (auction_data.js가 없으면 목록은 비어 있다가 상세 정보 조각을 다 받은 뒤 dataLoaded 이벤트로 채워지니, 대체 데이터를 받지 않아요)
+    if (data && data.source === 'manifest') {
+        auctionData = data.data || [];
+        filteredData = [...auctionData];
+        isDataLoaded = true;
+        updateDashboard();
+        return;
+    }
+    
     // 데이터가 없는 경우 대체 데이터 로드
     if (!data || !data.data || !Array.isArray(data.data) || data.data.length === 0) {
         console.warn('⚠️ 유효한 데이터가 로드되지 않았습니다. 대체 데이터를 로드합니다.');
@@ -6,6 +6,9 @@ let dashboardData = null; // 로드된 대시보드 데이터
 let dataLoaded = false; // 데이터 로드 완료 여부
 let loadAttempts = 0; // 로드 시도 횟수
 const MAX_LOAD_ATTEMPTS = 3; // 최대 로드 시도 횟수
+const MANIFEST_PATH = 'dashboard_manifest.json'; // 대시보드 목차 파일 (조각 파일 이름이 적혀 있어요)
+const regionDetailRequests = {}; // 지역별 상세 정보 요청 (같은 지역을 두 번 받지 않도록 기억해요)
+const searchShardRequests = {}; // 검색 색인 조각 요청 (조각 경로별로 한 번만 받아요)
 
 // 대시보드 데이터 로드 함수
 function loadDashboardData(callback) {
@@ -53,7 +56,7 @@ function loadDashboardData(callback) {
     loadFromMultipleSources(callback);
 }
 
-// 다중 소스에서 데이터 로드 시도 (Firebase -> 로컬 JSON -> 백업 데이터 -> 전역 변수 -> 샘플 데이터)
+// 다중 소스에서 데이터 로드 시도 (Firebase -> 목차와 조각 -> 로컬 JSON -> 백업 데이터 -> 전역 변수 -> 샘플 데이터)
 function loadFromMultipleSources(callback) {
     console.log('🔄 다중 소스 전략으로 데이터 로드 시도...');
     
@@ -96,25 +99,274 @@ function loadFromMultipleSources(callback) {
                             processLoadedData(data, callback);
                         } else {
                             console.warn('⚠️ Firebase에서 불러온 데이터가 유효하지 않습니다.');
-                            loadFromLocalFile(callback);
+                            loadFromManifest(callback);
                         }
                     } else {
                         console.warn('⚠️ Firebase에서 유효한 데이터를 찾을 수 없습니다.');
-                        loadFromLocalFile(callback);
+                        loadFromManifest(callback);
                     }
                 })
                 .catch(error => {
                     console.error('❌ Firebase 데이터 로드 실패:', error);
-                    loadFromLocalFile(callback);
+                    loadFromManifest(callback);
                 });
         } catch (error) {
             console.error('❌ Firebase 데이터 로드 중 오류 발생:', error);
-            loadFromLocalFile(callback);
+            loadFromManifest(callback);
         }
     } else {
         console.warn('⚠️ Firebase 모듈을 찾을 수 없습니다.');
-        loadFromLocalFile(callback);
+        loadFromManifest(callback);
+    }
+}
+
+// 목차(dashboard_manifest.json)와 조각에서 데이터 로드
+// 목차와 summary 조각만 받으면 먼저 화면을 그리고, 트렌드와 지역별 상세 정보 조각은 뒤이어 받아요
+function loadFromManifest(callback) {
+    console.log('🧩 목차 파일에서 데이터 로드 시도...');
+    
+    // 로딩 상태 표시
+    const loadingStatus = document.getElementById('loadingStatus');
+    if (loadingStatus) {
+        loadingStatus.textContent = '대시보드 목차를 불러오는 중...';
+    }
+    
+    // 목차는 매번 새로 받아요 (조각 이름이 바뀌었는지 알아야 하니까요)
+    const timestamp = new Date().getTime();
+    
+    fetch(`${MANIFEST_PATH}?_=${timestamp}`, {
+        headers: {
+            'Cache-Control': 'no-cache'
+        }
+    })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`목차 파일을 불러올 수 없습니다: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(manifest => {
+            if (!manifest || !manifest.summary || !Array.isArray(manifest.details)) {
+                throw new Error('목차 파일 형식이 잘못되었습니다.');
+            }
+            return fetchShard(manifest.summary).then(summary => ({ manifest, summary }));
+        })
+        .then(({ manifest, summary }) => {
+            console.log(`✅ 목차와 요약 조각 로드 성공! (상세 정보 ${manifest.detail_count}개는 이어서 받아요)`);
+            
+            // 목록과 상세 보기는 원래 매물(auction_data.js)을 그대로 써요 (매각명세서 링크 같은 항목이 모두 있어요)
+            const rawItems = rawAuctionItems();
+            const data = Object.assign({}, summary, {
+                data: rawItems || [],
+                manifest: manifest,
+                last_updated: manifest.last_updated,
+                detailsLoaded: false,
+                source: 'manifest',
+                loadedAt: new Date().toISOString()
+            });
+            if (data.basic_stats) {
+                data.basic_stats = Object.assign({}, data.basic_stats, { last_updated: manifest.last_updated });
+            }
+            
+            // 요약만으로 먼저 화면을 그려요
+            processLoadedData(data, callback);
+            loadManifestDetails(data);
+        })
+        .catch(error => {
+            console.warn('⚠️ 목차 파일 로드 실패, 하나로 된 JSON 파일을 찾습니다:', error);
+            loadFromLocalFile(callback);
+        });
+}
+
+// 조각 파일 하나 받기 (이름에 내용 지문이 있어서 브라우저 캐시를 그대로 써요)
+function fetchShard(path) {
+    return fetch(path).then(response => {
+        if (!response.ok) {
+            throw new Error(`조각 파일을 불러올 수 없습니다: ${path} (${response.status})`);
+        }
+        return response.json();
+    });
+}
+
+// 한 지역의 상세 정보 페이지들을 받아서 하나의 목록으로 돌려주기
+function loadRegionDetails(region) {
+    const manifest = dashboardData && dashboardData.manifest;
+    if (!manifest) {
+        return Promise.resolve([]);
+    }
+    
+    if (!regionDetailRequests[region]) {
+        const entry = manifest.details.find(detail => detail.region === region);
+        const pages = entry ? entry.pages : [];
+        regionDetailRequests[region] = Promise.all(pages.map(fetchShard))
+            .then(pageRecords => [].concat(...pageRecords))
+            .catch(error => {
+                // 실패한 요청은 잊어서 다음에 다시 받을 수 있게 해요
+                delete regionDetailRequests[region];
+                throw error;
+            });
+    }
+    return regionDetailRequests[region];
+}
+
+// 트렌드와 모든 지역의 상세 정보 조각을 받아서 대시보드 데이터를 채우기
+function loadManifestDetails(data) {
+    const manifest = data.manifest;
+    const regionRequests = manifest.details.map(entry => loadRegionDetails(entry.region));
+    
+    Promise.all([fetchShard(manifest.trends), Promise.all(regionRequests)])
+        .then(([trends, regionRecords]) => {
+            // 그 사이에 다른 데이터로 바뀌었으면 무시해요
+            if (dashboardData !== data) {
+                return;
+            }
+            
+            data.trend_analysis = trends;
+            data.detailed_auction_data = [].concat(...regionRecords);
+            // 원래 매물이 없을 때만 상세 정보로 목록을 만들어요 (상세 정보에는 없는 항목이 있어요)
+            data.data = rawAuctionItems() || data.detailed_auction_data.map(detailToAuctionItem);
+            data.detailsLoaded = true;
+            
+            console.log(`✅ 상세 정보 조각 로드 완료! (${data.data.length}개 항목)`);
+            document.dispatchEvent(new CustomEvent('dataLoaded', { detail: data }));
+            document.dispatchEvent(new CustomEvent('auctionDataLoaded', { detail: data }));
+        })
+        .catch(error => {
+            console.error('❌ 상세 정보 조각 로드 실패:', error);
+        });
+}
+
+// auction_data.js가 넣어둔 원래 매물 목록 (없으면 null)
+function rawAuctionItems() {
+    if (window.auctionData && Array.isArray(window.auctionData.data) && window.auctionData.data.length > 0) {
+        return window.auctionData.data;
+    }
+    return null;
+}
+
+// 상세 정보를 화면에서 쓰는 매물 모양(경매 데이터 필드 이름)으로 바꾸기
+// (auction_data.js가 없을 때만 써요 - specpdfurl 같은 원래 항목은 상세 정보에 없어요)
+function detailToAuctionItem(record) {
+    return Object.assign({}, record, {
+        maemulinfo: record.property_type,
+        minprice: record.minprice_num,
+        estimatedprice: record.appraisal_price_num,
+        court: record.court_name,
+        auctiondate: record.auction_date,
+        auctioncount: record.auction_count_num
+    });
+}
+
+// uid 목록(가격대별 uids 등)에 해당하는 상세 정보 찾기 (상세 정보 조각을 다 받은 뒤에 써요)
+function getItemsByUids(uids) {
+    if (!dashboardData || !Array.isArray(dashboardData.detailed_auction_data)) {
+        return [];
+    }
+    if (!dashboardData.detailsByUid) {
+        dashboardData.detailsByUid = {};
+        dashboardData.detailed_auction_data.forEach(record => {
+            dashboardData.detailsByUid[record.uid] = record;
+        });
     }
+    return uids.map(uid => dashboardData.detailsByUid[uid]).filter(Boolean);
+}
+
+// 검색창 글자를 검색어(두 글자 조각)로 바꾸기 (search_index.py의 query_terms와 같은 규칙이에요)
+// 한 글자 토큰은 그대로 검색어가 돼요 (색인에 글자 하나하나도 들어 있어서 긴 토큰 가운데 글자도 찾아요)
+function searchQueryTerms(query, gramSize) {
+    const tokens = String(query || '').normalize('NFKC').toLowerCase().match(/[0-9a-z가-힣]+/g) || [];
+    const terms = [];
+    tokens.forEach(token => {
+        const tokenTerms = [];
+        if (token.length <= gramSize) {
+            tokenTerms.push(token);
+        } else {
+            for (let start = 0; start + gramSize <= token.length; start++) {
+                tokenTerms.push(token.slice(start, start + gramSize));
+            }
+        }
+        tokenTerms.forEach(term => {
+            if (!terms.includes(term)) {
+                terms.push(term);
+            }
+        });
+    });
+    return terms;
+}
+
+// 검색어가 들어 있는 조각 이름 (앞 글자들의 유니코드 번호를 16진수로, search_index.py의 shard_key와 같아요)
+function searchShardKey(term, prefixLength) {
+    return Array.from(term.slice(0, prefixLength)).map(char => char.codePointAt(0).toString(16)).join('-');
+}
+
+// 검색 조각 하나 받기 (조각 경로별로 한 번만 받아요)
+function fetchSearchShard(path) {
+    if (!searchShardRequests[path]) {
+        searchShardRequests[path] = fetchShard(path).catch(error => {
+            // 실패한 요청은 잊어서 다음에 다시 받을 수 있게 해요
+            delete searchShardRequests[path];
+            throw error;
+        });
+    }
+    return searchShardRequests[path];
+}
+
+// 차이 목록을 매물 번호 목록으로 바꾸기
+function decodePostings(gaps) {
+    const docIds = new Array(gaps.length);
+    let current = 0;
+    for (let i = 0; i < gaps.length; i++) {
+        current += gaps[i];
+        docIds[i] = current;
+    }
+    return docIds;
+}
+
+// 입력한 글자가 모두 들어 있는 매물 uid 찾기 (매물을 하나씩 훑지 않고 검색 색인 조각 몇 개만 받아요)
+// 사용법: dataLoader.searchListings('강남 아파트').then(uids => dataLoader.getItemsByUids(uids))
+function searchListings(query) {
+    const indexPath = dashboardData && dashboardData.manifest && dashboardData.manifest.search;
+    if (!indexPath) {
+        return Promise.reject(new Error('검색 색인이 없습니다. (목차에 search 항목이 없어요)'));
+    }
+    
+    // 목차에는 search-index 조각 경로만 있어요 (역색인 조각 목록은 그 조각 안에 있어요)
+    return fetchSearchShard(indexPath).then(search => searchWithIndex(search, query));
+}
+
+// search-index 조각 내용으로 검색하기
+function searchWithIndex(search, query) {
+    const terms = searchQueryTerms(query, search.gram_size);
+    if (terms.length === 0) {
+        return Promise.resolve([]);
+    }
+    
+    // 조각이 없는 검색어가 하나라도 있으면 찾을 매물이 없어요
+    const paths = terms.map(term => search.shards[searchShardKey(term, search.prefix_length)]);
+    if (paths.some(path => !path)) {
+        return Promise.resolve([]);
+    }
+    
+    return Promise.all([fetchSearchShard(search.docs), Promise.all(paths.map(fetchSearchShard))])
+        .then(([uids, shards]) => {
+            const postingLists = [];
+            for (let i = 0; i < terms.length; i++) {
+                const gaps = shards[i][terms[i]];
+                if (!gaps || gaps.length === 0) {
+                    return [];
+                }
+                postingLists.push(decodePostings(gaps));
+            }
+            
+            // 가장 짧은 목록부터 맞춰봐요
+            postingLists.sort((a, b) => a.length - b.length);
+            let matches = postingLists[0];
+            for (let i = 1; i < postingLists.length && matches.length > 0; i++) {
+                const docIds = new Set(postingLists[i]);
+                matches = matches.filter(docId => docIds.has(docId));
+            }
+            return matches.map(docId => uids[docId]);
+        });
 }
 
 // 로컬 JSON 파일에서 데이터 로드
@@ -489,6 +741,10 @@ window.dataLoader = {
     loadDashboardData,
     getDashboardData: () => dashboardData,
     isDataLoaded: () => dataLoaded,
+    loadRegionDetails,
+    fetchShard,
+    getItemsByUids,
+    searchListings,
     reloadData: () => {
         dataLoaded = false;
         loadAttempts = 0;
@@ -11,6 +11,11 @@ let kakaoMapApiKey = "f6c0b2ac0e6b2a2fb9e32183cc3e8939"; // 카카오맵 API 키
 let kakaoMapLoadRetries = 0; // API 로드 재시도 횟수
 const MAX_RETRIES = 3; // 최대 재시도 횟수
 let isFallbackShown = false; // 대체 UI가 표시되었는지 여부
+let spatialMode = false; // 미리 묶어둔 지도 조각(목차의 map 항목)으로 표시 중인지 여부
+let spatialOverlays = []; // 지도 조각으로 그린 묶음과 매물 점들
+let spatialBlockRequests = {}; // 받은(받는 중인) 지도 조각 (조각 경로별, map-index 조각도 여기에 기억해요)
+let spatialRequestId = 0; // 가장 최근 지도 조각 요청 번호 (늦게 온 예전 결과는 버려요)
+let spatialIdleListenerAdded = false; // 지도 이동 이벤트를 등록했는지 여부
 
 // 카카오 지도 API 로드
 function loadKakaoMapAPI() {
@@ -331,6 +336,14 @@ function displayPropertiesOnMap(properties) {
         // 클러스터러 비우기
         clusterer.clear();
         
+        // 목차에 지도 묶음이 있고 필터로 줄이지 않은 목록이면, 전체 매물 대신 보이는 구역의 묶음 조각만 받아서 그려요
+        if (shouldUseSpatialIndex(properties)) {
+            console.log('🧩 미리 묶어둔 지도 조각으로 매물을 표시합니다.');
+            showSpatialClusters();
+            return;
+        }
+        hideSpatialClusters();
+        
         if (!properties || properties.length === 0) {
             console.log('⚠️ 표시할 매물이 없습니다.');
             return;
@@ -418,6 +431,188 @@ function displayPropertiesOnMap(properties) {
     }
 }
 
+// 목차의 지도 묶음 색인 조각 경로 (dashboard_manifest.json의 map 항목, 없으면 null)
+function getSpatialIndexPath() {
+    const data = window.dataLoader && window.dataLoader.getDashboardData();
+    return data && data.manifest && data.manifest.map ? data.manifest.map : null;
+}
+
+// 지도 묶음 색인(map-index 조각) 받기 - 확대 수준별 구역 조각 목록이 들어 있어요
+function loadSpatialIndex() {
+    const path = getSpatialIndexPath();
+    return path ? fetchSpatialBlock(path) : Promise.resolve(null);
+}
+
+// 미리 묶어둔 지도 조각을 쓸지 정하기 (필터로 줄인 목록이면 그 매물만 직접 표시해요)
+function shouldUseSpatialIndex(properties) {
+    if (!getSpatialIndexPath() || typeof window.dataLoader.fetchShard !== 'function') {
+        return false;
+    }
+    const data = window.dataLoader.getDashboardData();
+    if (!data.detailsLoaded) {
+        return true;
+    }
+    return !properties || properties.length >= (data.data || []).length;
+}
+
+// 지금 확대 수준에 맞는 층 고르기 (많이 확대하면 매물 점, 아니면 가장 가까운 묶음 수준)
+function spatialLayerFor(spatialIndex, level) {
+    if (level <= spatialIndex.point_level) {
+        return { layer: spatialIndex.points, isPoints: true };
+    }
+    const levels = Object.keys(spatialIndex.levels).map(Number).sort((a, b) => a - b);
+    const chosen = levels.find(candidate => candidate >= level) || levels[levels.length - 1];
+    return { layer: spatialIndex.levels[chosen], isPoints: false };
+}
+
+// 화면에 보이는 구역 이름들 (조각이 있는 구역만)
+function visibleBlockKeys(layer, blockCells) {
+    const bounds = map.getBounds();
+    const southWest = bounds.getSouthWest();
+    const northEast = bounds.getNorthEast();
+    const blockDegrees = layer.cell_degrees * blockCells;
+    
+    const keys = [];
+    for (let row = Math.floor(southWest.getLat() / blockDegrees); row <= Math.floor(northEast.getLat() / blockDegrees); row++) {
+        for (let col = Math.floor(southWest.getLng() / blockDegrees); col <= Math.floor(northEast.getLng() / blockDegrees); col++) {
+            const key = `${row}_${col}`;
+            if (layer.blocks[key]) {
+                keys.push(key);
+            }
+        }
+    }
+    return keys;
+}
+
+// 구역 조각 하나 받기 (한 번 받은 조각은 다시 요청하지 않아요)
+function fetchSpatialBlock(path) {
+    if (!spatialBlockRequests[path]) {
+        spatialBlockRequests[path] = window.dataLoader.fetchShard(path).catch(error => {
+            // 실패한 요청은 잊어서 다음에 다시 받을 수 있게 해요
+            delete spatialBlockRequests[path];
+            throw error;
+        });
+    }
+    return spatialBlockRequests[path];
+}
+
+// 묶음에 적을 가격 (원 단위를 억/만 단위로 짧게)
+function formatClusterPrice(won) {
+    if (!won) return '';
+    if (won >= 100000000) {
+        return `${(won / 100000000).toFixed(1)}억`;
+    }
+    return `${Math.round(won / 10000).toLocaleString()}만`;
+}
+
+// 지도에 그린 묶음과 매물 점 지우기
+function clearSpatialOverlays() {
+    spatialOverlays.forEach(overlay => overlay.setMap(null));
+    spatialOverlays = [];
+}
+
+// 묶음 하나를 숫자와 중앙값이 적힌 동그라미로 그리기 (누르면 그 자리로 확대해요)
+function createClusterOverlay(cell) {
+    const position = new kakao.maps.LatLng(cell.lat, cell.lng);
+    const size = Math.min(72, 36 + Math.round(Math.log10(cell.count) * 12));
+    
+    const content = document.createElement('div');
+    content.className = 'map-cluster';
+    content.style.cssText = `width: ${size}px; height: ${size}px; border-radius: 50%; background: rgba(59, 130, 246, 0.8); color: #fff; display: flex; flex-direction: column; align-items: center; justify-content: center; font-weight: bold; font-size: 12px; line-height: 1.1; cursor: pointer;`;
+    content.title = `매물 ${cell.count}개 · 최저가 중앙값 ${formatClusterPrice(cell.p50) || '정보 없음'}`;
+    content.innerHTML = `<span>${cell.count.toLocaleString()}</span><span style="font-size: 10px; font-weight: normal;">${formatClusterPrice(cell.p50)}</span>`;
+    content.addEventListener('click', function() {
+        map.setLevel(Math.max(1, map.getLevel() - 2), { anchor: position });
+    });
+    
+    return new kakao.maps.CustomOverlay({ position: position, content: content, yAnchor: 0.5 });
+}
+
+// 매물 점 하나를 마커로 그리기 (누르면 정보창을 보여줘요)
+function createPointMarker(point) {
+    const marker = new kakao.maps.Marker({
+        position: new kakao.maps.LatLng(point.lat, point.lng),
+        title: point.address
+    });
+    
+    kakao.maps.event.addListener(marker, 'click', function() {
+        if (!infowindow) {
+            infowindow = new kakao.maps.InfoWindow({ removable: true });
+        }
+        infowindow.setContent(`
+            <div class="info-window">
+                <div class="info-title">${point.address || '주소 없음'}</div>
+                <div class="info-body">
+                    <div class="info-row"><span class="info-label">종류:</span> ${point.property_type || '정보 없음'}</div>
+                    <div class="info-row"><span class="info-label">최저가:</span> ${formatClusterPrice(point.minprice) || '정보 없음'}</div>
+                    <div class="info-row"><span class="info-label">경매일:</span> ${formatDate(point.auction_date)}</div>
+                </div>
+            </div>
+        `);
+        infowindow.open(map, marker);
+    });
+    
+    return marker;
+}
+
+// 지금 보이는 구역의 묶음(또는 매물 점) 조각만 받아서 그리기
+function refreshSpatialClusters() {
+    if (!spatialMode || !getSpatialIndexPath()) {
+        return;
+    }
+    
+    const requestId = ++spatialRequestId;
+    let layerInfo = null;
+    let paths = [];
+    
+    loadSpatialIndex()
+        .then(spatialIndex => {
+            if (!spatialIndex) {
+                return [];
+            }
+            layerInfo = spatialLayerFor(spatialIndex, map.getLevel());
+            paths = visibleBlockKeys(layerInfo.layer, spatialIndex.block_cells).map(key => layerInfo.layer.blocks[key]);
+            return Promise.all(paths.map(fetchSpatialBlock));
+        })
+        .then(blocks => {
+            // 그 사이에 지도를 또 움직였으면 이번 결과는 버려요
+            if (requestId !== spatialRequestId || !spatialMode || !layerInfo) {
+                return;
+            }
+            const isPoints = layerInfo.isPoints;
+            clearSpatialOverlays();
+            blocks.forEach(block => {
+                block.forEach(entry => {
+                    const overlay = isPoints ? createPointMarker(entry) : createClusterOverlay(entry);
+                    overlay.setMap(map);
+                    spatialOverlays.push(overlay);
+                });
+            });
+            console.log(`🧩 지도 조각 ${paths.length}개로 ${isPoints ? '매물' : '묶음'} ${spatialOverlays.length}개를 표시했습니다.`);
+        })
+        .catch(error => {
+            console.error('❌ 지도 묶음 조각 로드 실패:', error);
+        });
+}
+
+// 미리 묶어둔 지도 조각으로 표시 시작
+function showSpatialClusters() {
+    spatialMode = true;
+    if (!spatialIdleListenerAdded) {
+        // 지도를 움직이거나 확대/축소를 마칠 때마다 보이는 구역만 다시 받아요
+        kakao.maps.event.addListener(map, 'idle', refreshSpatialClusters);
+        spatialIdleListenerAdded = true;
+    }
+    refreshSpatialClusters();
+}
+
+// 미리 묶어둔 지도 조각 표시 그만두기
+function hideSpatialClusters() {
+    spatialMode = false;
+    spatialRequestId++;
+    clearSpatialOverlays();
+}
+
 // 가격 포맷 함수
 function formatPrice(price) {
     if (!price) return '정보 없음';
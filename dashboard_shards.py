@@ -0,0 +1,223 @@
+# 대시보드 데이터를 작은 조각(shard)으로 나눠서 저장하는 도구예요
+# 한 덩어리 dashboard_data.json 대신, 목차(dashboard_manifest.json)와 내용 지문이 이름에 붙은 조각들로 나눠요
+# - summary: 기본 통계, 지역별/가격대별/종류별 통계 (첫 화면에 필요한 것만, 매물 목록은 uid로만 적어요)
+# - trends: 트렌드 분석
+# - details: 지역별 상세 정보 페이지
+# - sample: 예전 화면과의 호환을 위한 매물 샘플
+# - map: 지도 묶음 구역과 매물 점 구역 (map_clusters가 만든 공간 색인이 있을 때만)
+#   구역 조각 목록은 map-index 조각에 적고, 목차에는 그 조각 경로 하나만 적어요 (매물이 늘어도 목차는 작게)
+# - search: 검색어 첫 글자별 역색인과 매물 번호표 (search_index가 만든 검색 색인이 있을 때만)
+#   역색인 조각 목록은 search-index 조각에 적고, 목차에는 그 조각 경로 하나만 적어요
+# 조각 이름에 내용 지문이 들어 있어서 내용이 같으면 이름도 같아요. 브라우저는 목차만 매번 새로 받고,
+# 조각은 한 번 받으면 계속 다시 써요. 압축은 웹 서버(Firebase Hosting)가 보낼 때 해줘서 따로 압축 파일을 만들지 않아요
+# 이번에 쓰지 않은 예전 조각은 지워서, 조각 폴더에는 지금 목차가 가리키는 조각만 남아요
+# 마치 두꺼운 책을 목차와 얇은 분책으로 나눠서, 바뀐 분책만 새로 사면 되게 하는 것과 같아요!
+#
+# 사용법:
+#   manifest = write_dashboard_shards(dashboard_data)   # dashboard/dashboard_manifest.json과 dashboard/shards/*
+
+import hashlib
+import os
+
+import json_codec
+
+# 목차 파일 이름이에요 (이 파일만 캐시하지 않아요)
+MANIFEST_FILENAME = 'dashboard_manifest.json'
+
+# 조각을 넣을 폴더 이름이에요 (대시보드 폴더 안)
+SHARD_DIRNAME = 'shards'
+
+# 목차 모양이 바뀌면 올려주세요 (대시보드 화면이 보고 읽는 방법을 정해요)
+MANIFEST_VERSION = 1
+
+# 상세 정보 한 페이지에 넣을 매물 수예요
+DETAIL_PAGE_SIZE = int(os.getenv('AUCTION_DETAIL_PAGE_SIZE', '200'))
+
+# 조각 이름에 붙일 지문 길이예요
+DIGEST_LENGTH = 12
+
+def summary_document(dashboard_data):
+    """
+    첫 화면에 필요한 통계만 모은 조각을 만드는 함수
+    가격대별 매물 목록은 상세 정보와 겹치니 uid 목록(uids)으로 바꿔요
+    만든 시각(last_updated)은 목차에만 적어서, 통계가 그대로면 조각 이름도 그대로예요
+    """
+    basic_stats = {key: value for key, value in dashboard_data.get('basic_stats', {}).items() if key != 'last_updated'}
+    
+    price_analysis = {}
+    for range_name, range_info in dashboard_data.get('price_analysis', {}).items():
+        compact_range = {key: value for key, value in range_info.items() if key != 'items'}
+        compact_range['uids'] = [item.get('uid', '') for item in range_info.get('items', [])]
+        price_analysis[range_name] = compact_range
+    
+    return {
+        'basic_stats': basic_stats,
+        'region_analysis': dashboard_data.get('region_analysis', {}),
+        'price_analysis': price_analysis,
+        'property_analysis': dashboard_data.get('property_analysis', {})
+    }
+
+def detail_pages(detailed_auction_data, page_size=DETAIL_PAGE_SIZE):
+    """
+    상세 정보를 지역별로 나누고, 지역마다 page_size개씩 페이지로 자르는 함수
+    
+    반환값: [(지역, [페이지(상세 정보 목록), ...]), ...] (지역이 처음 나온 순서대로)
+    """
+    by_region = {}
+    for record in detailed_auction_data:
+        by_region.setdefault(record.get('region', '알 수 없음'), []).append(record)
+    
+    page_size = max(1, page_size)
+    return [
+        (region, [records[start:start + page_size] for start in range(0, len(records), page_size)])
+        for region, records in by_region.items()
+    ]
+
+def write_shard(shard_folder, name, document):
+    """
+    조각 하나를 내용 지문이 붙은 이름으로 저장하는 함수 (같은 내용이 이미 있으면 다시 쓰지 않아요)
+    
+    매개변수 설명:
+    - shard_folder: 조각 폴더
+    - name: 조각 종류 이름 (예: 'summary', 'details-00-00')
+    - document: 저장할 내용
+    
+    반환값: 조각 파일 이름 (예: 'summary.1a2b3c4d5e6f.json')
+    """
+    content = json_codec.dumps_bytes(document)
+    digest = hashlib.sha256(content).hexdigest()[:DIGEST_LENGTH]
+    filename = f"{name}.{digest}.json"
+    path = os.path.join(shard_folder, filename)
+    
+    if not os.path.exists(path):
+        # 임시 파일에 먼저 쓰고 바꿔치기해서, 쓰는 도중에 읽혀도 깨지지 않게 해요
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    return filename
+
+def remove_stale_shards(shard_folder, keep_filenames):
+    """
+    목차에 없는 예전 조각을 지우고, 지운 파일 수를 돌려줘요
+    예전에 만들던 미리 압축한 파일(.gz, .br)과 남은 임시 파일도 함께 지워요
+    """
+    removed = 0
+    for filename in os.listdir(shard_folder):
+        if filename in keep_filenames:
+            continue
+        os.remove(os.path.join(shard_folder, filename))
+        removed += 1
+    return removed
+
+def map_manifest(map_index, shard_path):
+    """
+    공간 색인의 구역마다 조각을 쓰고, 구역 조각 목록을 map-index 조각으로 쓰는 함수
+    
+    map-index 조각 내용: {'point_level', 'block_cells', 'count',
+             'levels': {수준: {'cell_degrees', 'blocks': {구역: 조각 경로}}},
+             'points': {'cell_degrees', 'blocks': {구역: 조각 경로}}}
+    
+    반환값: 목차에 넣을 map-index 조각 경로
+    """
+    def layer(name, layer_index):
+        return {
+            'cell_degrees': layer_index['cell_degrees'],
+            'blocks': {
+                key: shard_path(f"{name}-{key}", block)
+                for key, block in sorted(layer_index['blocks'].items())
+            }
+        }
+    
+    return shard_path('map-index', {
+        'point_level': map_index['point_level'],
+        'block_cells': map_index['block_cells'],
+        'count': map_index['count'],
+        'levels': {
+            str(level): layer(f"map{level:02d}", level_index)
+            for level, level_index in sorted(map_index['levels'].items())
+        },
+        'points': layer('points', map_index['points'])
+    })
+
+def search_manifest(search_index, shard_path):
+    """
+    검색 색인의 조각들을 쓰고, 조각 목록을 search-index 조각으로 쓰는 함수
+    
+    search-index 조각 내용: {'gram_size', 'prefix_length', 'doc_count', 'docs': 매물 번호표 조각 경로,
+             'shards': {조각 이름: 조각 경로}}
+    
+    반환값: 목차에 넣을 search-index 조각 경로
+    """
+    return shard_path('search-index', {
+        'gram_size': search_index['gram_size'],
+        'prefix_length': search_index['prefix_length'],
+        'doc_count': len(search_index['uids']),
+        'docs': shard_path('search-docs', search_index['uids']),
+        'shards': {
+            key: shard_path(f"search-{key}", terms)
+            for key, terms in sorted(search_index['shards'].items())
+        }
+    })
+
+def write_dashboard_shards(dashboard_data, dashboard_folder='dashboard', page_size=DETAIL_PAGE_SIZE, map_index=None,
+                           search_index=None):
+    """
+    대시보드 데이터를 목차와 조각들로 나눠서 저장하는 함수
+    목차는 조각을 모두 쓴 다음에 마지막으로 바꿔서, 목차가 없는 조각을 가리키는 일이 없어요
+    
+    매개변수 설명:
+    - dashboard_data: generate_dashboard_data가 만든 대시보드 데이터
+    - dashboard_folder: 대시보드 폴더 (목차는 여기, 조각은 그 안의 shards 폴더에 저장해요)
+    - page_size: 상세 정보 한 페이지에 넣을 매물 수
+    - map_index: map_clusters.build_spatial_index가 만든 공간 색인 (없으면 지도 항목을 빼요)
+    - search_index: search_index.build_search_index가 만든 검색 색인 (없으면 검색 항목을 빼요)
+    
+    반환값: 목차 사전
+    """
+    shard_folder = os.path.join(dashboard_folder, SHARD_DIRNAME)
+    os.makedirs(shard_folder, exist_ok=True)
+    written = set()
+    
+    def shard_path(name, document):
+        # 목차에는 대시보드 폴더 기준 경로를 적어요 (브라우저가 그대로 요청할 수 있게)
+        # 이번에 쓴 조각은 모두 기억해뒀다가, 나머지 예전 조각을 지울 때 남겨요
+        filename = write_shard(shard_folder, name, document)
+        written.add(filename)
+        return f"{SHARD_DIRNAME}/{filename}"
+    
+    detailed_auction_data = dashboard_data.get('detailed_auction_data', [])
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'last_updated': dashboard_data.get('basic_stats', {}).get('last_updated'),
+        'total_count': dashboard_data.get('basic_stats', {}).get('total_count', 0),
+        'detail_count': len(detailed_auction_data),
+        'summary': shard_path('summary', summary_document(dashboard_data)),
+        'trends': shard_path('trends', dashboard_data.get('trend_analysis', {})),
+        'sample': shard_path('sample', dashboard_data.get('raw_data_sample', [])),
+        'details': []
+    }
+    
+    for region_index, (region, pages) in enumerate(detail_pages(detailed_auction_data, page_size)):
+        manifest['details'].append({
+            'region': region,
+            'count': sum(len(page) for page in pages),
+            'pages': [
+                shard_path(f"details-{region_index:02d}-{page_index:02d}", page)
+                for page_index, page in enumerate(pages)
+            ]
+        })
+    
+    if map_index is not None:
+        manifest['map'] = map_manifest(map_index, shard_path)
+    if search_index is not None:
+        manifest['search'] = search_manifest(search_index, shard_path)
+    
+    manifest_path = os.path.join(dashboard_folder, MANIFEST_FILENAME)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(json_codec.dumps_bytes(manifest, indent=2))
+    os.replace(temp_path, manifest_path)
+    
+    remove_stale_shards(shard_folder, written)
+    return manifest
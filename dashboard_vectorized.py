@@ -0,0 +1,258 @@
+# 대시보드 분석을 NumPy/pandas로 "한꺼번에" 계산하는 도구예요
+# 매물을 한 건씩 꺼내 더하는 대신, 매물 목록을 열(배열)로 한 번 바꿔두고
+# 글자 항목은 pandas로 번호를 붙인 다음, 지역별/가격대별/매물 종류별 통계와 트렌드를 배열 계산으로 구해요
+# 결과는 dashboard_data.py의 기존 계산과 글자 하나까지 똑같아요
+# 마치 계산기를 한 번씩 두드리는 대신 엑셀 피벗 테이블로 한 번에 정리하는 것과 같아요!
+#
+# pandas(와 NumPy)가 설치되어 있지 않거나, 값 모양이 표로 바꾸기 어려우면(가격이 숫자가 아닌 경우 등)
+# None을 돌려주고, 부르는 쪽은 기존 파이썬 계산을 써요
+# 환경 변수 AUCTION_ANALYTICS_BACKEND로 고를 수 있어요: auto(기본값, 있으면 pandas) / pandas / python
+
+import os
+
+from auction_aggregate import PRICE_RANGES
+from price_sketch import QuantileSketch
+
+# pandas는 NumPy 위에서 돌아가서, 둘 중 하나라도 없으면 기존 파이썬 계산을 써요
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+ANALYTICS_BACKEND = os.getenv('AUCTION_ANALYTICS_BACKEND', 'auto')
+
+# 표로 바꿀 매물 항목과, 항목이 없을 때 쓸 기본값이에요
+# (subregion은 지역 분석에서는 '상세지역없음', 가격대 분석에서는 ''가 기본값인데 둘 다 "상세 지역 없음"으로 같게 다뤄져요)
+FRAME_DEFAULTS = {
+    'region': '알 수 없음',
+    'subregion': '',
+    'maemulinfo': '알 수 없음',
+    'minprice': 0,
+    'frontaddress': '',
+    'uid': ''
+}
+
+_ZERO_PRICES = {'avg_price': 0, 'min_price': 0, 'max_price': 0, **QuantileSketch().percentiles()}
+
+def use_vectorized(backend=None):
+    """
+    pandas로 계산할지 정하는 함수
+    
+    반환값: pandas로 계산하면 True
+    """
+    backend = backend or ANALYTICS_BACKEND
+    if backend == 'python':
+        return False
+    if pd is None:
+        if backend == 'pandas':
+            print("⚠️ pandas/NumPy가 설치되어 있지 않아서 기본 계산을 씁니다 (pip install pandas numpy)")
+        return False
+    return True
+
+def _all_strings(values):
+    return pd.api.types.infer_dtype(values, skipna=False) in ('string', 'empty')
+
+def _factorize(values):
+    """값마다 번호를 붙여요 (처음 나온 순서대로 0, 1, 2, ...) - 반환값: (번호 배열, 값 목록)"""
+    codes, uniques = pd.factorize(values, sort=False)
+    return codes.astype(np.int64), uniques.tolist()
+
+class ItemColumns:
+    """
+    매물 목록을 한 번 바꿔둔 열(배열) 묶음이에요
+    글자 항목은 번호(code)로 바꿔두고, 번호 → 글자 목록(labels)을 따로 가지고 있어요
+    번호는 처음 나온 순서대로 붙어서, 번호 순서가 곧 기존 계산의 사전 순서와 같아요
+    """
+    
+    def __init__(self, codes, labels, minprice, passthrough):
+        self.codes = codes
+        self.labels = labels
+        self.minprice = minprice
+        self.positive = minprice > 0
+        # 주소와 uid는 계산하지 않고 그대로 옮기기만 해서, 원래 값 목록 그대로 둬요
+        self.passthrough = passthrough
+    
+    def __len__(self):
+        return len(self.minprice)
+
+def items_frame(items):
+    """
+    매물 목록을 분석용 열 묶음(ItemColumns)으로 바꾸는 함수
+    
+    반환값: ItemColumns (글자여야 하는 항목에 글자가 아닌 값이 있거나, 가격이 정수가 아니면 None)
+    """
+    columns = {
+        name: [item.get(name, default) for item in items]
+        for name, default in FRAME_DEFAULTS.items()
+    }
+    for name in ('region', 'subregion', 'maemulinfo'):
+        if not _all_strings(columns[name]):
+            return None
+    
+    minprice = np.array(columns['minprice'])
+    if len(items) and minprice.dtype.kind != 'i':
+        return None
+    
+    codes, labels = {}, {}
+    for name in ('region', 'subregion', 'maemulinfo'):
+        codes[name], labels[name] = _factorize(np.array(columns[name], dtype=object))
+    return ItemColumns(
+        codes, labels, minprice.astype(np.int64),
+        {'frontaddress': columns['frontaddress'], 'uid': columns['uid']}
+    )
+
+def _pair_codes(left, right, right_size):
+    """두 번호를 묶은 쌍에 번호를 붙여요 - 반환값: (쌍 번호 배열, [(왼쪽 번호, 오른쪽 번호), ...])"""
+    pair_codes, pairs = _factorize(left * right_size + right)
+    return pair_codes, [divmod(pair, right_size) for pair in pairs]
+
+def _group_counts(codes, size):
+    return np.bincount(codes, minlength=size).tolist()
+
+def _price_summaries(codes, size, columns):
+    """
+    0보다 큰 가격만으로 번호별 평균/최소/최대 가격과 백분위수(p10/p50/p90)를 구해요
+    
+    반환값: 번호 순서대로 {'avg_price', 'min_price', 'max_price', 'p10', 'p50', 'p90'} 목록 (가격이 없는 번호는 모두 0)
+    """
+    summaries = [_ZERO_PRICES] * size
+    codes = codes[columns.positive]
+    if len(codes) == 0:
+        return summaries
+    
+    # 번호순으로 정렬해서 같은 번호끼리 붙여두고, 구간마다 합/최소/최대를 한 번에 구해요
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    sorted_prices = columns.minprice[columns.positive][order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    counts = np.diff(np.r_[starts, len(sorted_codes)])
+    totals = np.add.reduceat(sorted_prices, starts)
+    lows = np.minimum.reduceat(sorted_prices, starts)
+    highs = np.maximum.reduceat(sorted_prices, starts)
+    
+    # 안정 정렬이라 번호 안에서는 원래 매물 순서 그대로라서, 스케치도 한 건씩 더한 것과 똑같아요
+    price_values = sorted_prices.tolist()
+    for code, start, count, total, low, high in zip(
+        sorted_codes[starts].tolist(), starts.tolist(), counts.tolist(), totals.tolist(), lows.tolist(), highs.tolist()
+    ):
+        sketch = QuantileSketch()
+        sketch.update_many(price_values[start:start + count])
+        summaries[code] = {'avg_price': total // count, 'min_price': low, 'max_price': high, **sketch.percentiles()}
+    return summaries
+
+def vector_basic_stats(columns):
+    """전체 매물 수와 0보다 큰 최저가의 평균/최소/최대"""
+    summary = _price_summaries(np.zeros(len(columns), dtype=np.int64), 1, columns)[0]
+    return {'total_count': len(columns), **summary}
+
+def _grouped_counts(columns, outer, inner):
+    """
+    outer 항목별로 inner 항목의 매물 수를 세요 (둘 다 처음 나온 순서대로)
+    
+    반환값: {outer 글자: {inner 글자: 매물 수}}
+    """
+    outer_labels, inner_labels = columns.labels[outer], columns.labels[inner]
+    pair_codes, pairs = _pair_codes(columns.codes[outer], columns.codes[inner], len(inner_labels))
+    result = {}
+    for (outer_code, inner_code), count in zip(pairs, _group_counts(pair_codes, len(pairs))):
+        result.setdefault(outer_labels[outer_code], {})[inner_labels[inner_code]] = count
+    return result
+
+def vector_region_analysis(columns):
+    """analyze_by_region과 같은 결과를 묶음 계산으로 만들어요"""
+    regions = columns.labels['region']
+    region_codes = columns.codes['region']
+    prices = _price_summaries(region_codes, len(regions), columns)
+    property_types = _grouped_counts(columns, 'region', 'maemulinfo')
+    
+    result = {
+        region: {'count': count, 'property_types': property_types[region], **prices[code], 'subregions': {}}
+        for code, (region, count) in enumerate(zip(regions, _group_counts(region_codes, len(regions))))
+    }
+    
+    # 상세 지역이 있는 매물만 골라서 (지역, 상세 지역) 쌍별로 계산해요
+    subregions = columns.labels['subregion']
+    has_subregion = np.array([bool(name) and name != '상세지역없음' for name in subregions], dtype=bool)
+    if len(subregions) == 0 or not has_subregion.any():
+        return result
+    
+    pair_codes, pairs = _pair_codes(region_codes, columns.codes['subregion'], len(subregions))
+    pair_counts = _group_counts(pair_codes, len(pairs))
+    pair_prices = _price_summaries(pair_codes, len(pairs), columns)
+    for pair_code, (region_code, subregion_code) in enumerate(pairs):
+        if has_subregion[subregion_code]:
+            result[regions[region_code]]['subregions'][subregions[subregion_code]] = {
+                'count': pair_counts[pair_code], **pair_prices[pair_code]
+            }
+    return result
+
+def vector_property_analysis(columns):
+    """analyze_property_types와 같은 결과를 묶음 계산으로 만들어요"""
+    maemulinfos = columns.labels['maemulinfo']
+    codes = columns.codes['maemulinfo']
+    prices = _price_summaries(codes, len(maemulinfos), columns)
+    regions = _grouped_counts(columns, 'maemulinfo', 'region')
+    return {
+        maemulinfo: {'count': count, **prices[code], 'regions': regions[maemulinfo]}
+        for code, (maemulinfo, count) in enumerate(zip(maemulinfos, _group_counts(codes, len(maemulinfos))))
+    }
+
+def vector_price_analysis(columns, price_ranges=PRICE_RANGES):
+    """analyze_by_price_range와 같은 결과를 묶음 계산으로 만들어요"""
+    prices = columns.minprice
+    lows = np.array([low for _, low, _ in price_ranges], dtype=np.float64)
+    highs = np.array([high for _, _, high in price_ranges], dtype=np.float64)
+    
+    # 가격마다 "하한 <= 가격"인 마지막 구간을 찾고, 상한보다 작은지도 확인해요
+    bucket = np.searchsorted(lows, prices, side='right') - 1
+    inside = (bucket >= 0) & (prices < highs[np.clip(bucket, 0, None)])
+    
+    # "지역 상세지역" 글자는 (지역, 상세 지역) 쌍마다 한 번만 만들어요
+    regions, subregions = columns.labels['region'], columns.labels['subregion']
+    pair_codes, pairs = _pair_codes(columns.codes['region'], columns.codes['subregion'], len(subregions))
+    pair_labels = [f"{regions[region]} {subregions[subregion]}".strip() for region, subregion in pairs]
+    maemulinfos = columns.labels['maemulinfo']
+    maemulinfo_codes = columns.codes['maemulinfo'].tolist()
+    pair_codes = pair_codes.tolist()
+    price_values = prices.tolist()
+    addresses = columns.passthrough['frontaddress']
+    uids = columns.passthrough['uid']
+    
+    result = {}
+    for index, (name, low, high) in enumerate(price_ranges):
+        rows = np.flatnonzero(inside & (bucket == index)).tolist()
+        result[name] = {
+            'min': low,
+            'max': high,
+            'count': len(rows),
+            'items': [
+                {
+                    'region': pair_labels[pair_codes[row]],
+                    'property_type': maemulinfos[maemulinfo_codes[row]],
+                    'price': price_values[row],
+                    'address': addresses[row],
+                    'uid': uids[row]
+                }
+                for row in rows
+            ]
+        }
+    return result
+
+def analyze_items_vectorized(items):
+    """
+    최신 매물 목록으로 기본 통계, 지역별, 가격대별, 매물 종류별 분석을 한꺼번에 하는 함수
+    
+    반환값: {'basic_stats', 'region_analysis', 'price_analysis', 'property_analysis'}
+            열로 바꿀 수 없는 데이터면 None (기존 계산을 쓰세요)
+    """
+    columns = items_frame(items)
+    if columns is None:
+        return None
+    return {
+        'basic_stats': vector_basic_stats(columns),
+        'region_analysis': vector_region_analysis(columns),
+        'price_analysis': vector_price_analysis(columns),
+        'property_analysis': vector_property_analysis(columns)
+    }
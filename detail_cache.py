@@ -0,0 +1,134 @@
+# 대시보드 상세 정보(detailed_auction_data)를 매물마다 저장해두고 다시 쓰는 도구예요
+# 매물 번호(uid)와 수정 시각(cupdate)이 지난번과 같으면 가격 글자, 비율, 키워드 같은 상세 정보를 새로 만들지 않고
+# 저장해둔 것을 그대로 써요. 날마다 바뀌는 D-day만 미리 계산해둔 경매일 숫자(ordinal)로 빠르게 다시 적어요
+# 그래서 매물 몇 건만 바뀐 날에는 바뀐 매물만 새로 만들어요
+# 마치 이름표를 한 번 써서 붙여두고, 매일 바뀌는 남은 날짜 스티커만 새로 붙이는 것과 같아요!
+#
+# 사용법:
+#   cache = DetailedItemCache(build_detailed_item, calculate_d_day)
+#   records = [cache.build(item) for item in items]
+#   cache.save()
+
+import os
+from datetime import date, datetime
+
+import json_codec
+
+# 상세 정보를 저장해둘 파일이에요
+DETAIL_CACHE_PATH = os.getenv('AUCTION_DETAIL_CACHE', os.path.join('.cache', 'detailed_items.json'))
+
+# 상세 정보 모양이 바뀌면 올려주세요 (예전에 저장한 것은 모두 다시 만들어요)
+DETAIL_CACHE_VERSION = 1
+
+# 연도까지 적힌 경매일 형식이에요 (calculate_d_day와 같은 순서로 시도해요)
+# 월/일만 적힌 경매일은 해가 바뀌면 날짜가 달라지니 숫자로 저장하지 않아요
+FULL_DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d')
+
+def auction_date_ordinal(auction_date_str):
+    """
+    경매일 글자를 날짜 숫자(date.toordinal)로 바꾸는 함수
+    
+    반환값: 날짜 숫자 (연도가 없거나 알아볼 수 없는 형식이면 None)
+    """
+    if not auction_date_str:
+        return None
+    for fmt in FULL_DATE_FORMATS:
+        try:
+            return datetime.strptime(auction_date_str, fmt).date().toordinal()
+        except ValueError:
+            continue
+    return None
+
+def d_day_text(diff):
+    """
+    경매일까지 남은 일수를 D-day 글자로 바꾸는 함수 (예: 3 → 'D-3', 0 → 'D-Day', -2 → 'D+2')
+    """
+    if diff > 0:
+        return f"D-{diff}"
+    elif diff == 0:
+        return "D-Day"
+    else:
+        return f"D+{abs(diff)}"
+
+class DetailedItemCache:
+    """
+    매물 번호(uid)와 수정 시각(cupdate)으로 상세 정보를 저장해두는 캐시
+    
+    매개변수 설명:
+    - build_record: 매물 한 건으로 상세 정보를 만드는 함수 (실패하면 None)
+    - calculate_d_day: 경매일 글자로 D-day 글자를 만드는 함수 (날짜 숫자가 없는 매물에만 써요)
+    - path: 저장 파일 경로
+    - today: 오늘 날짜 (없으면 지금)
+    """
+    
+    def __init__(self, build_record, calculate_d_day, path=DETAIL_CACHE_PATH, today=None):
+        self.build_record = build_record
+        self.calculate_d_day = calculate_d_day
+        self.path = path
+        self.today_ordinal = (today or date.today()).toordinal()
+        self.entries = self._load()
+        # 이번에 본 매물만 다음번을 위해 남겨요 (사라진 매물은 저장 파일에서도 빠져요)
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as file:
+                stored = json_codec.loads(file.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stored, dict) or stored.get('version') != DETAIL_CACHE_VERSION:
+            return {}
+        return stored.get('entries') or {}
+    
+    def build(self, item):
+        """
+        매물 한 건의 상세 정보를 돌려주는 함수
+        uid와 cupdate가 저장해둔 것과 같으면 D-day만 다시 적고, 다르면 새로 만들어서 저장해둬요
+        """
+        uid = item.get('uid')
+        cupdate = item.get('cupdate')
+        if uid is None or not cupdate:
+            # 수정 시각을 모르는 매물은 바뀌었는지 알 수 없으니 매번 새로 만들어요
+            self.misses += 1
+            return self.build_record(item)
+        
+        key = str(uid)
+        entry = self.entries.get(key)
+        if entry is not None and entry.get('cupdate') == cupdate:
+            self.hits += 1
+            self.seen[key] = entry
+            record = dict(entry['record'])
+            ordinal = entry.get('ordinal')
+            if ordinal is not None:
+                record['d_day'] = d_day_text(ordinal - self.today_ordinal)
+            else:
+                record['d_day'] = self.calculate_d_day(record.get('auction_date'))
+            return record
+        
+        self.misses += 1
+        record = self.build_record(item)
+        if record is not None:
+            self.seen[key] = {
+                'cupdate': cupdate,
+                'ordinal': auction_date_ordinal(record.get('auction_date')),
+                'record': record
+            }
+        return record
+    
+    def save(self):
+        """
+        이번에 본 매물의 상세 정보를 파일에 저장하는 함수 (실패해도 대시보드는 그대로 만들어져요)
+        """
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            # 임시 파일에 먼저 쓰고 바꿔치기해서, 쓰는 도중에 읽혀도 깨지지 않게 해요
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as file:
+                file.write(json_codec.dumps_bytes({'version': DETAIL_CACHE_VERSION, 'entries': self.seen}))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ 상세 정보 캐시 저장 실패: {e}")
@@ -0,0 +1,120 @@
+# JSON을 읽고(decode) 쓰는(encode) 속도를 실제 스냅샷으로 재는 프로그램이에요
+# data 폴더의 스냅샷을 모두 메모리에 올려두고 기본 json과 orjson(설치되어 있으면)을 번갈아 돌려서
+# 초당 몇 MB를 처리하는지, 두 방식의 결과 글자가 똑같은지 알려줘요
+# 마치 같은 짐을 손수레와 트럭으로 번갈아 옮겨보면서 어느 쪽이 빠른지 재보는 것과 같아요!
+#
+# 사용법:
+#   python json_benchmark.py                 # data 폴더 전체로 3번씩 재기
+#   python json_benchmark.py --limit 50 --repeat 5
+
+import argparse
+import json
+import os
+import time
+
+import json_codec
+from json_stream import load_snapshot
+from snapshot_files import open_snapshot
+from snapshot_store import list_snapshots
+
+def load_corpus_texts(data_folder='data', limit=None):
+    """
+    스냅샷 파일들을 글자 그대로 읽어오는 함수 (압축 파일은 풀어서 읽어요)
+    
+    반환값: [(파일 경로, UTF-8 바이트), ...]
+    """
+    paths = list_snapshots(data_folder)
+    if limit:
+        paths = paths[-limit:]
+    corpus = []
+    for path in paths:
+        with open_snapshot(path) as file:
+            corpus.append((path, file.read().encode('utf-8')))
+    return corpus
+
+def _measure(function, inputs, repeat):
+    # 가장 빠른 회차를 써요 (다른 프로그램 때문에 느려진 회차는 빼고 봐요)
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = [function(value) for value in inputs]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+def _stdlib_dumps(indent):
+    return lambda value: json_codec.dumps(value, indent, use_stdlib=True).encode('utf-8')
+
+def run_benchmark(data_folder='data', limit=None, repeat=3):
+    """
+    스냅샷 전체로 읽기/쓰기 속도를 재는 함수
+    
+    매개변수 설명:
+    - data_folder: 스냅샷 폴더
+    - limit: 최근 스냅샷 몇 개만 쓸지 (None이면 모두)
+    - repeat: 몇 번 반복해서 가장 빠른 기록을 쓸지
+    
+    반환값: {(방식, 작업): 초당 MB}
+    """
+    corpus = load_corpus_texts(data_folder, limit)
+    if not corpus:
+        print(f"❌ {data_folder} 폴더에 스냅샷이 없습니다")
+        return {}
+    
+    raw_inputs = [data for _, data in corpus]
+    total_mb = sum(len(data) for data in raw_inputs) / (1024 * 1024)
+    print(f"📦 스냅샷 {len(corpus)}개, {total_mb:.1f}MB로 잽니다 (반복 {repeat}번, 사용 중인 방식: {json_codec.BACKEND})")
+    
+    backends = [('json', lambda data: json.loads(data.decode('utf-8')), _stdlib_dumps)]
+    if json_codec.orjson is not None:
+        backends.append(('orjson', json_codec.loads, lambda indent: lambda value: json_codec.dumps_bytes(value, indent)))
+    else:
+        print("ℹ️ orjson이 설치되어 있지 않아서 기본 json만 잽니다 (pip install orjson)")
+    
+    results = {}
+    encoded = {}
+    for name, decode, make_encode in backends:
+        seconds, documents = _measure(decode, raw_inputs, repeat)
+        results[(name, 'decode')] = total_mb / seconds
+        print(f"📖 {name:>6} 읽기: {total_mb / seconds:8.1f} MB/s ({seconds:.2f}초)")
+        
+        for label, indent in (('compact', None), ('indent2', 2)):
+            seconds, outputs = _measure(make_encode(indent), documents, repeat)
+            output_mb = sum(len(output) for output in outputs) / (1024 * 1024)
+            results[(name, f'encode-{label}')] = output_mb / seconds
+            encoded[(name, label)] = outputs
+            print(f"✏️ {name:>6} 쓰기({label}): {output_mb / seconds:8.1f} MB/s ({seconds:.2f}초)")
+    
+    # 두 방식이 같은 글자를 만드는지 확인해요
+    if json_codec.orjson is not None:
+        for label in ('compact', 'indent2'):
+            different = sum(
+                1 for left, right in zip(encoded[('json', label)], encoded[('orjson', label)])
+                if left != right
+            )
+            if different:
+                print(f"⚠️ {label}: {different}개 스냅샷에서 결과가 다릅니다")
+            else:
+                print(f"✅ {label}: 모든 스냅샷에서 두 방식의 결과가 똑같습니다")
+    
+    # 실제로 쓰는 load_snapshot 전체 시간도 재요 (참조 방식 풀기, 압축 풀기 포함)
+    started = time.perf_counter()
+    for path, _ in corpus:
+        load_snapshot(path)
+    elapsed = time.perf_counter() - started
+    results[(json_codec.BACKEND, 'load_snapshot')] = total_mb / elapsed
+    print(f"📂 load_snapshot 전체({json_codec.BACKEND}): {elapsed:.2f}초")
+    
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='실제 스냅샷으로 JSON 읽기/쓰기 속도를 잽니다')
+    parser.add_argument('--data-folder', default='data', help='스냅샷 폴더')
+    parser.add_argument('--limit', type=int, default=None, help='최근 스냅샷 몇 개만 쓸지')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (가장 빠른 기록을 써요)')
+    args = parser.parse_args()
+    
+    if not os.path.isdir(args.data_folder):
+        print(f"❌ {args.data_folder} 폴더가 없습니다")
+    else:
+        run_benchmark(args.data_folder, args.limit, args.repeat)
@@ -0,0 +1,91 @@
+# JSON을 빠르게 바꾸고(encode) 읽는(decode) 도구예요
+# orjson이 설치되어 있으면 orjson을 쓰고, 없으면 파이썬 기본 json을 써요
+# 어느 쪽을 쓰든 한글은 그대로 저장하고(\uXXXX로 바꾸지 않아요), 결과 글자도 똑같아요
+# 마치 자동차가 있으면 자동차로, 없으면 걸어서 가지만 도착하는 곳은 같은 것과 같아요!
+#
+# 환경 변수 AUCTION_JSON_BACKEND=stdlib로 바꾸면 orjson이 있어도 기본 json을 써요
+
+import json
+import math
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if os.getenv('AUCTION_JSON_BACKEND', 'auto') == 'stdlib':
+    orjson = None
+
+# 지금 쓰고 있는 방식 이름이에요 ('orjson' 또는 'json')
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+def _has_non_finite(value):
+    """
+    값 안에 무한대나 NaN 실수가 있는지 확인하는 함수
+    기본 json은 Infinity/NaN으로 적고 orjson은 null로 적어서, 이런 값이 있으면 기본 json으로 적어요
+    """
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, float):
+            if not math.isfinite(current):
+                return True
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return False
+
+def dumps_bytes(value, indent=None):
+    """
+    값을 UTF-8 JSON 바이트로 바꾸는 함수
+    
+    매개변수 설명:
+    - value: 바꿀 값
+    - indent: None이면 공백 없이, 2면 두 칸 들여쓰기 (다른 값은 기본 json으로 처리해요)
+    
+    반환값: JSON 바이트
+    """
+    if orjson is not None and indent in (None, 2) and not _has_non_finite(value):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+        except TypeError:
+            # orjson이 못 다루는 값(아주 큰 정수, 문자열이 아닌 키 등)은 기본 json으로 처리해요
+            pass
+    return dumps(value, indent, use_stdlib=True).encode('utf-8')
+
+def dumps(value, indent=None, use_stdlib=False):
+    """
+    값을 JSON 글자로 바꾸는 함수 (한글은 그대로 둬요)
+    
+    매개변수 설명:
+    - value: 바꿀 값
+    - indent: None이면 공백 없이, 숫자면 그만큼 들여쓰기
+    - use_stdlib: True면 항상 기본 json을 써요
+    
+    반환값: JSON 글자
+    """
+    if not use_stdlib and orjson is not None:
+        return dumps_bytes(value, indent).decode('utf-8')
+    if indent is None:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return json.dumps(value, ensure_ascii=False, indent=indent)
+
+def loads(data):
+    """
+    JSON 글자나 바이트를 파이썬 값으로 읽는 함수
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # 기본 json만 읽을 수 있는 값(Infinity, NaN 등)이 있으면 기본 json으로 다시 읽어요
+            pass
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
+
+def load(file):
+    """열린 파일에서 JSON을 읽어요"""
+    return loads(file.read())
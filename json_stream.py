@@ -0,0 +1,241 @@
+# 큰 JSON 문서를 한꺼번에 읽지 않고 조금씩 읽으면서 매물을 하나씩 꺼내주는 도구예요
+# {"search_conditions": {...}, "data": [매물, 매물, ...]} 같은 문서에서
+# "data" 목록 안의 매물을 한 건씩 돌려주고, 필요 없는 항목은 바로 버려요
+# 마치 긴 두루마리를 한 번에 다 펼치지 않고 조금씩 풀어가며 읽는 것과 같아요!
+
+import codecs
+import json
+import os
+
+import json_codec
+from snapshot_store import REF_KEY, STORAGE_KEY, objects_folder_for, resolve_record
+from snapshot_files import open_snapshot, snapshot_size
+
+# 한 번에 읽어올 글자 수예요
+CHUNK_SIZE = 64 * 1024
+
+# 기본은 조금씩 읽기예요 (스냅샷 크기와 상관없이 메모리를 조금만 써요)
+# 환경 변수로 크기(디스크 기준 바이트)를 주면, orjson이 있을 때 그보다 작은 스냅샷은 한 번에 읽어요
+# 한 번에 읽는 orjson이 더 빠르지만 문서 전체를 메모리에 올리니, 메모리가 넉넉할 때만 켜주세요
+FAST_LOAD_LIMIT = int(os.getenv('AUCTION_JSON_FAST_LOAD_LIMIT', '0'))
+
+# 대시보드에 쓰이지 않는 큰 항목이에요
+# 대시보드로 가는 수집(정기 수집, 전국 수집)은 API 응답을 읽으면서 바로 버리고, 스냅샷을 읽을 때도 버려요
+DASHBOARD_EXCLUDED_FIELDS = ('specpdfurl',)
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+def project_item(item, fields=None, exclude_fields=None):
+    """
+    매물 한 건에서 필요한 항목만 남기는 함수
+    
+    매개변수 설명:
+    - item: 매물 정보
+    - fields: 남길 항목 이름들 (None이면 모두 남겨요)
+    - exclude_fields: 버릴 항목 이름들
+    """
+    if not isinstance(item, dict):
+        return item
+    if fields is not None:
+        item = {key: item[key] for key in fields if key in item}
+    if exclude_fields:
+        for key in exclude_fields:
+            item.pop(key, None)
+    return item
+
+def iter_file_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    열린 텍스트 파일에서 글자 묶음을 차례대로 돌려주는 함수
+    """
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def iter_decoded_chunks(byte_chunks, encoding='utf-8'):
+    """
+    바이트 묶음을 글자 묶음으로 바꿔주는 함수
+    한글처럼 여러 바이트로 된 글자가 묶음 경계에서 잘려도 올바르게 이어붙여요
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+class _Reader:
+    """글자 묶음을 필요한 만큼 이어 붙여가며 읽는 작은 도우미"""
+    
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def fill(self):
+        # 이미 읽은 앞부분은 버려서 버퍼가 계속 커지지 않게 해요
+        if self.pos > CHUNK_SIZE:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        try:
+            self.buffer += next(self.chunks)
+        except StopIteration:
+            self.eof = True
+        return not self.eof
+    
+    def more(self):
+        # 값이 잘려 있으면 남은 부분의 두 배만큼 읽어와서 같은 값을 너무 여러 번 다시 해석하지 않게 해요
+        target = len(self.buffer) + max(len(self.buffer) - self.pos, 1)
+        grown = False
+        while len(self.buffer) < target and self.fill():
+            grown = True
+        return grown
+    
+    def peek(self):
+        # 공백을 건너뛰고 다음 글자를 돌려줘요 (문서가 끝나면 '')
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+    
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON 형식 오류: '{char}'가 와야 하는 위치입니다 (위치 {self.pos})")
+        self.pos += 1
+    
+    def value(self):
+        # 값 하나를 끝까지 읽어요 (중간에 잘려 있으면 더 읽어와서 다시 시도해요)
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.more():
+                    continue
+                raise
+            # 숫자는 버퍼 끝에서 잘렸을 수도 있으니 뒤에 글자가 더 있는지 확인해요
+            if end == len(self.buffer) and not self.eof and self.more():
+                continue
+            self.pos = end
+            return value
+
+def iter_json_items(chunks, array_key='data', meta=None, fields=None, exclude_fields=None):
+    """
+    JSON 문서의 목록(array_key) 안에 있는 항목을 하나씩 돌려주는 함수
+    
+    매개변수 설명:
+    - chunks: 문서의 글자 묶음들 (파일 조각, 응답 조각 등)
+    - array_key: 항목 목록이 들어 있는 최상위 키 (기본값: 'data')
+    - meta: 사전을 주면 목록이 아닌 나머지 최상위 값들을 여기에 채워줘요
+            (목록 자리에는 빈 목록만 남겨서 목록이 있었다는 것을 알려줘요)
+    - fields: 항목마다 남길 키 이름들 (None이면 모두)
+    - exclude_fields: 항목마다 버릴 키 이름들
+    
+    반환값: 항목을 하나씩 내주는 제너레이터
+    """
+    
+    reader = _Reader(chunks)
+    reader.expect('{')
+    
+    while True:
+        char = reader.peek()
+        if char == '}':
+            return
+        if char == ',':
+            reader.pos += 1
+            continue
+        if char == '':
+            raise ValueError("JSON 문서가 중간에 끝났습니다")
+        
+        key = reader.value()
+        reader.expect(':')
+        
+        if key == array_key and reader.peek() == '[':
+            reader.pos += 1
+            # 목록이 있었다는 표시만 남겨둬요 (항목은 하나씩 돌려줘요)
+            if meta is not None:
+                meta[array_key] = []
+            while True:
+                char = reader.peek()
+                if char == ']':
+                    reader.pos += 1
+                    break
+                if char == ',':
+                    reader.pos += 1
+                    continue
+                if char == '':
+                    raise ValueError("JSON 목록이 중간에 끝났습니다")
+                yield project_item(reader.value(), fields, exclude_fields)
+        else:
+            value = reader.value()
+            if meta is not None:
+                meta[key] = value
+
+def load_json_document(chunks, array_key='data', fields=None, exclude_fields=None):
+    """
+    문서를 조금씩 읽으면서 항목은 골라낸 항목만 남긴 사전으로 만들어주는 함수
+    큰 항목의 버릴 부분은 읽는 즉시 버리기 때문에 원래 문서 전체를 메모리에 올리지 않아요
+    """
+    document = {}
+    items = list(iter_json_items(chunks, array_key, document, fields, exclude_fields))
+    if array_key in document and isinstance(document[array_key], list):
+        document[array_key] = items
+    return document
+
+def _iter_whole_document(file, meta=None, array_key='data'):
+    """
+    문서를 한 번에 읽어서 iter_json_items와 똑같이 항목을 하나씩 돌려주는 함수
+    meta도 iter_json_items와 같은 모양으로 채워요 (목록 자리에는 빈 목록)
+    """
+    document = json_codec.loads(file.read())
+    if not isinstance(document, dict):
+        raise ValueError("JSON 형식 오류: 문서가 사전({...})이 아닙니다")
+    items = document.get(array_key)
+    if meta is not None:
+        for key, value in document.items():
+            meta[key] = [] if key == array_key and isinstance(value, list) else value
+    return items if isinstance(items, list) else []
+
+def iter_snapshot_items(filepath, fields=None, exclude_fields=None, meta=None):
+    """
+    data 폴더의 스냅샷 파일에서 매물을 하나씩 꺼내주는 함수
+    참조 방식 스냅샷(snapshot_store)이면 객체 폴더에서 원래 매물 정보를 찾아서 돌려줘요
+    압축된 스냅샷(.json.gz, .json.zst)과 월별 보관함 안의 스냅샷도 읽으면서 풀어요
+    
+    매개변수 설명:
+    - filepath: 스냅샷 파일 경로
+    - fields / exclude_fields: 매물마다 남길/버릴 항목
+    - meta: 사전을 주면 search_conditions 같은 나머지 값을 채워줘요
+    """
+    objects_folder = objects_folder_for(filepath)
+    with open_snapshot(filepath) as file:
+        if FAST_LOAD_LIMIT > 0 and json_codec.orjson is not None and snapshot_size(filepath) <= FAST_LOAD_LIMIT:
+            items = _iter_whole_document(file, meta)
+        else:
+            items = iter_json_items(iter_file_chunks(file), 'data', meta)
+        for item in items:
+            if isinstance(item, dict) and REF_KEY in item:
+                item = resolve_record(item, objects_folder)
+            yield project_item(item, fields, exclude_fields)
+    
+    # 저장 방식 표시는 내용이 아니니 빼둬요
+    if meta is not None:
+        meta.pop(STORAGE_KEY, None)
+
+def load_snapshot(filepath, fields=None, exclude_fields=None):
+    """
+    스냅샷 파일을 조금씩 읽어서 {'search_conditions': ..., 'data': [...]} 형태로 돌려주는 함수
+    """
+    document = {}
+    items = list(iter_snapshot_items(filepath, fields, exclude_fields, document))
+    if 'data' in document and isinstance(document['data'], list):
+        document['data'] = items
+    return document
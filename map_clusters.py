@@ -0,0 +1,168 @@
+# 지도에 보여줄 매물 묶음(cluster)을 미리 계산하는 도구예요
+# 위도/경도를 바둑판(격자) 칸으로 나누고, 칸마다 매물 수, 평균 위치, 가격 통계(평균/최소/최대/p10/p50/p90)를 구해요
+# 카카오맵 확대 수준(level)마다 칸 크기가 두 배씩 커지고, 큰 칸은 안에 든 작은 칸 네 개를 합쳐서 만들어요 (쿼드트리)
+# 칸들은 다시 BLOCK_CELLS x BLOCK_CELLS 칸짜리 구역(block)으로 묶어서 파일 하나에 담아요
+# 브라우저는 지금 보이는 구역의 파일만 받아서 묶음을 그리고, 많이 확대하면 그 구역의 매물 점만 받아요
+# 마치 전국 지도에는 시/도별 인원수만 적고, 확대할수록 동네별, 건물별로 자세히 적는 것과 같아요!
+#
+# 사용법:
+#   index = build_spatial_index(items)
+#   index['levels'][8]['blocks']['463_3176']   # 카카오맵 8레벨, 한 구역 안의 묶음 목록
+
+import math
+import os
+
+from auction_aggregate import PriceAccumulator
+
+# 묶음을 미리 계산할 카카오맵 확대 수준이에요 (숫자가 클수록 넓게 보여요)
+CLUSTER_LEVELS = tuple(range(5, 14))
+
+# 이 수준 이하로 확대하면 묶음 대신 매물 점을 보여줘요
+POINT_LEVEL = 4
+
+# 기준 수준의 칸 크기(도)예요 (한 수준 올라갈 때마다 두 배)
+BASE_LEVEL = 8
+BASE_CELL_DEGREES = float(os.getenv('AUCTION_MAP_CELL_DEGREES', '0.04'))
+
+# 구역 하나에 들어가는 칸 수(가로, 세로)예요
+BLOCK_CELLS = 16
+
+# 좌표가 이 범위를 벗어나면 잘못된 값으로 보고 빼요 (한국 주변)
+LAT_RANGE = (30.0, 45.0)
+LNG_RANGE = (120.0, 135.0)
+
+def cell_degrees(level):
+    """카카오맵 확대 수준에서 칸 한 변의 크기(도)를 알려줘요"""
+    return BASE_CELL_DEGREES * 2 ** (level - BASE_LEVEL)
+
+def item_position(item):
+    """
+    매물의 (위도, 경도)를 꺼내는 함수
+    
+    반환값: (위도, 경도) 실수 (좌표가 없거나 범위를 벗어나면 None)
+    """
+    try:
+        lat = float(item.get('lat'))
+        lng = float(item.get('lng'))
+    except (TypeError, ValueError):
+        return None
+    if not (LAT_RANGE[0] < lat < LAT_RANGE[1] and LNG_RANGE[0] < lng < LNG_RANGE[1]):
+        return None
+    return lat, lng
+
+def block_key(row, col):
+    """칸 번호가 속한 구역 이름 (예: '463_3176')"""
+    return f"{row // BLOCK_CELLS}_{col // BLOCK_CELLS}"
+
+class CellAccumulator:
+    """칸 하나의 매물 수, 위치 합계, 가격 통계를 모으는 도우미 (작은 칸들을 합쳐 큰 칸을 만들 수 있어요)"""
+    
+    __slots__ = ('count', 'lat_total', 'lng_total', 'prices')
+    
+    def __init__(self):
+        self.count = 0
+        self.lat_total = 0.0
+        self.lng_total = 0.0
+        self.prices = PriceAccumulator()
+    
+    def add(self, lat, lng, minprice):
+        self.count += 1
+        self.lat_total += lat
+        self.lng_total += lng
+        if minprice > 0:
+            self.prices.add(minprice)
+    
+    def merge(self, other):
+        self.count += other.count
+        self.lat_total += other.lat_total
+        self.lng_total += other.lng_total
+        self.prices.merge(other.prices)
+        return self
+    
+    def result(self, row, col):
+        return {
+            'row': row,
+            'col': col,
+            'count': self.count,
+            # 칸 가운데가 아니라 매물들의 평균 위치에 묶음을 그려요
+            'lat': round(self.lat_total / self.count, 6),
+            'lng': round(self.lng_total / self.count, 6),
+            **self.prices.summary()
+        }
+
+def map_point(item, lat, lng):
+    """매물 점 하나에 필요한 정보만 남겨요"""
+    return {
+        'uid': item.get('uid', ''),
+        'lat': lat,
+        'lng': lng,
+        'minprice': item.get('minprice', 0),
+        'property_type': item.get('maemulinfo', '알 수 없음'),
+        'address': item.get('frontaddress', '') or item.get('address', ''),
+        'auction_date': item.get('auctiondate', '')
+    }
+
+def _blocks(cells):
+    # 칸 목록을 구역별로 나눠요 (구역 안에서는 칸 번호순)
+    blocks = {}
+    for (row, col), cell in sorted(cells.items()):
+        blocks.setdefault(block_key(row, col), []).append(cell.result(row, col))
+    return blocks
+
+def build_spatial_index(items, levels=CLUSTER_LEVELS):
+    """
+    매물 목록으로 확대 수준별 묶음과 매물 점 색인을 만드는 함수
+    가장 작은 칸만 매물로 계산하고, 더 큰 칸은 작은 칸 네 개를 합쳐서 만들어요
+    
+    매개변수 설명:
+    - items: 매물 목록 (lat, lng가 있는 매물만 써요)
+    - levels: 묶음을 만들 카카오맵 확대 수준들 (작은 것부터 한 칸씩 이어져야 해요)
+    
+    반환값: {
+        'point_level', 'block_cells', 'count',
+        'levels': {수준: {'cell_degrees', 'blocks': {구역: [묶음, ...]}}},
+        'points': {'cell_degrees', 'blocks': {구역: [매물 점, ...]}}
+    }
+    """
+    levels = sorted(levels)
+    finest = levels[0]
+    step = cell_degrees(finest)
+    
+    cells = {}
+    points = {}
+    count = 0
+    for item in items:
+        position = item_position(item)
+        if position is None:
+            continue
+        lat, lng = position
+        row, col = math.floor(lat / step), math.floor(lng / step)
+        cell = cells.get((row, col))
+        if cell is None:
+            cell = cells[(row, col)] = CellAccumulator()
+        minprice = item.get('minprice', 0)
+        cell.add(lat, lng, minprice if isinstance(minprice, (int, float)) else 0)
+        points.setdefault(block_key(row, col), []).append(map_point(item, lat, lng))
+        count += 1
+    
+    index = {
+        'point_level': POINT_LEVEL,
+        'block_cells': BLOCK_CELLS,
+        'count': count,
+        'levels': {},
+        'points': {'cell_degrees': step, 'blocks': points}
+    }
+    
+    for level in levels:
+        if level != finest:
+            # 윗 수준의 칸 하나는 아래 수준의 칸 2 x 2개를 합친 것이에요
+            parents = {}
+            for (row, col), cell in cells.items():
+                parent = parents.get((row >> 1, col >> 1))
+                if parent is None:
+                    parent = parents[(row >> 1, col >> 1)] = CellAccumulator()
+                parent.merge(cell)
+            cells = parents
+        index['levels'][level] = {'cell_degrees': cell_degrees(level), 'blocks': _blocks(cells)}
+    
+    return index
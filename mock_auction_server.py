@@ -0,0 +1,242 @@
+# 진짜 경매 API(map.auctionmsg.com) 대신 쓸 수 있는 로컬 모의 서버예요
+# data 폴더에 저장된 스냅샷들을 모아서 같은 주소 형식(c=Auction&m=getAuctionList)으로 돌려줘요
+# 응답 지연, 오류, 요청 수 제한도 흉내 낼 수 있어서 크롤러 성능을 인터넷 없이 잴 수 있어요
+# 마치 실제 경기 전에 연습 상대와 모의 경기를 해보는 것과 같아요!
+#
+# 사용법:
+#   python mock_auction_server.py --port 8765 --latency-ms 80 --error-rate 0.05 --rate-limit 20
+#   AUCTION_API_URL=http://127.0.0.1:8765/server/api/ python scheduler.py --once
+
+import argparse
+import gzip
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import json_codec
+from json_stream import iter_snapshot_items
+from snapshot_store import list_snapshots
+
+API_PATH = '/server/api/'
+PRICE_UNIT = 100000000
+
+def load_corpus(data_folder='data', scale=1):
+    """
+    data 폴더의 모든 스냅샷에서 매물을 모아 하나의 목록으로 만드는 함수
+    같은 매물(uid)이 여러 번 나오면 가장 최근에 수정된 것만 남겨요
+    
+    매개변수 설명:
+    - data_folder: 스냅샷 폴더
+    - scale: 매물 수를 몇 배로 늘릴지 (uid를 바꿔서 복제해요, 큰 규모 시험용)
+    
+    반환값: 점수(score) 높은 순으로 정렬한 매물 목록
+    """
+    
+    latest = {}
+    for filepath in list_snapshots(data_folder):
+        try:
+            for item in iter_snapshot_items(filepath):
+                uid = item.get('uid')
+                if uid is None:
+                    continue
+                previous = latest.get(uid)
+                if previous is None or (item.get('cupdate') or '') >= (previous.get('cupdate') or ''):
+                    latest[uid] = item
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 파일 {filepath}을 읽지 못했습니다: {e}")
+    
+    items = list(latest.values())
+    if scale > 1:
+        base_items = items
+        items = []
+        for copy_index in range(scale):
+            for item in base_items:
+                copied = dict(item)
+                copied['uid'] = item['uid'] + copy_index * 10000000
+                items.append(copied)
+    
+    items.sort(key=lambda item: item.get('score') or 0, reverse=True)
+    return items
+
+def _parse_price_range(value):
+    # "0,6" → (0원, 6억원)
+    try:
+        low, high = value.split(',')
+        return int(float(low) * PRICE_UNIT), int(float(high) * PRICE_UNIT)
+    except (ValueError, AttributeError):
+        return None
+
+class MockAuctionHandler(BaseHTTPRequestHandler):
+    """모의 경매 API 요청을 처리하는 도우미"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        # 요청마다 화면에 찍히지 않게 조용히 해요
+        pass
+    
+    def _send_json(self, status, body, extra_headers=None):
+        payload = json_codec.dumps_bytes(body)
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            payload = gzip.compress(payload, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+        headers.update(extra_headers or {})
+        
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query, keep_blank_values=True).items()}
+        
+        if parsed.path != API_PATH or query.get('c') != 'Auction' or query.get('m') != 'getAuctionList':
+            self._send_json(404, {'error': 'not found'})
+            return
+        
+        # 1. 요청 수 제한 (초당 rate_limit개를 넘으면 429)
+        if not server.allow_request():
+            self._send_json(429, {'error': 'too many requests'}, {'Retry-After': '1'})
+            return
+        
+        # 2. 응답 지연 흉내
+        if server.latency_ms > 0 or server.jitter_ms > 0:
+            delay = max(0.0, random.gauss(server.latency_ms, server.jitter_ms)) / 1000
+            time.sleep(delay)
+        
+        # 3. 오류 흉내
+        if server.error_rate > 0 and random.random() < server.error_rate:
+            self._send_json(500, {'error': 'injected failure'})
+            return
+        
+        items = server.items
+        region_code = query.get('s3_region1_code', '')
+        if region_code:
+            items = [item for item in items if str(item.get('s3_region1_code')) == region_code]
+        region2_code = query.get('s3_region2_code', '')
+        if region2_code:
+            items = [item for item in items if str(item.get('s3_region2_code')) == region2_code]
+        price_range = _parse_price_range(query.get('minprice', ''))
+        if price_range:
+            low, high = price_range
+            items = [item for item in items if low <= (item.get('minprice') or 0) <= high]
+        
+        try:
+            page = max(1, int(query.get('page', 1)))
+            limit = max(1, int(query.get('limit', 100)))
+        except ValueError:
+            self._send_json(400, {'error': 'bad paging'})
+            return
+        
+        body = {'data': items[(page - 1) * limit:page * limit]}
+        if server.with_total:
+            body['total'] = len(items)
+        
+        with server.stats_lock:
+            server.request_count += 1
+        self._send_json(200, body)
+
+class MockAuctionServer(ThreadingHTTPServer):
+    """설정값(지연, 오류율, 요청 제한)과 매물 목록을 들고 있는 모의 서버"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address, items, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 rate_limit=0, with_total=False):
+        super().__init__(address, MockAuctionHandler)
+        self.items = items
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.with_total = with_total
+        self.request_count = 0
+        self.stats_lock = threading.Lock()
+        self._window_started = time.monotonic()
+        self._window_count = 0
+    
+    def allow_request(self):
+        # 1초 단위 창에서 요청 수를 세요
+        if self.rate_limit <= 0:
+            return True
+        with self.stats_lock:
+            now = time.monotonic()
+            if now - self._window_started >= 1.0:
+                self._window_started = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count <= self.rate_limit
+    
+    def handle_error(self, request, client_address):
+        # 크롤러가 늦은 헤지 요청을 먼저 끊는 것은 정상이라 조용히 넘어가요
+        error = sys.exc_info()[1]
+        if isinstance(error, (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+    
+    @property
+    def api_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+def start_mock_server(items, host='127.0.0.1', port=0, **options):
+    """
+    모의 서버를 백그라운드 스레드에서 실행하는 함수
+    
+    매개변수 설명:
+    - items: 돌려줄 매물 목록 (load_corpus로 만들어요)
+    - host / port: 서버 주소 (port=0이면 빈 포트를 자동으로 골라요)
+    - options: latency_ms, jitter_ms, error_rate, rate_limit, with_total
+    
+    반환값: 실행 중인 서버 (server.api_url로 주소를 알 수 있고, server.shutdown()으로 멈춰요)
+    """
+    server = MockAuctionServer((host, port), items, **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+def add_server_arguments(parser):
+    """모의 서버 설정을 명령행 옵션으로 추가하는 함수 (벤치마크와 함께 써요)"""
+    parser.add_argument('--data-folder', default='data', help='재생할 스냅샷 폴더')
+    parser.add_argument('--scale', type=int, default=1, help='매물 수를 몇 배로 늘릴지')
+    parser.add_argument('--latency-ms', type=float, default=50, help='평균 응답 지연 (밀리초)')
+    parser.add_argument('--jitter-ms', type=float, default=20, help='응답 지연의 흔들림 (밀리초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 오류를 낼 확률 (0~1)')
+    parser.add_argument('--rate-limit', type=int, default=0, help='초당 허용 요청 수 (0이면 제한 없음)')
+    parser.add_argument('--with-total', action='store_true', help='응답에 전체 개수(total)를 넣기')
+
+def server_options(args):
+    return {
+        'latency_ms': args.latency_ms,
+        'jitter_ms': args.jitter_ms,
+        'error_rate': args.error_rate,
+        'rate_limit': args.rate_limit,
+        'with_total': args.with_total
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='data 폴더를 재생하는 모의 경매 API 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    
+    print("📚 스냅샷 데이터를 불러오는 중...")
+    corpus = load_corpus(args.data_folder, args.scale)
+    print(f"✅ 매물 {len(corpus)}건 준비 완료")
+    
+    mock_server = MockAuctionServer((args.host, args.port), corpus, **server_options(args))
+    print(f"🧪 모의 서버 실행 중: {mock_server.api_url} (Ctrl+C로 종료)")
+    try:
+        mock_server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 모의 서버를 종료합니다.")
+        mock_server.server_close()
@@ -0,0 +1,185 @@
+# 가격을 모두 모아두지 않고도 중앙값과 백분위수(p10/p50/p90)를 구하는 도구예요
+# 가격을 층(level)마다 조금씩만 들고 있다가, 한 층이 가득 차면 정렬해서 하나 걸러 하나만 윗층에 올려요
+# 윗층의 가격 하나는 아래층 가격 두 개 몫(무게 2배)이라서, 가격이 아무리 많아도 들고 있는 수는 조금만 늘어요
+# 가격 수가 SKETCH_CAPACITY보다 적으면 모든 가격을 그대로 들고 있어서 백분위수가 정확해요
+# 같은 순서로 넣으면 언제나 같은 결과가 나오고, 두 스케치를 합칠(merge) 수 있어서
+# 하루치 스케치를 모아 한 주, 한 달치 백분위수를 원래 매물을 다시 읽지 않고 구할 수 있어요
+# 마치 반 학생 키를 모두 적지 않고, 줄을 세워 한 명 걸러 한 명씩만 대표로 적어두는 것과 같아요!
+#
+# 사용법:
+#   sketch = QuantileSketch()
+#   sketch.update_many([120000000, 95000000, 310000000])
+#   sketch.percentiles()   # {'p10': ..., 'p50': ..., 'p90': ...}
+
+import os
+from datetime import datetime
+
+# 한 층에 들고 있을 가격 수예요 (이보다 가격이 적으면 백분위수가 정확해요)
+SKETCH_CAPACITY = int(os.getenv('AUCTION_SKETCH_CAPACITY', '256'))
+
+# 대시보드에 보여줄 백분위수예요 (이름, 퍼센트)
+PERCENTILES = (('p10', 10), ('p50', 50), ('p90', 90))
+
+class QuantileSketch:
+    """
+    합칠 수 있는 백분위수 스케치 (층마다 가격을 조금씩 들고 있다가 가득 차면 절반만 윗층으로 올려요)
+    
+    매개변수 설명:
+    - capacity: 한 층에 들고 있을 가격 수
+    """
+    
+    __slots__ = ('capacity', 'count', 'levels', 'parities')
+    
+    def __init__(self, capacity=SKETCH_CAPACITY):
+        self.capacity = max(2, capacity)
+        self.count = 0
+        self.levels = [[]]
+        # 층마다 이번에 올릴 쪽(짝수 번째/홀수 번째)을 번갈아 골라서 한쪽으로 치우치지 않게 해요
+        self.parities = [0]
+    
+    def add(self, value):
+        level = self.levels[0]
+        level.append(value)
+        self.count += 1
+        if len(level) >= self.capacity:
+            self._compact(0)
+    
+    def update_many(self, values):
+        """값들을 차례대로 넣어요 (add를 하나씩 부른 것과 결과가 똑같아요)"""
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        start = 0
+        while start < len(values):
+            level = self.levels[0]
+            end = min(len(values), start + self.capacity - len(level))
+            level.extend(values[start:end])
+            self.count += end - start
+            start = end
+            if len(level) >= self.capacity:
+                self._compact(0)
+    
+    def _compact(self, height):
+        # 정렬해서 하나 걸러 하나만 윗층으로 올려요 (홀수 개면 가장 큰 값 하나는 이 층에 남겨요)
+        level = sorted(self.levels[height])
+        leftover = level[-1:] if len(level) % 2 else []
+        paired = level[:len(level) - len(leftover)]
+        if height + 1 == len(self.levels):
+            self.levels.append([])
+            self.parities.append(0)
+        self.levels[height + 1].extend(paired[self.parities[height]::2])
+        self.parities[height] ^= 1
+        self.levels[height] = leftover
+        if len(self.levels[height + 1]) >= self.capacity:
+            self._compact(height + 1)
+    
+    def merge(self, other):
+        """다른 스케치의 가격을 모두 더해요 (다른 스케치는 바뀌지 않아요)"""
+        for height, values in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append([])
+                self.parities.append(0)
+            self.levels[height].extend(values)
+        self.count += other.count
+        height = 0
+        while height < len(self.levels):
+            if len(self.levels[height]) >= self.capacity:
+                self._compact(height)
+            height += 1
+        return self
+    
+    def _ranked_values(self):
+        # (값, 무게)를 값 순서로 정렬해요
+        return sorted(
+            (value, 1 << height)
+            for height, values in enumerate(self.levels)
+            for value in values
+        )
+    
+    def _quantile_of(self, ranked, percent):
+        # 정수로 올림해서 소수 오차 없이 순위를 정해요
+        rank = max(1, -(-self.count * percent // 100))
+        if len(self.levels) == 1:
+            # 아직 한 층뿐이면 모든 값의 무게가 1이라 순위가 곧 위치예요
+            return ranked[rank - 1]
+        seen = 0
+        for value, weight in ranked:
+            seen += weight
+            if seen >= rank:
+                return value
+        return ranked[-1][0]
+    
+    def quantile(self, percent):
+        """
+        percent 백분위수를 구하는 함수 (가장 가까운 순위 방식: 작은 쪽부터 percent%째 값)
+        
+        반환값: 백분위수 값 (가격이 없으면 0)
+        """
+        return self.quantiles([percent])[0]
+    
+    def quantiles(self, percents):
+        """여러 백분위수를 한 번의 정렬로 구해요 (가격이 없으면 모두 0)"""
+        if not self.count:
+            return [0] * len(percents)
+        ranked = sorted(self.levels[0]) if len(self.levels) == 1 else self._ranked_values()
+        return [self._quantile_of(ranked, percent) for percent in percents]
+    
+    def percentiles(self):
+        """{'p10', 'p50', 'p90'} 사전을 돌려줘요 (가격이 없으면 모두 0)"""
+        values = self.quantiles([percent for _, percent in PERCENTILES])
+        return {name: value for (name, _), value in zip(PERCENTILES, values)}
+    
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 사전으로 바꿔요"""
+        return {'capacity': self.capacity, 'count': self.count, 'levels': self.levels, 'parities': self.parities}
+    
+    @classmethod
+    def from_dict(cls, stored):
+        """to_dict로 저장한 사전에서 스케치를 다시 만들어요"""
+        sketch = cls(stored.get('capacity', SKETCH_CAPACITY))
+        sketch.count = stored.get('count', 0)
+        sketch.levels = [list(values) for values in stored.get('levels', [[]])] or [[]]
+        sketch.parities = list(stored.get('parities', [])) or [0] * len(sketch.levels)
+        return sketch
+
+def sketch_of(values, capacity=SKETCH_CAPACITY):
+    """값 목록(또는 NumPy 배열)으로 스케치를 만들어요"""
+    sketch = QuantileSketch(capacity)
+    sketch.update_many(values)
+    return sketch
+
+def rollup_percentiles(dated_sketches):
+    """
+    날짜별 스케치를 한 주씩 합쳐서 주별 백분위수를 구하는 함수 (원래 매물은 다시 읽지 않아요)
+    
+    매개변수 설명:
+    - dated_sketches: [(날짜 '2025-09-25', 스케치), ...] (날짜순)
+    
+    반환값: (주별 목록 [{'week', 'start_date', 'count', 'p10', 'p50', 'p90'}, ...],
+             기간 전체 {'count', 'p10', 'p50', 'p90'})
+    """
+    weeks = []
+    week_sketches = {}
+    period = QuantileSketch()
+    for date_str, sketch in dated_sketches:
+        try:
+            year, week, _ = datetime.strptime(date_str, '%Y-%m-%d').isocalendar()
+            week_name = f"{year}-W{week:02d}"
+        except ValueError:
+            # 날짜를 알 수 없으면 그 글자끼리 묶어요
+            week_name = date_str
+        if week_name not in week_sketches:
+            week_sketches[week_name] = QuantileSketch()
+            weeks.append((week_name, date_str))
+        week_sketches[week_name].merge(sketch)
+        period.merge(sketch)
+    
+    weekly = [
+        {
+            'week': week_name,
+            'start_date': start_date,
+            'count': week_sketches[week_name].count,
+            **week_sketches[week_name].percentiles()
+        }
+        for week_name, start_date in weeks
+    ]
+    return weekly, {'count': period.count, **period.percentiles()}
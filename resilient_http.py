@@ -0,0 +1,284 @@
+# 경매 API에 튼튼하게 요청을 보내는 도구예요
+# 1. 토큰 버킷으로 초당 요청 수를 조절해요 (서버가 힘들어하면 속도를 줄여요)
+# 2. 시간 초과나 5xx/429 오류는 조금씩 더 기다리면서 다시 시도해요
+# 3. 같은 서버가 계속 실패하면 잠시 요청을 멈춰요 (회로 차단기)
+# 4. 응답이 평소(p95)보다 늦으면 같은 요청을 하나 더 보내서 먼저 온 답을 써요
+# 마치 택배가 늦으면 한 번 더 주문하고, 가게가 문을 닫았으면 잠시 후에 다시 가보는 것과 같아요!
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlparse
+
+import requests
+
+# 초당 보낼 수 있는 요청 수와 한꺼번에 보낼 수 있는 최대 요청 수예요
+# 동시 요청 수(AUCTION_MAX_IN_FLIGHT)를 늘려도 초당 요청 수는 이 값을 넘지 않아요
+# 기본값 5는 실제 서버에 예의를 지키는 속도라서, 응답이 빠른 서버에서는 동시 요청을 늘려도 거의 빨라지지 않아요
+# (모의 서버로 속도를 잴 때는 crawl_benchmark.py처럼 이 값을 크게 잡아주세요)
+RATE_PER_SECOND = float(os.getenv('AUCTION_RATE_PER_SECOND', '5'))
+RATE_BURST = int(os.getenv('AUCTION_RATE_BURST', '5'))
+
+# 다시 시도하는 횟수와 기다리는 시간(초)이에요
+MAX_RETRIES = int(os.getenv('AUCTION_MAX_RETRIES', '3'))
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 20.0
+
+# 연속으로 몇 번 실패하면 몇 초 동안 요청을 멈출지 정해요
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+# 응답 시간이 p95보다 길어지면 같은 요청을 하나 더 보내요 (0이면 사용하지 않아요)
+HEDGE_ENABLED = os.getenv('AUCTION_HEDGE', '1') != '0'
+HEDGE_MIN_SAMPLES = 20
+
+# 다시 시도할 만한 상태 코드예요
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """회로 차단기가 열려 있어서 요청을 보내지 않았을 때 생기는 오류"""
+
+class TokenBucket:
+    """
+    초당 요청 수를 조절하는 토큰 버킷
+    요청할 때마다 토큰을 하나씩 쓰고, 토큰은 시간이 지나면 다시 채워져요
+    서버가 429(요청이 너무 많음)를 주면 채워지는 속도를 절반으로 줄이고,
+    성공이 이어지면 조금씩 원래 속도로 되돌려요
+    """
+    
+    def __init__(self, rate, capacity):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def acquire(self):
+        """토큰이 생길 때까지 기다렸다가 하나 가져가요"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+    
+    def try_acquire(self):
+        """토큰이 바로 있으면 하나 가져가고 True, 없으면 기다리지 않고 False를 돌려줘요"""
+        with self.lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+    
+    def slow_down(self):
+        """서버가 힘들어할 때 속도를 절반으로 줄여요"""
+        with self.lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+    
+    def speed_up(self):
+        """요청이 잘 될 때 속도를 조금씩 원래대로 되돌려요"""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+class CircuitBreaker:
+    """
+    서버가 계속 실패하면 잠시 요청을 멈추는 회로 차단기
+    - 닫힘: 평소처럼 요청해요
+    - 열림: 쉬는 시간 동안 요청을 보내지 않아요
+    - 쉬는 시간이 지나면 한 번 시험 삼아 보내보고, 성공하면 다시 닫혀요
+    """
+    
+    def __init__(self, failure_threshold, cooldown_seconds):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+    
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            # 쉬는 시간이 지났으면 시험 요청을 하나만 허용해요
+            # (시험 요청이 결과를 알려줄 때까지 다른 요청은 다시 쉬는 시간을 기다려요)
+            if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+class LatencyTracker:
+    """최근 응답 시간들을 기억해서 p95를 알려주는 도구"""
+    
+    def __init__(self, size=200):
+        self.samples = deque(maxlen=size)
+        self.lock = threading.Lock()
+    
+    def record(self, seconds):
+        with self.lock:
+            self.samples.append(seconds)
+    
+    def p95(self):
+        with self.lock:
+            if len(self.samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+# 서버(호스트)별로 상태를 따로 기억해요
+_host_states = {}
+_host_states_lock = threading.Lock()
+_hedge_executor = ThreadPoolExecutor(max_workers=8)
+
+def get_host_state(url):
+    """
+    주소의 서버(호스트)별 속도 조절기, 회로 차단기, 응답 시간 기록을 돌려주는 함수
+    """
+    host = urlparse(url).netloc
+    with _host_states_lock:
+        if host not in _host_states:
+            _host_states[host] = {
+                'bucket': TokenBucket(RATE_PER_SECOND, RATE_BURST),
+                'breaker': CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS),
+                'latency': LatencyTracker()
+            }
+        return _host_states[host]
+
+def backoff_delay(attempt, retry_after=None):
+    """
+    다시 시도하기 전에 기다릴 시간을 계산하는 함수
+    기다리는 시간을 0.5초, 1초, 2초...로 늘리되 무작위로 흩어서
+    여러 요청이 동시에 다시 몰리지 않게 해요 (full jitter)
+    """
+    if retry_after is not None:
+        try:
+            return min(BACKOFF_MAX_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+
+def _timed_get(session, url, state, **kwargs):
+    # 토큰은 부르는 쪽에서 미리 가져와요 (토큰을 기다린 시간은 응답 시간이 아니에요)
+    started = time.monotonic()
+    response = session.get(url, **kwargs)
+    state['latency'].record(time.monotonic() - started)
+    return response
+
+def _close_response(future):
+    try:
+        future.result().close()
+    except Exception:
+        pass
+
+def _hedged_get(session, url, state, **kwargs):
+    """
+    요청을 보내고, p95보다 오래 걸리면 같은 요청을 하나 더 보내서 먼저 온 응답을 돌려줘요
+    토큰을 받은 뒤부터 시간을 재서, 우리가 속도를 조절하느라 기다린 시간은 늦은 응답으로 보지 않아요
+    추가 요청도 토큰이 바로 있을 때만 보내요 (속도 제한에 걸려 있을 때는 첫 요청을 기다려요)
+    """
+    state['bucket'].acquire()
+    threshold = state['latency'].p95() if HEDGE_ENABLED else None
+    if threshold is None:
+        return _timed_get(session, url, state, **kwargs)
+    
+    first = _hedge_executor.submit(_timed_get, session, url, state, **kwargs)
+    done, _ = wait([first], timeout=threshold)
+    if done or not state['bucket'].try_acquire():
+        return first.result()
+    
+    print(f"🐢 응답이 평소보다 늦어서({threshold:.2f}초 초과) 같은 요청을 한 번 더 보냅니다")
+    second = _hedge_executor.submit(_timed_get, session, url, state, **kwargs)
+    pending = {first, second}
+    error = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                response = future.result()
+            except requests.exceptions.RequestException as e:
+                error = e
+                continue
+            # 늦게 도착한 쪽의 응답은 연결을 바로 돌려놓아요
+            for other in pending:
+                other.add_done_callback(_close_response)
+            return response
+    raise error
+
+def resilient_get(session, url, max_retries=None, **kwargs):
+    """
+    속도 조절, 재시도, 회로 차단기, 헤지 요청을 모두 적용해서 GET 요청을 보내는 함수
+    
+    매개변수 설명:
+    - session: 요청에 사용할 requests.Session
+    - url: 요청 주소
+    - max_retries: 최대 재시도 횟수 (없으면 AUCTION_MAX_RETRIES 설정)
+    - 나머지(params, headers, timeout 등)는 session.get에 그대로 전달돼요
+    
+    반환값: requests.Response (재시도할 수 없는 4xx 응답도 그대로 돌려줘요)
+    오류: 모든 재시도가 실패하면 마지막 requests 오류를 그대로 일으켜요
+          서버가 쉬는 중(회로 차단기 열림)이면 CircuitOpenError를 일으켜요
+    """
+    
+    max_retries = MAX_RETRIES if max_retries is None else max_retries
+    state = get_host_state(url)
+    last_error = None
+    
+    for attempt in range(max_retries + 1):
+        if not state['breaker'].allow():
+            raise CircuitOpenError(f"{urlparse(url).netloc} 서버가 계속 실패해서 잠시 요청을 멈췄습니다")
+        
+        try:
+            response = _hedged_get(session, url, state, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            state['breaker'].record_failure()
+            last_error = e
+            retry_after = None
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                state['breaker'].record_success()
+                state['bucket'].speed_up()
+                return response
+            
+            state['breaker'].record_failure()
+            if response.status_code == 429:
+                state['bucket'].slow_down()
+            last_error = requests.exceptions.HTTPError(
+                f"상태 코드 {response.status_code}", response=response
+            )
+            retry_after = response.headers.get('Retry-After')
+            
+            # 마지막 시도였다면 응답을 그대로 돌려줘서 부른 쪽이 상태 코드를 볼 수 있게 해요
+            if attempt == max_retries:
+                return response
+            
+            # 다시 시도할 응답은 버리니까 연결을 바로 돌려놔요 (stream=True면 닫지 않는 한 연결을 계속 붙잡아요)
+            response.close()
+        
+        if attempt < max_retries:
+            delay = backoff_delay(attempt, retry_after)
+            print(f"🔁 요청 실패({last_error}), {delay:.1f}초 후 다시 시도합니다 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+    
+    raise last_error
@@ -0,0 +1,170 @@
+# 경매 API 응답을 디스크에 잠깐 보관해두는 캐시예요
+# 같은 조건으로 몇 분 안에 다시 요청하면 인터넷에 묻지 않고 보관해둔 답을 바로 돌려줘요
+# 마치 방금 찾아본 전화번호를 메모지에 적어두고 다시 쓰는 것과 같아요!
+
+import hashlib
+import json
+import os
+import time
+import threading
+
+import json_codec
+
+# 캐시 파일을 보관할 폴더예요
+CACHE_FOLDER = os.getenv('AUCTION_CACHE_DIR', os.path.join('.cache', 'auction_api'))
+
+# 캐시가 "신선한" 시간(초)이에요 - 이 시간 안에는 인터넷 요청을 전혀 하지 않아요
+# 0으로 설정하면 캐시를 사용하지 않아요
+CACHE_TTL_SECONDS = int(os.getenv('AUCTION_CACHE_TTL', '1800'))
+
+# 캐시 폴더의 최대 크기(바이트)예요 - 넘치면 가장 오래 안 쓴 것부터 지워요 (LRU)
+CACHE_MAX_BYTES = int(os.getenv('AUCTION_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# 여러 요청이 동시에 캐시를 정리하지 않도록 잠가둬요
+_evict_lock = threading.Lock()
+
+def cache_enabled():
+    """
+    캐시를 사용하도록 설정되어 있는지 알려주는 함수
+    """
+    return CACHE_TTL_SECONDS > 0
+
+def make_cache_key(url, params):
+    """
+    요청 주소와 모든 요청 조건으로 캐시 이름(키)을 만드는 함수
+    조건이 하나라도 다르면 다른 키가 나와요
+    """
+    canonical = json.dumps(
+        {'url': url, 'params': {str(k): str(v) for k, v in params.items()}},
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def _cache_path(key):
+    return os.path.join(CACHE_FOLDER, f"{key}.json")
+
+def load_cached_response(url, params):
+    """
+    보관해둔 응답을 찾는 함수
+    
+    매개변수 설명:
+    - url: 요청 주소
+    - params: 요청 조건
+    
+    반환값: 캐시 항목 {'stored_at', 'etag', 'last_modified', 'body'} (없으면 None)
+    """
+    
+    path = _cache_path(make_cache_key(url, params))
+    
+    try:
+        with open(path, 'rb') as file:
+            entry = json_codec.loads(file.read())
+    except (OSError, ValueError):
+        return None
+    
+    # 최근에 사용했다는 표시를 남겨요 (오래 안 쓴 것부터 지우기 위해)
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+    
+    return entry
+
+def is_cache_fresh(entry, ttl_seconds=None):
+    """
+    캐시 항목이 아직 신선한지(TTL 안인지) 확인하는 함수
+    """
+    ttl_seconds = CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    if not entry:
+        return False
+    return time.time() - entry.get('stored_at', 0) < ttl_seconds
+
+def conditional_headers(entry):
+    """
+    서버에 "이 버전 이후로 바뀌었나요?"라고 물어보는 헤더를 만드는 함수
+    서버가 ETag나 Last-Modified를 준 적이 있을 때만 만들어져요
+    """
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def store_cached_response(url, params, body, headers=None):
+    """
+    받은 응답을 캐시에 보관하는 함수
+    
+    매개변수 설명:
+    - url: 요청 주소
+    - params: 요청 조건
+    - body: JSON으로 변환된 응답 내용
+    - headers: 응답 헤더 (ETag, Last-Modified를 기억해둬요)
+    """
+    
+    headers = headers or {}
+    entry = {
+        'stored_at': time.time(),
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'body': body
+    }
+    
+    try:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        path = _cache_path(make_cache_key(url, params))
+        
+        # 임시 파일에 먼저 쓰고 바꿔치기해서, 쓰는 도중에 읽혀도 깨지지 않게 해요
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(json_codec.dumps_bytes(entry))
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️ 응답 캐시 저장 실패: {e}")
+        return
+    
+    evict_cache()
+
+def refresh_cached_response(url, params, entry):
+    """
+    서버가 "바뀐 것 없음(304)"이라고 답했을 때 캐시의 보관 시각만 새로 고치는 함수
+    """
+    store_cached_response(url, params, entry.get('body'), {
+        'ETag': entry.get('etag'),
+        'Last-Modified': entry.get('last_modified')
+    })
+
+def evict_cache(max_bytes=None):
+    """
+    캐시 폴더가 너무 커지면 가장 오래 사용하지 않은 파일부터 지우는 함수
+    """
+    
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    
+    with _evict_lock:
+        try:
+            entries = []
+            for filename in os.listdir(CACHE_FOLDER):
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(CACHE_FOLDER, filename)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            return
+        
+        total_size = sum(size for _, size, _ in entries)
+        if total_size <= max_bytes:
+            return
+        
+        # 오래 안 쓴 순서대로 지워요
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            if total_size <= max_bytes:
+                break
@@ -5,11 +5,14 @@
 import schedule  # 정기 실행을 위한 스케줄 라이브러리
 import time      # 시간 관련 기능을 위한 라이브러리
 import logging   # 로그 기록을 위한 라이브러리
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
 
 # 우리가 만든 경매 크롤러 가져오기
-from auction_crawler import get_combined_auction_data, save_to_json, analyze_auction_data
+from auction_crawler import get_delta_auction_data, save_to_json, analyze_auction_data
+from json_stream import DASHBOARD_EXCLUDED_FIELDS
+from snapshot_archive import KEEP_ALL_DAYS, KEEP_DAILY_DAYS, apply_retention
+from snapshot_files import is_snapshot_file
 
 def setup_logging():
     """
@@ -44,14 +47,21 @@ def daily_auction_collection():
     logging.info("=" * 60)
     
     try:
-        # 1단계: 경매 데이터 수집
+        # 1단계: 경매 데이터 수집 (이전 스냅샷과 비교한 변경분도 함께 만들어요)
         logging.info("📊 경매 데이터 수집 중...")
-        auction_data = get_combined_auction_data()
+        # 대시보드에 쓰이지 않는 큰 항목은 응답을 읽으면서 바로 버려요
+        auction_data = get_delta_auction_data(exclude_fields=DASHBOARD_EXCLUDED_FIELDS)
         
         if not auction_data or not auction_data.get('data'):
             logging.warning("⚠️ 수집된 데이터가 없습니다.")
             return False
         
+        changes = auction_data.get('changes', {})
+        logging.info(f"🔄 변경분 - 추가: {len(changes.get('added', []))}건, "
+                     f"변경: {len(changes.get('modified', []))}건, "
+                     f"삭제: {len(changes.get('removed', []))}건 "
+                     f"(기준: {changes.get('base_snapshot') or '없음'})")
+        
         # 2단계: 파일명에 날짜 포함해서 저장
         today = datetime.now().strftime('%Y-%m-%d')
         filename = f"daily_auction_data_{today}.json"
@@ -94,36 +104,28 @@ def daily_auction_collection():
 def cleanup_old_files():
     """
     오래된 데이터 파일들을 정리하는 함수
-    30일 이상 된 파일들을 자동으로 삭제해서 용량을 절약해줘요
+    최근 스냅샷은 모두 두고, 오래된 스냅샷은 하루에 하나 → 한 주에 하나로 줄여서 월별 보관함에 넣어요
+    (daily_ 뿐 아니라 fresh_ 같은 다른 스냅샷도 같은 규칙으로 정리해요)
     """
     
     logging.info("🧹 오래된 파일 정리 시작...")
+    logging.info(f"   - 최근 {KEEP_ALL_DAYS}일: 모두 보관, {KEEP_DAILY_DAYS}일까지: 하루에 하나, 그 이후: 한 주에 하나")
     
     try:
         data_folder = 'data'
         if not os.path.exists(data_folder):
             return
         
-        # 30일 전 날짜 계산
-        cutoff_date = datetime.now() - timedelta(days=30)
-        deleted_count = 0
-        
-        # data 폴더의 모든 파일 검사
-        for filename in os.listdir(data_folder):
-            if filename.startswith('daily_auction_data_') and filename.endswith('.json'):
-                file_path = os.path.join(data_folder, filename)
-                
-                # 파일 생성 시간 확인
-                file_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                
-                # 30일 이상 된 파일이면 삭제
-                if file_time < cutoff_date:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logging.info(f"🗑️ 삭제된 파일: {filename}")
+        # 파일 이름의 날짜로 판단해요 (체크아웃할 때마다 바뀌는 파일 생성 시간은 믿을 수 없어요)
+        result = apply_retention(data_folder)
         
-        if deleted_count > 0:
-            logging.info(f"✅ 총 {deleted_count}개의 오래된 파일을 정리했습니다")
+        if result['archived'] or result['dropped']:
+            logging.info(
+                f"✅ 스냅샷 {result['archived']}개를 월별 보관함 {result['archives']}개에 넣고, "
+                f"{result['dropped']}개를 정리했습니다"
+            )
+            if result['objects'] > 0:
+                logging.info(f"🧹 더 이상 쓰지 않는 매물 객체 {result['objects']}개를 정리했습니다")
         else:
             logging.info("📁 정리할 오래된 파일이 없습니다")
             
@@ -146,7 +148,7 @@ def check_system_health():
         # data 폴더 확인
         data_folder = 'data'
         if os.path.exists(data_folder):
-            file_count = len([f for f in os.listdir(data_folder) if f.endswith('.json')])
+            file_count = len([f for f in os.listdir(data_folder) if is_snapshot_file(f)])
             logging.info(f"📊 저장된 데이터 파일 개수: {file_count}개")
         else:
             logging.info("📁 data 폴더가 없습니다. 첫 실행 시 자동 생성됩니다.")
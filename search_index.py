@@ -0,0 +1,163 @@
+# 주소, 키워드, 매물 종류, 법원으로 매물을 빨리 찾기 위한 역색인(inverted index)을 미리 만드는 도구예요
+# 글자를 정리(NFKC, 소문자)한 뒤 한글/영문/숫자 덩어리(토큰)로 자르고, 토큰마다 두 글자씩 겹쳐 자른 조각(bigram)을 검색어로 써요
+# 그래서 '강남구'에서 '강남'처럼 주소 일부만 입력해도 찾을 수 있어요 (조사나 띄어쓰기가 달라도 두 글자 조각은 같아요)
+# 매물 쪽은 한 글자씩도 색인해둬서, '강'이나 '4'처럼 한 글자만 입력해도 그 글자가 들어 있는 매물을 찾아요
+# 검색어마다 그 검색어가 들어 있는 매물 번호 목록(posting list)을 적고, 번호는 앞 번호와의 차이로 적어서 작게 만들어요
+# 검색어는 첫 글자별로 조각(shard) 파일에 나눠 담아서, 브라우저는 입력한 글자에 맞는 조각 몇 개만 받아요
+# 마치 책 뒤의 찾아보기를 가, 나, 다... 권으로 나눠두고, 필요한 권만 꺼내 보는 것과 같아요!
+#
+# 사용법:
+#   index = build_search_index(items)
+#   search(index, '강남 아파트')   # 조건에 맞는 uid 목록
+
+import os
+import re
+import unicodedata
+
+# 검색에 쓰는 매물 필드예요 (주소, 건물 이름, 권리 키워드, 매물 종류, 법원)
+SEARCH_FIELDS = (
+    'address', 'naddress', 'frontaddress', 'buildname',
+    'keyword2', 'keyword3', 'maemulinfo', 'court', 'courtname'
+)
+
+# 토큰을 몇 글자씩 겹쳐 자를지예요 (이보다 짧은 토큰은 통째로 검색어가 돼요)
+GRAM_SIZE = 2
+
+# 한글 음절, 영문 소문자, 숫자가 이어진 덩어리를 토큰으로 봐요
+# (브라우저의 검색 함수도 같은 규칙으로 잘라야 해요)
+TOKEN_PATTERN = re.compile(r'[0-9a-z가-힣]+')
+
+# 조각 하나에 담을 검색어의 앞부분 글자 수예요
+SEARCH_PREFIX_LENGTH = int(os.getenv('AUCTION_SEARCH_PREFIX_LENGTH', '1'))
+
+def normalize_text(text):
+    """전각 문자, 호환 문자를 정리하고 영문을 소문자로 바꿔요"""
+    return unicodedata.normalize('NFKC', str(text)).lower()
+
+def tokenize(text):
+    """글자를 한글/영문/숫자 토큰 목록으로 잘라요 (예: '능동로 170, 4층405호' → ['능동로', '170', '4층405호'])"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+def token_terms(token):
+    """
+    토큰 하나를 검색어들로 바꾸는 함수
+    GRAM_SIZE보다 긴 토큰은 겹쳐 자른 조각들로, 짧은 토큰은 그대로 써요 (예: '화양동' → ['화양', '양동'])
+    """
+    if len(token) <= GRAM_SIZE:
+        return [token]
+    return [token[start:start + GRAM_SIZE] for start in range(len(token) - GRAM_SIZE + 1)]
+
+def item_terms(item):
+    """
+    매물 한 건의 검색어 집합 (같은 검색어는 한 번만)
+    겹쳐 자른 조각에 더해 글자 하나하나도 넣어서, 한 글자 검색도 토큰 가운데 글자를 찾을 수 있어요
+    """
+    terms = set()
+    for field in SEARCH_FIELDS:
+        value = item.get(field)
+        if not value:
+            continue
+        for token in tokenize(value):
+            terms.update(token_terms(token))
+            terms.update(token)
+    return terms
+
+def query_terms(query):
+    """검색창에 입력한 글자를 찾아볼 검색어 목록으로 바꿔요 (순서 유지, 중복 제거)"""
+    terms = []
+    for token in tokenize(query):
+        for term in token_terms(token):
+            if term not in terms:
+                terms.append(term)
+    return terms
+
+def shard_key(term):
+    """
+    검색어가 들어갈 조각 이름 (앞 글자들의 유니코드 번호를 16진수로, 예: '강남' → 'ac15')
+    파일 이름에 한글을 쓰지 않으려고 번호로 적어요
+    """
+    return '-'.join(f"{ord(char):x}" for char in term[:SEARCH_PREFIX_LENGTH])
+
+def encode_postings(doc_ids):
+    """정렬된 매물 번호 목록을 앞 번호와의 차이 목록으로 바꿔요 (예: [3, 7, 8] → [3, 4, 1])"""
+    previous = 0
+    gaps = []
+    for doc_id in doc_ids:
+        gaps.append(doc_id - previous)
+        previous = doc_id
+    return gaps
+
+def decode_postings(gaps):
+    """차이 목록을 다시 매물 번호 목록으로 바꿔요"""
+    doc_ids = []
+    current = 0
+    for gap in gaps:
+        current += gap
+        doc_ids.append(current)
+    return doc_ids
+
+def build_search_index(items):
+    """
+    매물 목록으로 검색 색인을 만드는 함수
+    매물 번호(doc id)는 uid 목록(uids)에서의 자리예요
+    
+    매개변수 설명:
+    - items: 매물 목록 (uid가 없는 매물은 빼요)
+    
+    반환값: {
+        'gram_size', 'prefix_length', 'fields', 'uids': [uid, ...],
+        'shards': {조각 이름: {검색어: 차이 목록, ...}}
+    }
+    """
+    uids = []
+    postings = {}
+    for item in items:
+        uid = item.get('uid')
+        if uid is None:
+            continue
+        doc_id = len(uids)
+        uids.append(uid)
+        for term in item_terms(item):
+            # 매물을 순서대로 보니 목록은 저절로 정렬돼요
+            postings.setdefault(term, []).append(doc_id)
+    
+    shards = {}
+    for term in sorted(postings):
+        shards.setdefault(shard_key(term), {})[term] = encode_postings(postings[term])
+    
+    return {
+        'gram_size': GRAM_SIZE,
+        'prefix_length': SEARCH_PREFIX_LENGTH,
+        'fields': list(SEARCH_FIELDS),
+        'uids': uids,
+        'shards': shards
+    }
+
+def search(index, query):
+    """
+    검색 색인에서 입력한 글자가 모두 들어 있는 매물을 찾는 함수 (브라우저의 searchListings와 같은 방식)
+    두 글자 조각이 모두 들어 있는 매물을 찾는 것이라, 조각들이 서로 다른 곳에 흩어져 있는 매물도 함께 나올 수 있어요
+    
+    반환값: uid 목록 (검색어가 없으면 빈 목록)
+    """
+    terms = query_terms(query)
+    if not terms:
+        return []
+    
+    posting_lists = []
+    for term in terms:
+        gaps = index['shards'].get(shard_key(term), {}).get(term)
+        if not gaps:
+            return []
+        posting_lists.append(decode_postings(gaps))
+    
+    # 가장 짧은 목록부터 맞춰봐요
+    posting_lists.sort(key=len)
+    matches = set(posting_lists[0])
+    for doc_ids in posting_lists[1:]:
+        matches.intersection_update(doc_ids)
+        if not matches:
+            return []
+    return [index['uids'][doc_id] for doc_id in sorted(matches)]
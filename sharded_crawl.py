@@ -0,0 +1,513 @@
+# 전국 경매 정보를 여러 프로세스가 나눠서 수집하는 프로그램이에요
+# 지역/페이지 단위의 "할 일"을 SQLite 작업 대기열에 넣어두면
+# 여러 일꾼(프로세스)이 하나씩 꺼내 가서 처리하고, 마지막에 하나의 스냅샷으로 합쳐요
+# 페이지가 많은 시/도는 시/군/구(s3_region2_code)별 할 일로 다시 나눠서 여러 일꾼이 동시에 처리해요
+# 일꾼이 할 일을 들고 멈추거나 죽어도, 맡은 시간(lease)이 지나거나 부모가 알아채면 다시 대기열로 돌려놔요
+# 마치 여러 명이 번호표를 뽑아서 창구 일을 나눠 처리하는 것과 같아요!
+#
+# 사용법:
+#   python sharded_crawl.py --workers 4                # 전국 17개 시/도 수집
+#   python sharded_crawl.py --regions 서울시,경기도     # 원하는 시/도만 수집
+#   python sharded_crawl.py --resume                   # 중단된 작업 이어서 하기
+#   python sharded_crawl.py --split-pages 0            # 시/군/구로 나누지 않기
+
+import argparse
+import multiprocessing
+import multiprocessing.connection
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+import json_codec
+
+from auction_crawler import (
+    get_auction_data_by_region, read_last_page, save_to_json,
+    TARGET_PROPERTY_TYPES, MAX_PRICE
+)
+from auction_query import SIDO_REGION_CODES, plan_auction_query
+from auction_filter import compile_auction_filter, filter_items
+from json_stream import DASHBOARD_EXCLUDED_FIELDS, iter_snapshot_items
+from snapshot_catalog import latest_snapshot
+
+# 작업 대기열 파일 위치예요 (중단돼도 남아 있어서 이어서 할 수 있어요)
+QUEUE_PATH = os.path.join('.cache', 'crawl_queue.sqlite3')
+
+# 한 페이지에 가져올 개수와 한 작업을 다시 시도할 최대 횟수예요
+PAGE_LIMIT = 100
+MAX_TASK_ATTEMPTS = 3
+
+# 마지막 페이지를 모를 때 미리 대기열에 넣어둘 다음 페이지 수예요
+PREFETCH_PAGES = 2
+
+# 대기열 표 모양이 바뀌면 올려주세요 (예전 대기열은 지우고 새로 만들어요)
+QUEUE_SCHEMA_VERSION = 2
+
+# 일꾼이 할 일 하나를 들고 있을 수 있는 시간(초)이에요
+# 이 시간이 지나도 "처리 중"이면 일꾼이 멈췄다고 보고 다른 일꾼이 다시 가져가요
+LEASE_SECONDS = float(os.getenv('AUCTION_CRAWL_LEASE_SECONDS', '300'))
+
+# 시/도 1페이지에서 본 마지막 페이지가 이보다 크면 시/군/구별 할 일로 나눠요 (0이면 나누지 않아요)
+SUBREGION_SPLIT_PAGES = int(os.getenv('AUCTION_SUBREGION_SPLIT_PAGES', '5'))
+
+def open_queue(queue_path=QUEUE_PATH):
+    """
+    작업 대기열(SQLite)을 여는 함수
+    처음이면 표를 만들어요
+    """
+    folder = os.path.dirname(queue_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    
+    # isolation_level=None: 트랜잭션을 직접 관리해요 (작업을 안전하게 하나씩 꺼내기 위해)
+    conn = sqlite3.connect(queue_path, timeout=30, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    if conn.execute('PRAGMA user_version').fetchone()[0] != QUEUE_SCHEMA_VERSION:
+        # 표 모양이 다른 예전 대기열은 이어서 할 수 없어서 새로 만들어요
+        conn.execute('DROP TABLE IF EXISTS tasks')
+        conn.execute(f'PRAGMA user_version = {QUEUE_SCHEMA_VERSION}')
+    # subregion_code: 시/군/구 코드 (빈 글자면 시/도 전체)
+    # updated_at: "처리 중"인 일은 일꾼이 가져간 시각이에요 (맡은 시간이 지났는지 볼 때 써요)
+    # last_page, split: 1페이지에서 본 마지막 페이지와 시/군/구로 나눴는지 여부
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            region_order INTEGER NOT NULL,
+            region_code TEXT NOT NULL,
+            region_name TEXT NOT NULL,
+            subregion_code TEXT NOT NULL DEFAULT '',
+            page INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            updated_at REAL,
+            last_page INTEGER,
+            split INTEGER NOT NULL DEFAULT 0,
+            result TEXT,
+            UNIQUE (region_code, subregion_code, page)
+        )
+    """)
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, page, region_order)')
+    return conn
+
+def enqueue_task(conn, region_order, region_code, region_name, page, subregion_code=''):
+    """
+    할 일(지역, 시/군/구, 페이지)을 대기열에 넣는 함수
+    이미 있는 일은 다시 넣지 않아요
+    """
+    conn.execute(
+        'INSERT OR IGNORE INTO tasks (region_order, region_code, region_name, subregion_code, page, updated_at) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        (region_order, region_code, region_name, subregion_code, page, time.time())
+    )
+
+def retry_status(attempts):
+    """실패한 횟수로 다음 상태를 정해요 (아직 더 시도할 수 있으면 대기, 아니면 실패)"""
+    return 'pending' if attempts < MAX_TASK_ATTEMPTS else 'failed'
+
+def record_failure(conn, task_id, attempts):
+    """할 일 하나가 실패했다고 적고, 더 시도할 수 있으면 대기열로 돌려놔요"""
+    conn.execute(
+        'UPDATE tasks SET status = ?, attempts = ?, worker = NULL, updated_at = ? WHERE id = ?',
+        (retry_status(attempts), attempts, time.time(), task_id)
+    )
+
+def requeue_stale_tasks(conn, now=None):
+    """
+    맡은 시간(LEASE_SECONDS)이 지나도 "처리 중"인 일을 대기열로 돌려놓는 함수 (한 번 실패한 것으로 세요)
+    
+    반환값: 돌려놓은 할 일 수
+    """
+    deadline = (now or time.time()) - LEASE_SECONDS
+    cursor = conn.execute(
+        "UPDATE tasks SET status = CASE WHEN attempts + 1 < ? THEN 'pending' ELSE 'failed' END, "
+        "attempts = attempts + 1, worker = NULL WHERE status = 'running' AND updated_at < ?",
+        (MAX_TASK_ATTEMPTS, deadline)
+    )
+    return cursor.rowcount
+
+def release_worker_tasks(conn, worker_id):
+    """
+    죽은 일꾼이 들고 있던 일을 바로 대기열로 돌려놓는 함수 (한 번 실패한 것으로 세요)
+    
+    반환값: 돌려놓은 할 일 수
+    """
+    cursor = conn.execute(
+        "UPDATE tasks SET status = CASE WHEN attempts + 1 < ? THEN 'pending' ELSE 'failed' END, "
+        "attempts = attempts + 1, worker = NULL, updated_at = ? WHERE status = 'running' AND worker = ?",
+        (MAX_TASK_ATTEMPTS, time.time(), worker_id)
+    )
+    return cursor.rowcount
+
+def claim_task(conn, worker_id):
+    """
+    대기 중인 할 일 하나를 꺼내서 "처리 중"으로 표시하는 함수
+    여러 일꾼이 같은 일을 꺼내지 않도록 잠근 상태에서 처리해요
+    
+    반환값: 할 일 정보 사전 (없으면 None)
+    """
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        # 멈춘 일꾼이 들고 있던 일이 있으면 먼저 대기열로 돌려놔요
+        requeue_stale_tasks(conn)
+        row = conn.execute(
+            "SELECT id, region_order, region_code, region_name, subregion_code, page, attempts FROM tasks "
+            "WHERE status = 'pending' ORDER BY page, region_order, subregion_code LIMIT 1"
+        ).fetchone()
+        if row is None:
+            conn.execute('COMMIT')
+            return None
+        conn.execute(
+            "UPDATE tasks SET status = 'running', worker = ?, updated_at = ? WHERE id = ?",
+            (worker_id, time.time(), row[0])
+        )
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    
+    return {
+        'id': row[0],
+        'region_order': row[1],
+        'region_code': row[2],
+        'region_name': row[3],
+        'subregion_code': row[4],
+        'page': row[5],
+        'attempts': row[6]
+    }
+
+def has_running_tasks(conn):
+    """다른 일꾼이 아직 처리 중인 일이 있는지 확인하는 함수"""
+    row = conn.execute("SELECT COUNT(*) FROM tasks WHERE status = 'running'").fetchone()
+    return row[0] > 0
+
+def has_open_tasks(conn):
+    """아직 끝나지 않은(대기 중이거나 처리 중인) 일이 있는지 확인하는 함수"""
+    row = conn.execute("SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'running')").fetchone()
+    return row[0] > 0
+
+def known_subregion_codes(data_folder='data'):
+    """
+    가장 최근 스냅샷에서 시/도별 시/군/구 코드(s3_region2_code)를 모으는 함수
+    API는 시/군/구 코드 목록을 따로 알려주지 않아서, 지난번에 받은 매물에서 배워요
+    
+    반환값: {시/도 코드: [시/군/구 코드, ...]} (스냅샷이 없으면 빈 사전)
+    """
+    path = latest_snapshot(data_folder=data_folder)
+    if path is None:
+        return {}
+    codes = {}
+    try:
+        for item in iter_snapshot_items(path, fields=('s3_region1_code', 's3_region2_code')):
+            region_code, subregion_code = item.get('s3_region1_code'), item.get('s3_region2_code')
+            if region_code and subregion_code:
+                codes.setdefault(str(region_code), set()).add(str(subregion_code))
+    except Exception as e:
+        print(f"⚠️ 시/군/구 코드를 읽지 못했습니다: {e}")
+        return {}
+    return {region_code: sorted(values) for region_code, values in codes.items()}
+
+def split_subregions(task, items, last_page, subregion_codes, split_pages):
+    """
+    시/도 1페이지를 보고 시/군/구별 할 일로 나눌지 정하는 함수
+    지난번에 배운 코드와 이번 1페이지에 나온 코드를 모두 써요
+    
+    반환값: 나눌 시/군/구 코드 목록 (나누지 않으면 빈 목록)
+    """
+    if task['subregion_code'] or task['page'] != 1 or not split_pages or last_page is None or last_page <= split_pages:
+        return []
+    codes = set(subregion_codes.get(task['region_code'], ()))
+    for item in items:
+        if str(item.get('s3_region1_code', '')) == task['region_code'] and item.get('s3_region2_code'):
+            codes.add(str(item['s3_region2_code']))
+    return sorted(codes)
+
+def process_task(conn, task, query_params, subregion_codes, split_pages):
+    """
+    할 일 하나를 처리하는 함수 (페이지를 받아서 결과를 적고, 다음 할 일을 대기열에 넣어요)
+    
+    반환값: 처리했으면 True, 받지 못해서 다시 대기열로 돌려놨으면 False
+    """
+    page = task['page']
+    params = dict(query_params or {})
+    label = task['region_name']
+    if task['subregion_code']:
+        params['s3_region2_code'] = task['subregion_code']
+        label = f"{label}({task['subregion_code']})"
+    page_data = get_auction_data_by_region(
+        task['region_code'], f"{label} {page}페이지",
+        page=page, limit=PAGE_LIMIT, query_params=params,
+        exclude_fields=DASHBOARD_EXCLUDED_FIELDS
+    )
+    
+    if page_data is None or 'data' not in page_data:
+        record_failure(conn, task['id'], task['attempts'] + 1)
+        return False
+    
+    items = page_data['data'] or []
+    last_page = read_last_page(page_data, PAGE_LIMIT) if page == 1 else None
+    subregions = split_subregions(task, items, last_page, subregion_codes, split_pages)
+    
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        conn.execute(
+            "UPDATE tasks SET status = 'done', result = ?, last_page = ?, split = ?, updated_at = ? WHERE id = ?",
+            (json_codec.dumps(items), last_page, 1 if subregions else 0, time.time(), task['id'])
+        )
+        
+        if subregions:
+            # 페이지가 많은 시/도는 나머지 페이지 대신 시/군/구별 1페이지를 대기열에 넣어요
+            for subregion_code in subregions:
+                enqueue_task(conn, task['region_order'], task['region_code'], task['region_name'], 1, subregion_code)
+        else:
+            # 다음 페이지 할 일을 대기열에 넣어요
+            if last_page is not None:
+                next_pages = range(2, last_page + 1)
+            elif len(items) >= PAGE_LIMIT:
+                next_pages = range(page + 1, page + 1 + PREFETCH_PAGES)
+            else:
+                next_pages = []
+            
+            for next_page in next_pages:
+                enqueue_task(
+                    conn, task['region_order'], task['region_code'], task['region_name'],
+                    next_page, task['subregion_code']
+                )
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    return True
+
+def worker_loop(queue_path, worker_id, query_params, subregion_codes=None, split_pages=SUBREGION_SPLIT_PAGES):
+    """
+    일꾼 프로세스가 하는 일
+    대기열에서 할 일을 꺼내서 처리하고, 더 할 일이 없으면 끝나요
+    할 일 하나에서 오류가 나도 그 일만 실패로 적고 다음 일을 계속해요
+    """
+    
+    conn = open_queue(queue_path)
+    processed = 0
+    subregion_codes = subregion_codes or {}
+    
+    while True:
+        task = claim_task(conn, worker_id)
+        if task is None:
+            # 다른 일꾼이 처리 중인 일에서 새 페이지가 생길 수 있으니 잠깐 기다려요
+            # (멈춘 일꾼의 일은 맡은 시간이 지나면 claim_task가 대기열로 돌려놔요)
+            if has_running_tasks(conn):
+                time.sleep(0.2)
+                continue
+            break
+        
+        try:
+            if process_task(conn, task, query_params, subregion_codes, split_pages):
+                processed += 1
+        except Exception as e:
+            print(f"⚠️ 일꾼 {worker_id}: {task['region_name']} {task['page']}페이지 처리 중 오류: {e}")
+            record_failure(conn, task['id'], task['attempts'] + 1)
+    
+    conn.close()
+    print(f"👷 일꾼 {worker_id}: {processed}개 작업 완료")
+
+def run_workers(conn, queue_path, workers, query_params, subregion_codes, split_pages):
+    """
+    일꾼 프로세스들을 띄우고 모두 끝날 때까지 지켜보는 함수
+    일꾼이 비정상으로 끝나면(exitcode가 0이 아니면) 들고 있던 일을 대기열로 돌려놓고,
+    남은 일이 있으면 새 일꾼을 띄워요 (처음 일꾼 수만큼까지)
+    """
+    processes = {}
+    
+    def start_worker(worker_id):
+        process = multiprocessing.Process(
+            target=worker_loop,
+            args=(queue_path, worker_id, query_params, subregion_codes, split_pages)
+        )
+        process.start()
+        processes[worker_id] = process
+    
+    worker_count = max(1, workers)
+    for index in range(worker_count):
+        start_worker(f"worker-{index + 1}")
+    
+    restarts = 0
+    while processes:
+        sentinels = {process.sentinel: worker_id for worker_id, process in processes.items()}
+        ready = multiprocessing.connection.wait(list(sentinels), timeout=1.0)
+        if not ready and not has_open_tasks(conn):
+            # 남은 일이 없는데도 끝나지 않는 일꾼은 멈춘 것이라 정리해요
+            # (그 일꾼이 들고 있던 일은 맡은 시간이 지나서 다른 일꾼이 이미 끝냈어요)
+            for worker_id, process in processes.items():
+                print(f"⚠️ 일꾼 {worker_id}이(가) 응답하지 않아서 멈춥니다")
+                process.terminate()
+                process.join()
+            break
+        for sentinel in ready:
+            worker_id = sentinels[sentinel]
+            process = processes.pop(worker_id)
+            process.join()
+            if process.exitcode == 0:
+                continue
+            
+            released = release_worker_tasks(conn, worker_id)
+            print(f"⚠️ 일꾼 {worker_id}이(가) 비정상 종료했습니다 (exitcode {process.exitcode}), 맡은 일 {released}개를 돌려놨습니다")
+            if restarts < worker_count and has_open_tasks(conn):
+                restarts += 1
+                start_worker(f"worker-r{restarts}")
+    
+    if has_open_tasks(conn):
+        print("⚠️ 일꾼이 모두 끝났지만 남은 일이 있습니다 (--resume으로 이어서 할 수 있어요)")
+
+def incomplete_splits(conn):
+    """
+    시/군/구로 나눈 시/도 중에 받은 매물 수가 1페이지에서 본 전체보다 적은 곳을 찾는 함수
+    (지난번에 없던 시/군/구가 새로 생기면 그곳 매물을 놓칠 수 있어서 확인해요)
+    
+    반환값: [(1페이지 할 일 번호, 지역 순서, 지역 코드, 지역 이름, 마지막 페이지), ...]
+    """
+    incomplete = []
+    split_rows = conn.execute(
+        "SELECT id, region_order, region_code, region_name, last_page FROM tasks WHERE split = 1 AND status = 'done'"
+    ).fetchall()
+    for task_id, region_order, region_code, region_name, last_page in split_rows:
+        uids = set()
+        for (result,) in conn.execute(
+            "SELECT result FROM tasks WHERE region_code = ? AND status = 'done'", (region_code,)
+        ):
+            uids.update(item.get('uid') for item in json_codec.loads(result or '[]'))
+        # 마지막 페이지가 N이면 매물은 적어도 (N - 1) x 페이지 크기 + 1개 있어요
+        if len(uids) < (last_page - 1) * PAGE_LIMIT + 1:
+            incomplete.append((task_id, region_order, region_code, region_name, last_page))
+    return incomplete
+
+def seed_queue(conn, regions, resume=False):
+    """
+    처음 할 일(각 지역의 1페이지)을 대기열에 넣는 함수
+    
+    매개변수 설명:
+    - regions: (지역코드, 지역이름) 목록
+    - resume: True면 이전 작업을 지우지 않고 이어서 해요
+    """
+    if resume:
+        # 처리 중에 멈춘 일은 다시 대기 상태로 돌려놔요
+        conn.execute("UPDATE tasks SET status = 'pending' WHERE status = 'running'")
+    else:
+        conn.execute('DELETE FROM tasks')
+    
+    for region_order, (region_code, region_name) in enumerate(regions):
+        enqueue_task(conn, region_order, region_code, region_name, 1)
+
+def merge_results(conn):
+    """
+    처리가 끝난 모든 페이지의 매물을 지역 순서, 페이지 순서대로 합치는 함수
+    여러 페이지에 같은 매물이 있으면 한 번만 남겨요
+    """
+    all_data = []
+    seen_uids = set()
+    
+    rows = conn.execute(
+        "SELECT result FROM tasks WHERE status = 'done' ORDER BY region_order, subregion_code, page"
+    )
+    for (result,) in rows:
+        for item in json_codec.loads(result or '[]'):
+            uid = item.get('uid')
+            if uid is not None:
+                if uid in seen_uids:
+                    continue
+                seen_uids.add(uid)
+            all_data.append(item)
+    
+    failed = conn.execute(
+        "SELECT region_name, subregion_code, page FROM tasks WHERE status = 'failed' "
+        "ORDER BY region_order, subregion_code, page"
+    ).fetchall()
+    for region_name, subregion_code, page in failed:
+        label = f"{region_name}({subregion_code})" if subregion_code else region_name
+        print(f"⚠️ {label} {page}페이지를 끝내 가져오지 못했습니다")
+    
+    return all_data
+
+def run_sharded_crawl(region_names=None, workers=4, queue_path=QUEUE_PATH, resume=False, filename=None,
+                      split_pages=SUBREGION_SPLIT_PAGES):
+    """
+    여러 프로세스로 나눠서 경매 정보를 수집하고 하나의 스냅샷으로 저장하는 함수
+    
+    매개변수 설명:
+    - region_names: 수집할 시/도 이름 목록 (없으면 전국)
+    - workers: 일꾼 프로세스 수
+    - queue_path: 작업 대기열 파일 위치
+    - resume: True면 중단된 작업을 이어서 해요
+    - filename: 저장할 파일 이름 (없으면 nationwide_auction_data_날짜_시간.json)
+    - split_pages: 시/도의 마지막 페이지가 이보다 크면 시/군/구별로 나눠서 받아요 (0이면 나누지 않아요)
+    
+    반환값: 저장된 데이터 ({'data': [...]}) - 실패하면 None
+    """
+    
+    start_time = time.time()
+    region_names = region_names or list(SIDO_REGION_CODES)
+    
+    # 지역은 시/도별로 나누고, 가격은 API 조건으로 보내요
+    plan = plan_auction_query(region_names, TARGET_PROPERTY_TYPES, MAX_PRICE)
+    regions = plan['regions']
+    
+    print(f"🗺️ 분산 수집 시작: {len(regions)}개 지역, 일꾼 {workers}명")
+    
+    conn = open_queue(queue_path)
+    seed_queue(conn, regions, resume=resume)
+    subregion_codes = known_subregion_codes() if split_pages else {}
+    
+    run_workers(conn, queue_path, workers, plan['params'], subregion_codes, split_pages)
+    
+    # 시/군/구로 나눠 받은 매물이 시/도 전체보다 적으면, 그 시/도는 나머지 페이지를 그대로 받아요
+    incomplete = incomplete_splits(conn)
+    if incomplete:
+        for task_id, region_order, region_code, region_name, last_page in incomplete:
+            print(f"⚠️ {region_name}: 시/군/구별로 받은 매물이 모자라서 2~{last_page}페이지를 그대로 받습니다")
+            conn.execute('UPDATE tasks SET split = 0 WHERE id = ?', (task_id,))
+            for page in range(2, last_page + 1):
+                enqueue_task(conn, region_order, region_code, region_name, page)
+        run_workers(conn, queue_path, workers, plan['params'], subregion_codes, 0)
+    
+    all_data = merge_results(conn)
+    conn.close()
+    
+    print(f"📊 총 {len(all_data)}개의 데이터를 수집했습니다")
+    
+    # 서버가 걸러주지 못한 나머지 조건으로 걸러요
+    residual = plan['residual']
+    predicate = compile_auction_filter(residual)
+    filtered = filter_items(all_data, predicate)
+    print(f"✅ 필터링 완료: {len(filtered)}개가 조건에 맞습니다")
+    
+    result = {
+        'search_conditions': {
+            'regions': region_names,
+            'price_range': '0~6억 미만',
+            'property_types': list(TARGET_PROPERTY_TYPES)
+        },
+        'data': filtered
+    }
+    
+    if filename is None:
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        filename = f"nationwide_auction_data_{timestamp}.json"
+    
+    if not save_to_json(result, filename):
+        return None
+    
+    print(f"⏱️ 실행 시간: {time.time() - start_time:.2f}초")
+    return result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='여러 프로세스로 전국 경매 정보를 나눠서 수집합니다')
+    parser.add_argument('--workers', type=int, default=max(2, os.cpu_count() or 2), help='일꾼 프로세스 수')
+    parser.add_argument('--regions', default='', help='수집할 시/도 이름 (쉼표로 구분, 없으면 전국)')
+    parser.add_argument('--resume', action='store_true', help='중단된 작업 이어서 하기')
+    parser.add_argument('--output', default=None, help='저장할 파일 이름')
+    parser.add_argument('--split-pages', type=int, default=SUBREGION_SPLIT_PAGES,
+                        help='시/도의 마지막 페이지가 이보다 크면 시/군/구별로 나눠서 받기 (0이면 나누지 않기)')
+    args = parser.parse_args()
+    
+    names = [name.strip() for name in args.regions.split(',') if name.strip()] or None
+    run_sharded_crawl(names, workers=args.workers, resume=args.resume, filename=args.output,
+                      split_pages=args.split_pages)
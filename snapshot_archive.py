@@ -0,0 +1,220 @@
+# 오래된 스냅샷을 단계별로 줄여서 월별 보관함(zip)에 넣어두는 도구예요
+# - 최근 KEEP_ALL_DAYS일: 모든 스냅샷을 data 폴더에 그대로 둬요
+# - 그 뒤 KEEP_DAILY_DAYS일까지: 종류마다 하루에 하나(그날 가장 늦은 것)만 남겨요
+# - 그보다 오래된 것: 종류마다 한 주에 하나(그 주에 가장 늦은 것)만 남겨요
+# 남긴 오래된 스냅샷은 data/archive/<종류>_auction_data_<연-월>.zip 에 압축해서 넣어요
+# 보관함 안의 스냅샷도 목록표(snapshot_catalog)와 열 저장소(columnar_history)가 그대로 읽을 수 있어요
+# 마치 오래된 사진을 앨범에 골라 담아 창고에 넣어두고, 필요할 때 꺼내 보는 것과 같아요!
+#
+# 사용법:
+#   python snapshot_archive.py                 # 보관 규칙대로 정리하기
+#   python snapshot_archive.py --dry-run       # 무엇이 바뀔지 보기만 하기
+#   python snapshot_archive.py --keep-all-days 14 --keep-daily-days 90
+
+import argparse
+import os
+import time
+import zipfile
+from collections import defaultdict
+from datetime import datetime
+
+from json_stream import load_snapshot
+from snapshot_catalog import SNAPSHOT_KINDS, parse_snapshot_name
+from snapshot_files import (
+    ARCHIVE_DIRNAME, dump_json_bytes, list_archived_snapshots,
+    snapshot_mtime, snapshot_name, snapshot_stem, split_archive_path
+)
+from snapshot_store import collect_garbage, list_snapshots
+
+# 모든 스냅샷을 그대로 두는 기간(일)이에요
+KEEP_ALL_DAYS = int(os.getenv('AUCTION_KEEP_ALL_DAYS', '30'))
+
+# 하루에 하나씩 남기는 기간(일)이에요 (이보다 오래되면 한 주에 하나)
+KEEP_DAILY_DAYS = int(os.getenv('AUCTION_KEEP_DAILY_DAYS', '180'))
+
+ARCHIVE_COMPRESS_LEVEL = 9
+
+# zip 파일에는 1980년 이전 시각을 적을 수 없어요
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+def retention_bucket(snapshot_date, today, keep_all_days=KEEP_ALL_DAYS, keep_daily_days=KEEP_DAILY_DAYS):
+    """
+    스냅샷 날짜가 어느 보관 단계에 속하는지 알려주는 함수
+    
+    매개변수 설명:
+    - snapshot_date: 스냅샷 날짜 ('2025-09-25' 형태)
+    - today: 오늘 날짜 (date)
+    
+    반환값: 모두 남기면 None, 하루에 하나면 ('day', 날짜), 한 주에 하나면 ('week', '연-W주')
+    """
+    day = datetime.strptime(snapshot_date, '%Y-%m-%d').date()
+    age = (today - day).days
+    if age < keep_all_days:
+        return None
+    if age < keep_daily_days:
+        return ('day', snapshot_date)
+    year, week, _ = day.isocalendar()
+    return ('week', f"{year}-W{week:02d}")
+
+def archive_path_for(snapshot_path, data_folder='data'):
+    """
+    스냅샷이 들어갈 월별 보관함 경로를 알려주는 함수
+    예: daily_auction_data_2025-06-29.json → data/archive/daily_auction_data_2025-06.zip
+    """
+    kind, stamp, snapshot_date = parse_snapshot_name(snapshot_name(snapshot_path))
+    prefix = snapshot_stem(snapshot_name(snapshot_path))[:-len(stamp)]
+    return os.path.join(data_folder, ARCHIVE_DIRNAME, f"{prefix}{snapshot_date[:7]}.zip")
+
+def plan_retention(paths, today=None, keep_all_days=KEEP_ALL_DAYS, keep_daily_days=KEEP_DAILY_DAYS):
+    """
+    스냅샷마다 남길지, 보관함에 넣을지, 지울지 정하는 함수
+    종류(daily, fresh 등)마다 따로 하루/한 주 단위로 묶고, 묶음에서 가장 늦은 스냅샷 하나만 남겨요
+    
+    매개변수 설명:
+    - paths: data 폴더와 보관함에 있는 스냅샷 경로들
+    - today: 오늘 날짜 (없으면 지금)
+    
+    반환값: {'keep': [...], 'archive': [...], 'drop': [...]}
+            keep은 그대로 둘 것(최근 스냅샷과 이미 보관함에 있는 것), archive는 보관함에 넣을 것, drop은 지울 것
+    """
+    today = today or datetime.now().date()
+    plan = {'keep': [], 'archive': [], 'drop': []}
+    groups = defaultdict(list)
+    
+    for path in paths:
+        kind, stamp, snapshot_date = parse_snapshot_name(snapshot_name(path))
+        if kind not in SNAPSHOT_KINDS.values() or snapshot_date is None:
+            # 날짜를 알 수 없는 스냅샷은 건드리지 않아요
+            plan['keep'].append(path)
+            continue
+        bucket = retention_bucket(snapshot_date, today, keep_all_days, keep_daily_days)
+        if bucket is None:
+            plan['keep'].append(path)
+        else:
+            groups[(kind, bucket)].append((stamp, path))
+    
+    for members in groups.values():
+        # 같은 시각이면 data 폴더의 원본을 보관함 것보다 먼저 골라요 (다시 저장한 스냅샷이 더 새로워요)
+        members.sort(key=lambda member: (member[0], split_archive_path(member[1])[1] is None))
+        _, keeper = members[-1]
+        for _, path in members[:-1]:
+            plan['drop'].append(path)
+        if split_archive_path(keeper)[1] is None:
+            plan['archive'].append(keeper)
+        else:
+            plan['keep'].append(keeper)
+    
+    return plan
+
+def _zip_time(timestamp):
+    return max(_ZIP_EPOCH, time.localtime(timestamp)[:6])
+
+def rewrite_archive(archive_path, add_paths=(), drop_members=()):
+    """
+    월별 보관함 하나를 다시 만드는 함수
+    zip 파일은 안의 파일을 지울 수 없어서, 남길 것과 새로 넣을 것으로 새 보관함을 만들어 바꿔치기해요
+    
+    매개변수 설명:
+    - archive_path: 보관함 경로
+    - add_paths: 새로 넣을 스냅샷 파일 경로들 (참조 방식이면 매물 정보를 풀어서 넣어요)
+    - drop_members: 보관함에서 뺄 스냅샷 이름들
+    
+    반환값: 다시 만든 보관함 안의 스냅샷 수
+    """
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    additions = {snapshot_stem(snapshot_name(path)) + '.json': path for path in add_paths}
+    skipped = set(drop_members) | set(additions)
+    
+    temp_path = f"{archive_path}.tmp"
+    count = 0
+    with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=ARCHIVE_COMPRESS_LEVEL) as target:
+        if os.path.exists(archive_path):
+            with zipfile.ZipFile(archive_path) as source:
+                for info in source.infolist():
+                    if info.filename in skipped:
+                        continue
+                    # 이름과 시각은 그대로 두고 옮겨요
+                    target.writestr(info, source.read(info.filename), compresslevel=ARCHIVE_COMPRESS_LEVEL)
+                    count += 1
+        
+        for member, path in sorted(additions.items()):
+            # 보관함 안에는 참조를 풀어 둔 공백 없는 JSON으로 넣어요 (객체 폴더 없이도 읽을 수 있어요)
+            info = zipfile.ZipInfo(member, date_time=_zip_time(snapshot_mtime(path)))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(info, dump_json_bytes(load_snapshot(path), 'compact'), compresslevel=ARCHIVE_COMPRESS_LEVEL)
+            count += 1
+    
+    if count:
+        os.replace(temp_path, archive_path)
+    else:
+        os.remove(temp_path)
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+    return count
+
+def apply_retention(data_folder='data', keep_all_days=KEEP_ALL_DAYS, keep_daily_days=KEEP_DAILY_DAYS,
+                    today=None, dry_run=False):
+    """
+    보관 규칙대로 스냅샷을 정리하는 함수
+    보관함을 먼저 다 만든 다음에 data 폴더의 원본을 지워서, 중간에 멈춰도 스냅샷을 잃지 않아요
+    
+    매개변수 설명:
+    - data_folder: 스냅샷 폴더
+    - keep_all_days / keep_daily_days: 보관 단계 기간(일)
+    - today: 오늘 날짜 (없으면 지금)
+    - dry_run: True면 계획만 세우고 아무것도 바꾸지 않아요
+    
+    반환값: {'archived': 보관함에 넣은 수, 'dropped': 지운 수, 'archives': 다시 만든 보관함 수, 'objects': 지운 객체 수}
+    """
+    stats = {'archived': 0, 'dropped': 0, 'archives': 0, 'objects': 0}
+    if not os.path.isdir(data_folder):
+        return stats
+    
+    plan = plan_retention(
+        list_snapshots(data_folder) + list_archived_snapshots(data_folder),
+        today, keep_all_days, keep_daily_days
+    )
+    stats['archived'] = len(plan['archive'])
+    stats['dropped'] = len(plan['drop'])
+    if dry_run:
+        stats['archives'] = len({archive_path_for(path, data_folder) for path in plan['archive']})
+        return stats
+    
+    # 보관함마다 넣을 것과 뺄 것을 모아요
+    changes = defaultdict(lambda: ([], []))
+    for path in plan['archive']:
+        changes[archive_path_for(path, data_folder)][0].append(path)
+    for path in plan['drop']:
+        archive_path, member = split_archive_path(path)
+        if member is not None:
+            changes[archive_path][1].append(member)
+    
+    for archive_path, (add_paths, drop_members) in sorted(changes.items()):
+        rewrite_archive(archive_path, add_paths, drop_members)
+        stats['archives'] += 1
+    
+    # 보관함에 들어갔거나 지우기로 한 원본을 data 폴더에서 지워요
+    for path in plan['archive'] + plan['drop']:
+        if split_archive_path(path)[1] is None and os.path.exists(path):
+            os.remove(path)
+    
+    # 지운 스냅샷만 쓰던 매물 객체도 함께 정리해요
+    stats['objects'] = collect_garbage(data_folder)
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='오래된 스냅샷을 줄여서 월별 보관함에 넣습니다')
+    parser.add_argument('--data-folder', default='data', help='스냅샷 폴더')
+    parser.add_argument('--keep-all-days', type=int, default=KEEP_ALL_DAYS, help='모든 스냅샷을 남기는 기간(일)')
+    parser.add_argument('--keep-daily-days', type=int, default=KEEP_DAILY_DAYS, help='하루에 하나씩 남기는 기간(일)')
+    parser.add_argument('--dry-run', action='store_true', help='바꾸지 않고 계획만 보기')
+    args = parser.parse_args()
+    
+    result = apply_retention(args.data_folder, args.keep_all_days, args.keep_daily_days, dry_run=args.dry_run)
+    action = '정리할 예정' if args.dry_run else '정리 완료'
+    print(
+        f"🗄️ {action}: 보관함에 넣을 스냅샷 {result['archived']}개, 지울 스냅샷 {result['dropped']}개, "
+        f"보관함 {result['archives']}개"
+    )
+    if result['objects']:
+        print(f"🧹 더 이상 쓰지 않는 매물 객체 {result['objects']}개를 정리했습니다")
@@ -0,0 +1,303 @@
+# data 폴더의 스냅샷 목록을 SQLite "목록표(카탈로그)"로 관리하는 도구예요
+# 가장 최신 스냅샷을 찾거나 특정 매물이 들어 있는 스냅샷을 찾을 때마다
+# 폴더의 모든 파일을 열어보는 대신, 목록표에서 한 번의 검색으로 찾아요
+# 마치 도서관에서 책장을 다 뒤지지 않고 도서 목록 카드에서 바로 찾는 것과 같아요!
+#
+# 목록표는 .cache 폴더에 있어서 지워져도 괜찮아요 (다음에 쓸 때 스냅샷으로 다시 만들어요)
+#
+# 사용법:
+#   python snapshot_catalog.py                 # 목록표를 data 폴더와 맞추고 현황 보기
+#   python snapshot_catalog.py --rebuild       # 목록표를 처음부터 다시 만들기
+#   python snapshot_catalog.py --uid 507066    # 이 매물이 들어 있는 스냅샷 찾기
+
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from json_stream import iter_snapshot_items
+from snapshot_files import (
+    archived_snapshot_stats, is_snapshot_file, open_snapshot_raw, snapshot_mtime, snapshot_name,
+    snapshot_size, snapshot_stem
+)
+
+# 목록표 파일 위치예요
+CATALOG_PATH = os.path.join('.cache', 'snapshot_catalog.sqlite3')
+
+# 파일 이름 앞부분으로 스냅샷 종류를 구분해요
+SNAPSHOT_KINDS = {
+    'daily_auction_data_': 'daily',
+    'fresh_auction_data_': 'fresh',
+    'custom_auction_data_': 'custom',
+    'nationwide_auction_data_': 'nationwide'
+}
+
+# 목록표에 적어두는 매물 항목이에요
+INDEXED_FIELDS = ('uid', 'region', 'maemulinfo', 'minprice')
+
+_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+def open_catalog(catalog_path=CATALOG_PATH):
+    """
+    목록표(SQLite)를 여는 함수
+    처음이면 표와 색인을 만들어요
+    """
+    folder = os.path.dirname(catalog_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    
+    conn = sqlite3.connect(catalog_path, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL UNIQUE,
+            kind TEXT NOT NULL,
+            stamp TEXT NOT NULL,
+            snapshot_date TEXT,
+            collected_at TEXT,
+            item_count INTEGER NOT NULL,
+            checksum TEXT NOT NULL,
+            indexed_at REAL,
+            file_size INTEGER,
+            file_mtime REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_snapshots_latest ON snapshots (kind, collected_at, stamp);
+        CREATE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots (kind, snapshot_date);
+        
+        CREATE TABLE IF NOT EXISTS snapshot_items (
+            snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+            uid INTEGER,
+            region TEXT,
+            maemulinfo TEXT,
+            minprice INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_items_uid ON snapshot_items (uid);
+        CREATE INDEX IF NOT EXISTS idx_items_region_type ON snapshot_items (region, maemulinfo);
+        CREATE INDEX IF NOT EXISTS idx_items_snapshot ON snapshot_items (snapshot_id);
+    """)
+    # 크기와 수정 시각 칸이 없던 예전 목록표에는 칸을 더해요 (비어 있는 줄은 다음에 맞출 때 다시 적어요)
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(snapshots)')}
+    for column, column_type in (('file_size', 'INTEGER'), ('file_mtime', 'REAL')):
+        if column not in columns:
+            conn.execute(f'ALTER TABLE snapshots ADD COLUMN {column} {column_type}')
+    conn.execute('PRAGMA foreign_keys=ON')
+    return conn
+
+def parse_snapshot_name(filename):
+    """
+    스냅샷 파일 이름에서 종류와 날짜 표시를 읽어내는 함수
+    예: daily_auction_data_2025-09-25.json.gz → ('daily', '2025-09-25', '2025-09-25')
+    
+    반환값: (종류, 날짜_시간 표시, 날짜) - 날짜가 없으면 날짜는 None
+    """
+    stem = snapshot_stem(filename)
+    kind, stamp = 'other', stem
+    for prefix, name in SNAPSHOT_KINDS.items():
+        if stem.startswith(prefix):
+            kind, stamp = name, stem[len(prefix):]
+            break
+    match = _DATE_PATTERN.match(stamp)
+    return kind, stamp, match.group(0) if match else None
+
+def file_checksum(filepath):
+    """파일 내용의 지문(sha256)을 계산해요 (보관함 안의 스냅샷이면 그 스냅샷 내용으로 계산해요)"""
+    digest = hashlib.sha256()
+    with open_snapshot_raw(filepath) as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def register_snapshot(conn, filepath, items=None, search_conditions=None):
+    """
+    스냅샷 하나를 목록표에 적는 함수 (이미 있으면 새 내용으로 바꿔요)
+    
+    매개변수 설명:
+    - conn: open_catalog로 연 목록표
+    - filepath: 스냅샷 파일 경로
+    - items / search_conditions: 방금 저장한 내용이 있으면 넘겨주세요 (파일을 다시 읽지 않아요)
+    """
+    if items is None:
+        meta = {}
+        items = list(iter_snapshot_items(filepath, fields=INDEXED_FIELDS, meta=meta))
+        search_conditions = meta.get('search_conditions')
+    
+    kind, stamp, snapshot_date = parse_snapshot_name(snapshot_name(filepath))
+    collected_at = (search_conditions or {}).get('collected_at')
+    file_size, file_mtime = snapshot_size(filepath), snapshot_mtime(filepath)
+    
+    with conn:
+        conn.execute('DELETE FROM snapshots WHERE path = ?', (filepath,))
+        cursor = conn.execute(
+            'INSERT INTO snapshots (path, kind, stamp, snapshot_date, collected_at, item_count, checksum, indexed_at, '
+            'file_size, file_mtime) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (
+                filepath, kind, stamp, snapshot_date, collected_at, len(items), file_checksum(filepath), time.time(),
+                file_size, file_mtime
+            )
+        )
+        snapshot_id = cursor.lastrowid
+        conn.executemany(
+            'INSERT INTO snapshot_items (snapshot_id, uid, region, maemulinfo, minprice) VALUES (?, ?, ?, ?, ?)',
+            [
+                (snapshot_id, item.get('uid'), item.get('region'), item.get('maemulinfo'), item.get('minprice'))
+                for item in items
+            ]
+        )
+
+def sync_catalog(conn, data_folder='data'):
+    """
+    목록표를 data 폴더(월별 보관함 포함)와 맞추는 함수
+    파일 이름, 크기, 수정 시각을 비교해서 새 스냅샷이나 다시 쓰인 스냅샷은 (다시) 적고, 사라진 스냅샷은 지워요
+    (파일 내용은 열어보지 않아서 빨라요)
+    
+    반환값: (새로 적거나 다시 적은 수, 지운 수)
+    """
+    if not os.path.isdir(data_folder):
+        return 0, 0
+    
+    on_disk = {}
+    for filename in os.listdir(data_folder):
+        if is_snapshot_file(filename):
+            filepath = os.path.join(data_folder, filename)
+            stat = os.stat(filepath)
+            on_disk[filepath] = (stat.st_size, stat.st_mtime)
+    on_disk.update(archived_snapshot_stats(data_folder))
+    prefix = os.path.join(data_folder, '')
+    in_catalog = {
+        path: (file_size, file_mtime) for path, file_size, file_mtime in conn.execute(
+            'SELECT path, file_size, file_mtime FROM snapshots WHERE substr(path, 1, ?) = ?', (len(prefix), prefix)
+        )
+    }
+    
+    removed = in_catalog.keys() - on_disk.keys()
+    if removed:
+        with conn:
+            conn.executemany('DELETE FROM snapshots WHERE path = ?', [(path,) for path in removed])
+    
+    # 이름이 같아도 크기나 수정 시각이 다르면 다시 쓰인 스냅샷이라 매물 수와 지문을 다시 구해요
+    changed = [path for path, stats in on_disk.items() if in_catalog.get(path, stats) != stats]
+    
+    added = 0
+    for filepath in sorted((on_disk.keys() - in_catalog.keys()) | set(changed)):
+        try:
+            register_snapshot(conn, filepath)
+            added += 1
+        except Exception as e:
+            print(f"⚠️ 스냅샷 {filepath}을 목록표에 적지 못했습니다: {e}")
+    
+    return added, len(removed)
+
+def _connect(data_folder, catalog_path):
+    conn = open_catalog(catalog_path)
+    added, removed = sync_catalog(conn, data_folder)
+    if added or removed:
+        print(f"🗂️ 스냅샷 목록표 갱신: {added}개 추가/갱신, {removed}개 삭제")
+    return conn
+
+def latest_snapshot(kinds=None, data_folder='data', catalog_path=CATALOG_PATH):
+    """
+    가장 최근에 수집된 스냅샷 경로를 찾는 함수
+    수집 시각(collected_at)이 가장 늦은 것을 고르고, 없으면 파일 이름의 날짜로 비교해요
+    
+    매개변수 설명:
+    - kinds: 찾을 스냅샷 종류들 (예: ('daily', 'fresh')) - None이면 모든 종류
+    
+    반환값: 파일 경로 (없으면 None)
+    """
+    conn = _connect(data_folder, catalog_path)
+    try:
+        query = 'SELECT path FROM snapshots'
+        params = []
+        if kinds:
+            query += f" WHERE kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        query += ' ORDER BY collected_at DESC, stamp DESC, path DESC LIMIT 1'
+        row = conn.execute(query, params).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+def snapshots_since(days, kind='daily', data_folder='data', catalog_path=CATALOG_PATH, with_checksum=False):
+    """
+    최근 N일 안의 스냅샷을 날짜순으로 찾는 함수
+    
+    매개변수 설명:
+    - with_checksum: True면 파일 내용의 지문(sha256)도 함께 돌려줘요
+    
+    반환값: [(날짜, 파일 경로), ...] (with_checksum이면 [(날짜, 파일 경로, 지문), ...])
+    """
+    # "날짜 0시 >= 지금 - N일"인 날짜만 남겨요 (시각이 0시가 아니면 그날은 빠져요)
+    cutoff = datetime.now() - timedelta(days=days)
+    first_date = cutoff.date() if cutoff.time() == datetime.min.time() else cutoff.date() + timedelta(days=1)
+    first_date = first_date.strftime('%Y-%m-%d')
+    conn = _connect(data_folder, catalog_path)
+    try:
+        columns = 'snapshot_date, path, checksum' if with_checksum else 'snapshot_date, path'
+        return conn.execute(
+            f'SELECT {columns} FROM snapshots '
+            'WHERE kind = ? AND snapshot_date IS NOT NULL AND snapshot_date >= ? '
+            'ORDER BY snapshot_date, path',
+            (kind, first_date)
+        ).fetchall()
+    finally:
+        conn.close()
+
+def snapshots_containing(uid, data_folder='data', catalog_path=CATALOG_PATH):
+    """
+    특정 매물(uid)이 들어 있는 모든 스냅샷을 찾는 함수
+    
+    반환값: [(파일 경로, 종류, 수집 시각), ...] (수집 시각 순)
+    """
+    conn = _connect(data_folder, catalog_path)
+    try:
+        return conn.execute(
+            'SELECT snapshots.path, snapshots.kind, snapshots.collected_at FROM snapshot_items '
+            'JOIN snapshots ON snapshots.id = snapshot_items.snapshot_id '
+            'WHERE snapshot_items.uid = ? ORDER BY snapshots.collected_at, snapshots.stamp',
+            (uid,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+def record_saved_snapshot(filepath, snapshot, catalog_path=CATALOG_PATH):
+    """
+    save_to_json이 스냅샷을 저장한 뒤 부르는 함수
+    목록표에 바로 적어두고, 실패해도 저장은 성공한 것으로 둬요 (목록표는 나중에 다시 맞출 수 있어요)
+    """
+    try:
+        conn = open_catalog(catalog_path)
+        try:
+            register_snapshot(conn, filepath, snapshot.get('data') or [], snapshot.get('search_conditions'))
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"⚠️ 스냅샷 목록표에 적지 못했습니다 (다음에 다시 맞춰요): {e}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='스냅샷 목록표(SQLite) 관리 도구')
+    parser.add_argument('--data-folder', default='data', help='스냅샷 폴더')
+    parser.add_argument('--rebuild', action='store_true', help='목록표를 처음부터 다시 만들기')
+    parser.add_argument('--uid', type=int, default=None, help='이 매물이 들어 있는 스냅샷 찾기')
+    args = parser.parse_args()
+    
+    if args.rebuild:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(CATALOG_PATH + suffix):
+                os.remove(CATALOG_PATH + suffix)
+    
+    catalog = _connect(args.data_folder, CATALOG_PATH)
+    for kind_name, count, items in catalog.execute(
+        'SELECT kind, COUNT(*), SUM(item_count) FROM snapshots GROUP BY kind ORDER BY kind'
+    ):
+        print(f"📊 {kind_name}: 스냅샷 {count}개, 매물 {items or 0}건")
+    catalog.close()
+    
+    print(f"📋 가장 최신 스냅샷: {latest_snapshot(data_folder=args.data_folder)}")
+    
+    if args.uid is not None:
+        for path, kind_name, collected_at in snapshots_containing(args.uid, args.data_folder):
+            print(f"   🔎 {collected_at or '-'} [{kind_name}] {path}")
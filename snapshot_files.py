@@ -0,0 +1,238 @@
+# 스냅샷 파일을 어떤 모양으로 저장하고 읽을지 정하는 도구예요
+# - pretty: 사람이 읽기 좋게 들여쓰기한 .json (예전 방식, 기본값)
+# - compact: 공백을 모두 뺀 .json
+# - gzip: 공백을 뺀 JSON을 gzip으로 압축한 .json.gz
+# - zstd: 공백을 뺀 JSON을 zstd로 압축한 .json.zst (zstandard가 없으면 gzip으로 저장해요)
+# 읽을 때는 파일 이름 끝(.json / .json.gz / .json.zst)을 보고 알아서 풀어서 읽어요
+# 오래된 스냅샷은 월별 보관함(data/archive/*.zip)에 들어가고, "보관함 경로::스냅샷 이름"으로 똑같이 읽을 수 있어요
+# 마치 옷을 그냥 걸어두거나, 개어두거나, 압축팩에 넣어두거나 골라서 보관하는 것과 같아요!
+
+import gzip
+import io
+import os
+import time
+import zipfile
+
+import json_codec
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 환경 변수 AUCTION_STORAGE_MODE로 저장 방식을 고를 수 있어요
+STORAGE_MODE = os.getenv('AUCTION_STORAGE_MODE', 'pretty')
+
+# 저장 방식별 파일 이름 끝부분이에요
+MODE_SUFFIXES = {
+    'pretty': '.json',
+    'compact': '.json',
+    'gzip': '.json.gz',
+    'zstd': '.json.zst'
+}
+
+# 스냅샷으로 알아보는 파일 이름 끝부분이에요 (긴 것부터 확인해요)
+SNAPSHOT_SUFFIXES = ('.json.zst', '.json.gz', '.json')
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+# 월별 보관함 폴더예요 (스냅샷 폴더 안에 만들어요)
+ARCHIVE_DIRNAME = 'archive'
+
+# 보관함 안의 스냅샷을 가리킬 때 보관함 경로와 스냅샷 이름 사이에 넣는 표시예요
+# 예: data/archive/daily_auction_data_2025-06.zip::daily_auction_data_2025-06-29.json
+ARCHIVE_MEMBER_SEPARATOR = '::'
+
+def resolve_mode(mode=None):
+    """
+    실제로 쓸 저장 방식을 정하는 함수
+    zstd를 골랐는데 zstandard가 설치되어 있지 않으면 gzip을 써요
+    """
+    mode = mode or STORAGE_MODE
+    if mode not in MODE_SUFFIXES:
+        raise ValueError(f"알 수 없는 저장 방식입니다: {mode} (pretty, compact, gzip, zstd 중 하나)")
+    if mode == 'zstd' and zstandard is None:
+        print("⚠️ zstandard가 설치되어 있지 않아서 gzip으로 압축합니다")
+        return 'gzip'
+    return mode
+
+def snapshot_suffix(filename):
+    """파일 이름이 스냅샷이면 끝부분(.json, .json.gz, .json.zst)을, 아니면 None을 돌려줘요"""
+    for suffix in SNAPSHOT_SUFFIXES:
+        if filename.endswith(suffix):
+            return suffix
+    return None
+
+def is_snapshot_file(filename):
+    """스냅샷 파일인지 이름으로 확인해요 (임시 파일은 빼요)"""
+    return snapshot_suffix(filename) is not None
+
+def snapshot_stem(filename):
+    """
+    파일 이름에서 스냅샷 끝부분을 뺀 이름을 돌려줘요
+    예: daily_auction_data_2025-09-25.json.gz → daily_auction_data_2025-09-25
+    """
+    suffix = snapshot_suffix(filename)
+    return filename[:-len(suffix)] if suffix else filename
+
+def snapshot_path_for(filepath, mode=None):
+    """
+    저장 방식에 맞게 파일 이름 끝부분을 바꾼 경로를 돌려줘요
+    예: data/daily_auction_data_2025-09-25.json + gzip → data/daily_auction_data_2025-09-25.json.gz
+    """
+    folder, filename = os.path.split(filepath)
+    return os.path.join(folder, snapshot_stem(filename) + MODE_SUFFIXES[resolve_mode(mode)])
+
+def sibling_snapshots(filepath):
+    """같은 스냅샷의 다른 저장 방식 파일들을 찾아요 (예: .json 과 .json.gz)"""
+    folder, filename = os.path.split(filepath)
+    stem = snapshot_stem(filename)
+    return [
+        os.path.join(folder, stem + suffix)
+        for suffix in SNAPSHOT_SUFFIXES
+        if stem + suffix != filename and os.path.exists(os.path.join(folder, stem + suffix))
+    ]
+
+def split_archive_path(filepath):
+    """
+    보관함 안의 스냅샷 경로를 (보관함 경로, 스냅샷 이름)으로 나눠요
+    보관함 안의 스냅샷이 아니면 (경로, None)을 돌려줘요
+    """
+    if ARCHIVE_MEMBER_SEPARATOR in filepath:
+        archive_path, member = filepath.split(ARCHIVE_MEMBER_SEPARATOR, 1)
+        return archive_path, member
+    return filepath, None
+
+def archive_member_path(archive_path, member):
+    """보관함 경로와 스냅샷 이름을 이어서 하나의 경로로 만들어요"""
+    return f"{archive_path}{ARCHIVE_MEMBER_SEPARATOR}{member}"
+
+def snapshot_name(filepath):
+    """스냅샷 파일 이름을 돌려줘요 (보관함 안의 스냅샷이면 보관함 안의 이름)"""
+    archive_path, member = split_archive_path(filepath)
+    return member if member is not None else os.path.basename(filepath)
+
+def list_archived_snapshots(data_folder='data'):
+    """월별 보관함에 들어 있는 스냅샷 경로 목록을 돌려줘요"""
+    return list(archived_snapshot_stats(data_folder))
+
+def archived_snapshot_stats(data_folder='data'):
+    """
+    월별 보관함에 들어 있는 스냅샷마다 (크기, 수정 시각)을 알려줘요
+    보관함마다 한 번만 열어서 읽어요 (snapshot_size, snapshot_mtime과 같은 값)
+    
+    반환값: {스냅샷 경로: (바이트 수, 수정 시각)}
+    """
+    archive_folder = os.path.join(data_folder, ARCHIVE_DIRNAME)
+    if not os.path.isdir(archive_folder):
+        return {}
+    
+    stats = {}
+    for filename in sorted(os.listdir(archive_folder)):
+        if not filename.endswith('.zip'):
+            continue
+        archive_path = os.path.join(archive_folder, filename)
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                infos = archive.infolist()
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"⚠️ 보관함 {archive_path}을 읽지 못했습니다: {e}")
+            continue
+        for info in infos:
+            if is_snapshot_file(info.filename):
+                stats[archive_member_path(archive_path, info.filename)] = (info.compress_size, _member_mtime(info))
+    return stats
+
+def _member_mtime(info):
+    # 보관함에는 현지 시각으로 적혀 있어요
+    return time.mktime(info.date_time + (0, 0, -1))
+
+def _archive_info(filepath):
+    archive_path, member = split_archive_path(filepath)
+    with zipfile.ZipFile(archive_path) as archive:
+        return archive.getinfo(member)
+
+def snapshot_size(filepath):
+    """스냅샷이 디스크에서 차지하는 바이트 수예요 (보관함 안이면 압축된 크기)"""
+    if split_archive_path(filepath)[1] is not None:
+        return _archive_info(filepath).compress_size
+    return os.path.getsize(filepath)
+
+def snapshot_mtime(filepath):
+    """스냅샷의 수정 시각이에요 (보관함 안이면 보관할 때 적어둔 원래 파일의 시각)"""
+    if split_archive_path(filepath)[1] is not None:
+        return _member_mtime(_archive_info(filepath))
+    return os.path.getmtime(filepath)
+
+def open_snapshot_raw(filepath):
+    """스냅샷 파일을 저장된 바이트 그대로 읽을 수 있게 열어요 (보관함 안이면 그 스냅샷만 풀어요)"""
+    archive_path, member = split_archive_path(filepath)
+    if member is None:
+        return open(filepath, 'rb')
+    # 보관함을 닫아도 열어둔 스냅샷은 다 읽고 닫을 때까지 쓸 수 있어요
+    with zipfile.ZipFile(archive_path) as archive:
+        return archive.open(member)
+
+def open_snapshot(filepath):
+    """
+    스냅샷 파일을 글자(텍스트)로 읽을 수 있게 여는 함수
+    압축된 파일이면 읽으면서 풀어줘요
+    """
+    if split_archive_path(filepath)[1] is not None:
+        return io.TextIOWrapper(open_snapshot_raw(filepath), encoding='utf-8')
+    suffix = snapshot_suffix(os.path.basename(filepath))
+    if suffix == '.json.gz':
+        return gzip.open(filepath, 'rt', encoding='utf-8')
+    if suffix == '.json.zst':
+        if zstandard is None:
+            raise ImportError(f"{filepath}을 읽으려면 zstandard를 설치해야 해요 (pip install zstandard)")
+        raw = open(filepath, 'rb')
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding='utf-8')
+    return open(filepath, 'r', encoding='utf-8')
+
+def read_head(filepath, size=256):
+    """스냅샷 파일의 앞부분 글자만 읽어요 (압축 파일도 앞부분만 풀어요)"""
+    with open_snapshot(filepath) as file:
+        return file.read(size)
+
+def dump_json(document, mode=None):
+    """저장 방식에 맞게 JSON 글자로 바꿔요 (pretty만 들여쓰기를 해요)"""
+    return json_codec.dumps(document, 2 if resolve_mode(mode) == 'pretty' else None)
+
+def dump_json_bytes(document, mode=None):
+    """dump_json과 같지만 UTF-8 바이트로 돌려줘요 (orjson이면 글자로 바꾸는 단계를 건너뛰어요)"""
+    return json_codec.dumps_bytes(document, 2 if resolve_mode(mode) == 'pretty' else None)
+
+def write_snapshot_file(filepath, document, mode=None):
+    """
+    문서를 저장 방식에 맞게 파일로 저장하는 함수
+    같은 스냅샷의 다른 저장 방식 파일이 있으면 지워서 하나만 남겨요
+    
+    매개변수 설명:
+    - filepath: 저장할 경로 (끝부분은 저장 방식에 맞게 바뀌어요)
+    - document: 저장할 내용
+    - mode: 저장 방식 (없으면 AUCTION_STORAGE_MODE 설정)
+    
+    반환값: 실제로 저장한 파일 경로
+    """
+    mode = resolve_mode(mode)
+    filepath = snapshot_path_for(filepath, mode)
+    data = dump_json_bytes(document, mode)
+    
+    if mode == 'gzip':
+        # mtime=0: 내용이 같으면 압축 파일도 똑같이 만들어져요 (git이 쓸데없는 변경으로 보지 않아요)
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    elif mode == 'zstd':
+        data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    
+    # 임시 파일에 먼저 쓰고 바꿔치기해서 반쯤 쓰인 스냅샷이 생기지 않게 해요
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+    os.replace(temp_path, filepath)
+    
+    for sibling in sibling_snapshots(filepath):
+        os.remove(sibling)
+    
+    return filepath
@@ -0,0 +1,302 @@
+# 스냅샷을 "내용 주소" 방식으로 중복 없이 저장하는 도구예요
+# 매일 수집하는 매물은 대부분 어제와 똑같아서, 매물 내용을 그대로 또 저장하면 같은 내용이 계속 쌓여요
+# 그래서 매물 내용은 data/objects/ 아래에 내용의 지문(해시)을 이름으로 한 번만 저장하고,
+# 스냅샷 파일에는 그 지문 목록만 적어둬요
+# 마치 도서관이 같은 책을 한 권만 두고, 대출 목록에는 책 번호만 적어두는 것과 같아요!
+#
+# 매일 바뀌는 값(D-day, 조회수)은 지문에서 빼고 스냅샷 파일에 직접 적어서
+# 나머지 내용이 같으면 같은 객체를 다시 쓸 수 있게 했어요
+#
+# 사용법:
+#   python snapshot_store.py stats      # 저장 공간 현황 보기
+#   python snapshot_store.py migrate    # 모든 스냅샷을 지금 설정(참조 방식, 저장 모양)으로 바꾸기
+#   python snapshot_store.py migrate --mode gzip   # 압축(.json.gz)까지 한 번에 바꾸기
+#   python snapshot_store.py gc         # 어떤 스냅샷도 쓰지 않는 객체 지우기
+
+import argparse
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import json_codec
+
+from snapshot_files import (
+    is_snapshot_file, open_snapshot, read_head, resolve_mode, snapshot_path_for, write_snapshot_file
+)
+
+# 환경 변수 AUCTION_SNAPSHOT_FORMAT=full로 바꾸면 예전처럼 매물 전체를 스냅샷 파일에 저장해요
+SNAPSHOT_FORMAT = os.getenv('AUCTION_SNAPSHOT_FORMAT', 'refs')
+
+# 스냅샷 파일 옆에 객체를 모아두는 폴더 이름이에요
+OBJECTS_DIRNAME = 'objects'
+
+# 참조 방식 스냅샷을 알아보는 표시와 참조 키예요
+STORAGE_KEY = 'storage'
+STORAGE_REFS = 'refs-v1'
+REF_KEY = '$ref'
+
+# 매일 바뀌어서 객체 지문에서 빼는 값들이에요 (D-day, 조회수)
+VOLATILE_FIELDS = ('daystr', 'realcount')
+
+# 지문(sha256)의 앞부분 몇 글자를 이름으로 쓸지 정해요 (32글자 = 128비트)
+HASH_LENGTH = 32
+
+# 최근에 읽은 객체를 기억해둘 개수예요 (객체는 바뀌지 않으니 마음껏 재사용해요)
+OBJECT_CACHE_SIZE = 20000
+
+_object_cache = OrderedDict()
+
+def _encode(value):
+    # 객체 이름(지문)이 어느 컴퓨터에서나 같도록 지문을 만드는 글자는 항상 기본 json으로 만들어요
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def object_path(objects_folder, ref):
+    """객체 지문으로 파일 위치를 만들어요 (앞 두 글자로 폴더를 나눠요)"""
+    return os.path.join(objects_folder, ref[:2], f"{ref}.json")
+
+def split_record(item):
+    """
+    매물 한 건을 "변하지 않는 내용"과 "매일 바뀌는 값"으로 나누는 함수
+    바뀌는 값 자리는 None으로 남겨서 다시 합칠 때 원래 순서가 유지되게 해요
+    
+    반환값: (객체로 저장할 내용, 스냅샷에 직접 적을 값들)
+    """
+    body = dict(item)
+    volatile = {}
+    for key in VOLATILE_FIELDS:
+        if key in body:
+            volatile[key] = body[key]
+            body[key] = None
+    return body, volatile
+
+def store_record(item, objects_folder):
+    """
+    매물 한 건을 객체로 저장하고 스냅샷에 적을 참조를 돌려주는 함수
+    같은 내용의 객체가 이미 있으면 다시 쓰지 않아요
+    
+    반환값: {'$ref': 지문, 'daystr': ..., 'realcount': ...} 형태의 참조
+    """
+    body, volatile = split_record(item)
+    encoded = _encode(body)
+    ref = hashlib.sha256(encoded).hexdigest()[:HASH_LENGTH]
+    
+    path = object_path(objects_folder, ref)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 먼저 쓰고 바꿔치기해서 반쯤 쓰인 객체가 생기지 않게 해요
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(encoded)
+        os.replace(temp_path, path)
+    
+    reference = {REF_KEY: ref}
+    reference.update(volatile)
+    return reference
+
+def load_object(objects_folder, ref):
+    """
+    객체 하나를 읽어오는 함수 (최근에 읽은 객체는 기억해뒀다가 다시 써요)
+    """
+    key = (objects_folder, ref)
+    cached = _object_cache.get(key)
+    if cached is not None:
+        _object_cache.move_to_end(key)
+        return cached
+    
+    with open(object_path(objects_folder, ref), 'rb') as file:
+        body = json_codec.loads(file.read())
+    
+    _object_cache[key] = body
+    if len(_object_cache) > OBJECT_CACHE_SIZE:
+        _object_cache.popitem(last=False)
+    return body
+
+def resolve_record(reference, objects_folder):
+    """
+    스냅샷의 참조를 원래 매물 정보로 되돌리는 함수
+    
+    매개변수 설명:
+    - reference: {'$ref': 지문, ...매일 바뀌는 값} 형태의 참조
+    - objects_folder: 객체 폴더
+    
+    반환값: 원래 매물 정보 (새 사전이라 바꿔도 다른 스냅샷에 영향이 없어요)
+    """
+    item = dict(load_object(objects_folder, reference[REF_KEY]))
+    for key, value in reference.items():
+        if key != REF_KEY:
+            item[key] = value
+    return item
+
+def objects_folder_for(filepath):
+    """스냅샷 파일이 쓰는 객체 폴더 위치를 알려줘요"""
+    return os.path.join(os.path.dirname(filepath), OBJECTS_DIRNAME)
+
+def write_snapshot(filepath, snapshot, storage_format=None, storage_mode=None):
+    """
+    스냅샷을 파일로 저장하는 함수
+    
+    매개변수 설명:
+    - filepath: 저장할 스냅샷 파일 경로
+    - snapshot: {'search_conditions': ..., 'data': [...], (선택) 'changes': ...}
+    - storage_format: 'refs'(참조 방식) 또는 'full'(전체 저장), 없으면 AUCTION_SNAPSHOT_FORMAT 설정
+    - storage_mode: 파일 모양 (pretty, compact, gzip, zstd), 없으면 AUCTION_STORAGE_MODE 설정
+    
+    반환값: 실제로 저장한 파일 경로 (압축하면 .json.gz처럼 끝부분이 바뀌어요)
+    """
+    storage_format = storage_format or SNAPSHOT_FORMAT
+    
+    if storage_format == 'full':
+        document = snapshot
+    else:
+        objects_folder = objects_folder_for(filepath)
+        # 표시를 맨 앞에 둬서 파일 앞부분만 보고도 참조 방식인지 알 수 있게 해요
+        document = {STORAGE_KEY: STORAGE_REFS}
+        for key, value in snapshot.items():
+            if key == 'data':
+                # 이미 참조인 항목(참조 방식 스냅샷을 다시 저장할 때)은 그대로 둬요
+                value = [
+                    item if isinstance(item, dict) and REF_KEY in item else store_record(item, objects_folder)
+                    for item in value
+                ]
+            document[key] = value
+    
+    return write_snapshot_file(filepath, document, storage_mode)
+
+def is_ref_snapshot(filepath):
+    """
+    스냅샷 파일이 참조 방식인지 파일 앞부분만 읽어서 확인하는 함수
+    """
+    head = read_head(filepath).replace(' ', '')
+    return f'"{STORAGE_KEY}":"{STORAGE_REFS}"' in head
+
+def read_snapshot_document(filepath):
+    """스냅샷 파일을 참조를 풀지 않은 그대로 읽어요"""
+    with open_snapshot(filepath) as file:
+        return json_codec.load(file)
+
+def list_snapshots(data_folder='data'):
+    """data 폴더의 스냅샷 파일 경로 목록을 돌려줘요"""
+    return sorted(
+        os.path.join(data_folder, filename)
+        for filename in os.listdir(data_folder)
+        if is_snapshot_file(filename)
+    )
+
+def migrate_snapshot(filepath, storage_format=None, storage_mode=None):
+    """
+    스냅샷 하나를 지금 설정(참조/전체 저장, 파일 모양)에 맞게 다시 저장하는 함수
+    파일의 수정 시각은 그대로 유지해요 (최신 파일을 시각으로 고르는 곳이 있어서요)
+    
+    매개변수 설명:
+    - storage_format: 'refs' 또는 'full' (없으면 AUCTION_SNAPSHOT_FORMAT 설정)
+    - storage_mode: 'pretty', 'compact', 'gzip', 'zstd' (없으면 AUCTION_STORAGE_MODE 설정)
+    
+    반환값: 다시 저장했으면 새 파일 경로, 이미 설정과 같으면 None
+    """
+    storage_format = storage_format or SNAPSHOT_FORMAT
+    storage_mode = resolve_mode(storage_mode)
+    
+    is_refs = is_ref_snapshot(filepath)
+    same_format = is_refs == (storage_format != 'full')
+    same_suffix = snapshot_path_for(filepath, storage_mode) == filepath
+    # pretty와 compact는 끝부분이 같아서 들여쓰기가 있는지로 구분해요
+    if same_suffix and storage_mode in ('pretty', 'compact'):
+        same_suffix = (read_head(filepath, 2) == '{\n') == (storage_mode == 'pretty')
+    if same_format and same_suffix:
+        return None
+    
+    snapshot = read_snapshot_document(filepath)
+    objects_folder = objects_folder_for(filepath)
+    if is_refs and storage_format == 'full':
+        snapshot.pop(STORAGE_KEY, None)
+        snapshot['data'] = [resolve_record(reference, objects_folder) for reference in snapshot.get('data') or []]
+    
+    stat = os.stat(filepath)
+    new_path = write_snapshot(filepath, snapshot, storage_format, storage_mode)
+    os.utime(new_path, (stat.st_atime, stat.st_mtime))
+    return new_path
+
+def referenced_objects(data_folder='data'):
+    """모든 참조 방식 스냅샷이 쓰는 객체 지문을 모아요"""
+    refs = set()
+    for filepath in list_snapshots(data_folder):
+        if not is_ref_snapshot(filepath):
+            continue
+        snapshot = read_snapshot_document(filepath)
+        for reference in snapshot.get('data') or []:
+            if isinstance(reference, dict) and REF_KEY in reference:
+                refs.add(reference[REF_KEY])
+    return refs
+
+def collect_garbage(data_folder='data'):
+    """
+    어떤 스냅샷도 쓰지 않는 객체를 지우는 함수
+    오래된 스냅샷을 지운 뒤에 부르면 더 이상 필요 없는 객체가 정리돼요
+    
+    반환값: 지운 객체 수
+    """
+    objects_folder = os.path.join(data_folder, OBJECTS_DIRNAME)
+    if not os.path.isdir(objects_folder):
+        return 0
+    
+    in_use = referenced_objects(data_folder)
+    removed = 0
+    for prefix in os.listdir(objects_folder):
+        prefix_folder = os.path.join(objects_folder, prefix)
+        if not os.path.isdir(prefix_folder):
+            continue
+        for filename in os.listdir(prefix_folder):
+            ref = filename[:-len('.json')]
+            if filename.endswith('.json') and ref not in in_use:
+                os.remove(os.path.join(prefix_folder, filename))
+                _object_cache.pop((objects_folder, ref), None)
+                removed += 1
+        if not os.listdir(prefix_folder):
+            os.rmdir(prefix_folder)
+    return removed
+
+def storage_stats(data_folder='data'):
+    """
+    스냅샷과 객체가 차지하는 공간을 알려주는 함수
+    
+    반환값: {'full_files', 'full_bytes', 'ref_files', 'ref_bytes', 'objects', 'object_bytes'}
+    """
+    stats = {'full_files': 0, 'full_bytes': 0, 'ref_files': 0, 'ref_bytes': 0, 'objects': 0, 'object_bytes': 0}
+    for filepath in list_snapshots(data_folder):
+        kind = 'ref' if is_ref_snapshot(filepath) else 'full'
+        stats[f'{kind}_files'] += 1
+        stats[f'{kind}_bytes'] += os.path.getsize(filepath)
+    
+    objects_folder = os.path.join(data_folder, OBJECTS_DIRNAME)
+    if os.path.isdir(objects_folder):
+        for root, _, filenames in os.walk(objects_folder):
+            for filename in filenames:
+                stats['objects'] += 1
+                stats['object_bytes'] += os.path.getsize(os.path.join(root, filename))
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='중복 없는 스냅샷 저장소 관리 도구')
+    parser.add_argument('command', choices=['stats', 'migrate', 'gc'], help='실행할 작업')
+    parser.add_argument('--data-folder', default='data', help='스냅샷 폴더')
+    parser.add_argument('--format', choices=['refs', 'full'], default=None, help='migrate: 참조 방식 또는 전체 저장')
+    parser.add_argument('--mode', choices=['pretty', 'compact', 'gzip', 'zstd'], default=None,
+                        help='migrate: 파일 모양 (없으면 AUCTION_STORAGE_MODE 설정)')
+    args = parser.parse_args()
+    
+    if args.command == 'migrate':
+        migrated = 0
+        for snapshot_path in list_snapshots(args.data_folder):
+            if migrate_snapshot(snapshot_path, args.format, args.mode):
+                migrated += 1
+        print(f"📦 {migrated}개의 스냅샷을 새 저장 방식으로 바꿨습니다")
+    elif args.command == 'gc':
+        print(f"🧹 쓰지 않는 객체 {collect_garbage(args.data_folder)}개를 지웠습니다")
+    
+    result = storage_stats(args.data_folder)
+    total = result['full_bytes'] + result['ref_bytes'] + result['object_bytes']
+    print(f"📊 전체 저장 스냅샷: {result['full_files']}개 ({result['full_bytes'] / 1024 / 1024:.1f}MB)")
+    print(f"📊 참조 방식 스냅샷: {result['ref_files']}개 ({result['ref_bytes'] / 1024 / 1024:.1f}MB)")
+    print(f"📊 객체: {result['objects']}개 ({result['object_bytes'] / 1024 / 1024:.1f}MB)")
+    print(f"📊 합계: {total / 1024 / 1024:.1f}MB")
@@ -0,0 +1,272 @@
+# 트렌드 분석의 "하루치 계산 결과"를 저장해두고 다시 쓰는 도구예요
+# 지나간 날짜의 스냅샷은 바뀌지 않으니, 하루치 매물 수/평균 가격/가격 스케치/종류별 수/지역별 평균을
+# 스냅샷 내용의 지문(checksum)을 이름으로 .cache 폴더에 적어두고, 다음번에는 새 날짜만 계산해요
+# 그래서 트렌드 기간을 30일에서 90일, 365일로 늘려도 거의 느려지지 않아요
+# 마치 매일 쓴 가계부 합계를 페이지 아래에 적어두고, 한 달 합계는 그 숫자만 더하는 것과 같아요!
+#
+# 사용법:
+#   python trend_rollup.py --days 365        # 365일 트렌드를 계산하고 캐시 현황 보기
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+import json_codec
+from columnar_history import ensure_day, first_seen_counts, read_day
+from snapshot_catalog import CATALOG_PATH, snapshots_since
+from price_sketch import QuantileSketch, rollup_percentiles, sketch_of
+from snapshot_files import split_archive_path
+
+# 하루치 계산 결과를 보관할 폴더예요
+TREND_CACHE_FOLDER = os.getenv('AUCTION_TREND_CACHE_DIR', os.path.join('.cache', 'trend_days'))
+
+# 하루치 계산 방식이 바뀌면 올려주세요 (예전 결과는 다시 계산해요)
+TREND_CACHE_VERSION = 2
+
+# 하루치 계산에 필요한 열이에요
+TREND_COLUMNS = ('minprice', 'region', 'maemulinfo')
+
+# 저장해둔 결과가 없는 날짜를 동시에 계산할 프로세스 수예요 (0이면 CPU 수만큼)
+HISTORY_WORKERS = int(os.getenv('AUCTION_HISTORY_WORKERS', '0'))
+
+# 새로 계산할 날짜가 이보다 적으면 프로세스를 띄우지 않고 순서대로 계산해요
+PARALLEL_HISTORY_MIN_FILES = 4
+
+def day_aggregate(columns):
+    """
+    하루치 열 데이터로 트렌드 계산 결과를 만드는 함수
+    
+    매개변수 설명:
+    - columns: {'minprice', 'region', 'maemulinfo': NumPy 배열} (열 저장소에서 읽은 하루치)
+    
+    반환값: {'count', 'avg_price', 'property_types': {종류: 수},
+             'regions': [[지역, 평균 가격, 수, {'p10', 'p50', 'p90'}], ...],
+             'price_sketch': 그날 가격의 백분위수 스케치(to_dict)}
+    """
+    prices = columns['minprice']
+    aggregate = {
+        'count': int(len(prices)), 'avg_price': 0, 'property_types': {}, 'regions': [],
+        'price_sketch': QuantileSketch().to_dict()
+    }
+    if len(prices) == 0:
+        return aggregate
+    
+    # 일별 평균 가격과 백분위수 스케치 (매물 순서대로 넣어요)
+    positive = prices > 0
+    positive_prices = prices[positive]
+    aggregate['avg_price'] = int(positive_prices.sum()) // len(positive_prices) if len(positive_prices) else 0
+    aggregate['price_sketch'] = sketch_of(positive_prices).to_dict()
+    
+    # 일별 매물 종류 분포 (빈 값은 '알 수 없음'으로 세요)
+    maemulinfos = np.where(columns['maemulinfo'] == '', '알 수 없음', columns['maemulinfo'])
+    aggregate['property_types'] = dict(first_seen_counts(maemulinfos))
+    
+    # 지역별 가격 (그날 처음 나온 지역 순서대로)
+    regions = np.where(columns['region'] == '', '알 수 없음', columns['region'])[positive]
+    if len(regions) == 0:
+        return aggregate
+    uniques, first_index, inverse = np.unique(regions, return_index=True, return_inverse=True)
+    sums = np.zeros(len(uniques), dtype=np.int64)
+    np.add.at(sums, inverse, positive_prices)
+    counts = np.bincount(inverse, minlength=len(uniques))
+    
+    # 지역별 가격을 매물 순서 그대로 묶어서 백분위수를 구해요
+    order = np.argsort(inverse, kind='stable')
+    region_prices = np.split(positive_prices[order], np.cumsum(counts)[:-1])
+    
+    for index in np.argsort(first_index, kind='stable'):
+        count = int(counts[index])
+        aggregate['regions'].append([
+            uniques[index].item(), int(sums[index]) // count, count, sketch_of(region_prices[index]).percentiles()
+        ])
+    return aggregate
+
+def merge_day_aggregates(days):
+    """
+    하루치 계산 결과들을 합쳐서 대시보드의 트렌드 분석(trend_analysis) 결과를 만드는 함수
+    
+    매개변수 설명:
+    - days: [(날짜, day_aggregate 결과), ...] (날짜순)
+    """
+    if not days:
+        return {}
+    
+    trend_data = {
+        'dates': [],
+        'daily_counts': [],
+        'daily_avg_prices': [],
+        'daily_price_percentiles': [],
+        'daily_property_types': [],
+        'price_trend_by_region': {}
+    }
+    
+    day_sketches = []
+    for date, aggregate in days:
+        if not aggregate['count']:
+            continue
+        
+        trend_data['dates'].append(date)
+        trend_data['daily_counts'].append(aggregate['count'])
+        trend_data['daily_avg_prices'].append(aggregate['avg_price'])
+        sketch = QuantileSketch.from_dict(aggregate['price_sketch'])
+        trend_data['daily_price_percentiles'].append(sketch.percentiles())
+        day_sketches.append((date, sketch))
+        trend_data['daily_property_types'].append(dict(aggregate['property_types']))
+        
+        for region, avg_price, count, percentiles in aggregate['regions']:
+            trend_data['price_trend_by_region'].setdefault(region, []).append({
+                'date': date,
+                'avg_price': avg_price,
+                'count': count,
+                **percentiles
+            })
+    
+    # 하루치 스케치를 합쳐서 주별, 기간 전체 백분위수를 구해요 (매물을 다시 읽지 않아요)
+    trend_data['weekly_price_percentiles'], trend_data['price_percentiles'] = rollup_percentiles(day_sketches)
+    return trend_data
+
+def _cache_path(checksum):
+    return os.path.join(TREND_CACHE_FOLDER, checksum[:2], f"{checksum}.json")
+
+def load_day_aggregate(checksum):
+    """저장해둔 하루치 계산 결과를 읽어요 (없거나 계산 방식이 다르면 None)"""
+    try:
+        with open(_cache_path(checksum), 'rb') as file:
+            entry = json_codec.loads(file.read())
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != TREND_CACHE_VERSION:
+        return None
+    return entry.get('aggregate')
+
+def store_day_aggregate(checksum, aggregate):
+    """하루치 계산 결과를 저장해요 (실패해도 계산 결과는 그대로 써요)"""
+    path = _cache_path(checksum)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 먼저 쓰고 바꿔치기해서, 쓰는 도중에 읽혀도 깨지지 않게 해요
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(json_codec.dumps_bytes({'version': TREND_CACHE_VERSION, 'aggregate': aggregate}))
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️ 트렌드 캐시 저장 실패: {e}")
+
+def compute_day_aggregate(date_str, snapshot_path, data_folder='data'):
+    """열 저장소(없으면 스냅샷에서 만들어요)에서 하루치를 읽어 계산해요"""
+    ensure_day(date_str, snapshot_path, data_folder)
+    return day_aggregate(read_day(date_str, TREND_COLUMNS, data_folder))
+
+def _compute_day_task(task):
+    """
+    하루치를 계산하는 함수 (일꾼 프로세스에서도 실행돼요)
+    
+    매개변수 설명:
+    - task: (날짜, 스냅샷 경로, 데이터 폴더)
+    
+    반환값: (날짜, 하루치 계산 결과 또는 None, 오류 메시지 또는 None)
+    """
+    date_str, snapshot_path, data_folder = task
+    try:
+        return date_str, compute_day_aggregate(date_str, snapshot_path, data_folder), None
+    except Exception as e:
+        return date_str, None, str(e)
+
+def _history_workers(workers, task_count):
+    # 날짜가 적으면 프로세스를 띄우는 시간이 더 들어서 한 프로세스에서 계산해요
+    if workers is None:
+        workers = HISTORY_WORKERS or os.cpu_count() or 1
+    if task_count < PARALLEL_HISTORY_MIN_FILES:
+        return 1
+    return max(1, min(workers, task_count))
+
+def compute_day_aggregates(tasks, workers=None):
+    """
+    저장해둔 결과가 없는 날짜들을 계산하는 함수
+    스냅샷을 처음 읽는 일(JSON 읽기, 열 저장소 만들기)은 CPU를 많이 써서 여러 프로세스가 나눠서 해요
+    
+    매개변수 설명:
+    - tasks: [(날짜, 스냅샷 경로, 데이터 폴더), ...]
+    - workers: 동시에 계산할 프로세스 수 (None이면 AUCTION_HISTORY_WORKERS 또는 CPU 수, 1이면 순서대로)
+    
+    반환값: [(날짜, 하루치 계산 결과 또는 None, 오류 메시지 또는 None), ...] (넘겨준 순서대로)
+    """
+    worker_count = _history_workers(workers, len(tasks))
+    if worker_count > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                # map은 끝난 순서와 상관없이 넘겨준 순서(날짜순)대로 결과를 돌려줘요
+                return list(executor.map(_compute_day_task, tasks))
+        except (OSError, BrokenProcessPool) as e:
+            # 프로세스를 띄울 수 없는 환경이면 한 프로세스에서 계산해요
+            print(f"⚠️ 여러 프로세스로 계산할 수 없어서 순서대로 계산합니다: {e}")
+    return [_compute_day_task(task) for task in tasks]
+
+def load_day_aggregates(days=30, data_folder='data', catalog_path=CATALOG_PATH, stats=None, workers=None):
+    """
+    과거 N일간의 하루치 계산 결과를 날짜순으로 모으는 함수
+    스냅샷 목록표의 지문(checksum)으로 저장해둔 결과를 찾고, 없는 날짜만 새로 계산해요
+    
+    매개변수 설명:
+    - days: 며칠 전까지 볼지
+    - stats: 사전을 주면 {'cached': 다시 쓴 날짜 수, 'computed': 새로 계산한 날짜 수}를 채워줘요
+    - workers: 새로 계산할 날짜를 동시에 계산할 프로세스 수 (compute_day_aggregates 참고)
+    
+    반환값: [(날짜, 하루치 계산 결과), ...]
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('cached', 0)
+    stats.setdefault('computed', 0)
+    
+    # 같은 날짜가 data 폴더와 보관함에 둘 다 있으면 data 폴더의 것을 써요
+    by_date = {}
+    for date_str, path, checksum in snapshots_since(days, 'daily', data_folder, catalog_path, with_checksum=True):
+        if date_str not in by_date or split_archive_path(path)[1] is None:
+            by_date[date_str] = (path, checksum)
+    
+    aggregates = {}
+    missing = []
+    for date_str in sorted(by_date):
+        path, checksum = by_date[date_str]
+        aggregate = load_day_aggregate(checksum)
+        if aggregate is None:
+            missing.append((date_str, path, data_folder))
+        else:
+            stats['cached'] += 1
+            aggregates[date_str] = aggregate
+    
+    for date_str, aggregate, error in compute_day_aggregates(missing, workers):
+        if error is not None:
+            print(f"⚠️ {date_str} 트렌드 계산 중 오류: {error}")
+            continue
+        store_day_aggregate(by_date[date_str][1], aggregate)
+        stats['computed'] += 1
+        aggregates[date_str] = aggregate
+    return sorted(aggregates.items())
+
+def cached_trend_analysis(days=30, data_folder='data', catalog_path=CATALOG_PATH):
+    """
+    과거 N일간의 트렌드 분석 결과를 만드는 함수 (대시보드의 trend_analysis)
+    지난 날짜는 저장해둔 하루치 결과를 합치기만 해요
+    """
+    stats = {}
+    trend_data = merge_day_aggregates(load_day_aggregates(days, data_folder, catalog_path, stats))
+    if stats['computed'] or stats['cached']:
+        print(f"📈 트렌드: 저장해둔 {stats['cached']}일 + 새로 계산한 {stats['computed']}일")
+    return trend_data
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='하루치 트렌드 결과를 저장해두고 합쳐서 트렌드를 계산합니다')
+    parser.add_argument('--days', type=int, default=30, help='며칠 전까지 볼지')
+    parser.add_argument('--data-folder', default='data', help='스냅샷 폴더')
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    result = cached_trend_analysis(args.days, args.data_folder)
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ {len(result.get('dates', []))}일 트렌드 계산: {elapsed:.3f}초")
@@ -2,9 +2,7 @@
 # JSON 파일을 읽어서 auction_data.js 파일로 만들어주고, 경매알리미 링크도 추가해줘요
 # 이제 최신 데이터를 자동으로 찾아서 업데이트해줘요!
 
-import json
 import os
-import glob
 from datetime import datetime
 import firebase_admin
 from firebase_admin import credentials, db
@@ -20,6 +18,10 @@ except Exception as e:
 
 # 새로운 데이터를 가져오기 위해 크롤러도 사용해요
 from auction_crawler import get_combined_auction_data, save_to_json
+from json_stream import load_snapshot
+import json_codec
+from snapshot_catalog import latest_snapshot
+from snapshot_files import snapshot_mtime
 
 # Firebase 초기화
 def initialize_firebase():
@@ -94,21 +96,18 @@ def save_to_firebase(data):
 def find_latest_json_file():
     """
     data 폴더에서 가장 최신의 JSON 파일을 찾는 함수
-    여러 개의 파일 중에서 가장 최근에 만들어진 파일을 골라줘요
+    여러 개의 파일 중에서 가장 최근에 수집된 파일을 골라줘요
     """
     
-    # data 폴더의 모든 JSON 파일을 찾아요
-    json_files = glob.glob('data/*.json')
+    # 스냅샷 목록표에서 가장 최근에 수집된 파일을 한 번에 찾아요
+    latest_file = latest_snapshot()
     
-    if not json_files:
+    if not latest_file:
         print("❌ data 폴더에 JSON 파일이 없어요!")
         return None
     
-    # 파일들을 수정 시간 순으로 정렬해서 가장 최신 파일을 찾아요
-    latest_file = max(json_files, key=os.path.getmtime)
-    
     # 파일의 수정 시간을 확인해요
-    file_time = os.path.getmtime(latest_file)
+    file_time = snapshot_mtime(latest_file)
     file_date = datetime.fromtimestamp(file_time).strftime('%Y-%m-%d %H:%M:%S')
     
     print(f"📋 가장 최신 파일: {latest_file}")
@@ -175,8 +174,7 @@ def load_data_with_fallback():
     
     if latest_file:
         try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_snapshot(latest_file)
             print(f"✅ 파일에서 데이터를 성공적으로 읽었어요!")
             return data
         except Exception as e:
@@ -224,7 +222,7 @@ js_content = f"""// 🏠 부동산 경매 데이터를 담고 있는 JavaScript
 // 마지막 업데이트: {current_time}
 
 // 경매 데이터를 전역 변수로 내보내요 (마치 도서관에서 책을 빌려주는 것처럼요!)
-window.auctionData = {json.dumps(data, ensure_ascii=False, indent=4)};
+window.auctionData = {json_codec.dumps(data, indent=4)};
 
 // 데이터 로딩 완료를 알려주는 이벤트를 발생시켜요
 // 마치 "데이터 준비 완료!"라고 외치는 것 같아요